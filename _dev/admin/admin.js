@@ -12,6 +12,7 @@ document.addEventListener('DOMContentLoaded', () => {
 function initializeEventListeners() {
     // Load images button
     document.getElementById('load-images-btn').addEventListener('click', loadImages);
+    document.getElementById('upload-images-btn').addEventListener('click', uploadImages);
     
     // Form inputs - update preview on change
     const formInputs = document.querySelectorAll('#project-form input, #project-form textarea');
@@ -63,6 +64,31 @@ async function loadImages() {
     }
 }
 
+async function uploadImages() {
+    const input = document.getElementById('image-upload');
+    const files = [...input.files];
+    
+    if (files.length === 0) {
+        showMessage('Please choose images to upload', 'error');
+        return;
+    }
+    
+    try {
+        const uploaded = await uploadFiles(files, (sent, total, file) => {
+            showMessage(`Uploading ${file.name}... ${Math.round(sent / total * 100)}%`, 'info');
+        });
+        
+        // Uploaded files are added after the current images
+        loadedImages = [...loadedImages, ...uploaded];
+        input.value = '';
+        await renderImages();
+        updatePreview();
+        showMessage(`Uploaded ${uploaded.length} images`, 'success');
+    } catch (error) {
+        showMessage(error.message, 'error');
+    }
+}
+
 async function renderImages() {
     const container = document.getElementById('images-container');
     
@@ -165,6 +191,14 @@ function handleDragEnd(e) {
 }
 
 function updatePreview() {
+    // Rendered by the server from the same templates as the saved page
+    if (requestLivePreview(collectPreviewState(loadedImages), renderLocalPreview)) {
+        return;
+    }
+    renderLocalPreview();
+}
+
+function renderLocalPreview() {
     const name = document.getElementById('name').value || 'Project Name';
     const year = document.getElementById('year').value || '2024';
     const collaborator = document.getElementById('collaborator').value || 'Collaborator';
@@ -339,12 +373,17 @@ async function handleSubmit(e) {
             throw new Error(data.error || 'Failed to create project');
         }
         
+        // Files are written by a background job on the server
+        const job = await waitForJob(data, state => {
+            const counter = state.total ? ` (${state.done}/${state.total})` : '';
+            showMessage(`${state.message}${counter}`, 'info');
+        });
+        
         showMessage('Project created successfully! Redirecting...', 'success');
         
-        // Redirect after a longer delay to ensure files are written
         setTimeout(() => {
-            window.location.href = data.url;
-        }, 2500);
+            window.location.href = job.result.url;
+        }, 1000);
         
     } catch (error) {
         showMessage(error.message, 'error');
@@ -17,6 +17,7 @@ function initializeEventListeners() {
     
     // Load new images button
     document.getElementById('load-images-btn').addEventListener('click', loadNewImages);
+    document.getElementById('upload-images-btn').addEventListener('click', uploadImages);
     
     // Form inputs - update preview on change
     const formInputs = document.querySelectorAll('#project-form input, #project-form textarea');
@@ -35,6 +36,9 @@ function initializeEventListeners() {
         hideMessage();
     });
     
+    // Publish button (shown while a saved image order is pending)
+    document.getElementById('publish-btn').addEventListener('click', handlePublish);
+    
     // Delete button
     document.getElementById('delete-btn').addEventListener('click', handleDelete);
 }
@@ -95,6 +99,7 @@ async function handleProjectSelect(e) {
         
         // Enable form
         enableForm();
+        document.getElementById('publish-btn').style.display = data.pending_order ? 'block' : 'none';
         updatePreview();
         hideMessage();
         
@@ -104,6 +109,31 @@ async function handleProjectSelect(e) {
     }
 }
 
+async function uploadImages() {
+    const input = document.getElementById('image-upload');
+    const files = [...input.files];
+    
+    if (files.length === 0) {
+        showMessage('Please choose images to upload', 'error');
+        return;
+    }
+    
+    try {
+        const uploaded = await uploadFiles(files, (sent, total, file) => {
+            showMessage(`Uploading ${file.name}... ${Math.round(sent / total * 100)}%`, 'info');
+        });
+        
+        // Uploaded files are added after the current images
+        loadedImages = [...loadedImages, ...uploaded];
+        input.value = '';
+        await renderExistingImages();
+        updatePreview();
+        showMessage(`Uploaded ${uploaded.length} images`, 'success');
+    } catch (error) {
+        showMessage(error.message, 'error');
+    }
+}
+
 async function renderExistingImages() {
     const container = document.getElementById('images-container');
     
@@ -239,6 +269,14 @@ function handleDragEnd(e) {
 }
 
 function updatePreview() {
+    // Rendered by the server from the same templates as the saved page
+    if (requestLivePreview(collectPreviewState(loadedImages), renderLocalPreview)) {
+        return;
+    }
+    renderLocalPreview();
+}
+
+function renderLocalPreview() {
     const name = document.getElementById('name').value || 'Project Name';
     const year = document.getElementById('year').value || '2024';
     const collaborator = document.getElementById('collaborator').value || 'Collaborator';
@@ -414,12 +452,17 @@ async function handleSubmit(e) {
             throw new Error(data.error || 'Failed to update project');
         }
         
+        // Files are written by a background job on the server
+        const job = await waitForJob(data, state => {
+            const counter = state.total ? ` (${state.done}/${state.total})` : '';
+            showMessage(`${state.message}${counter}`, 'info');
+        });
+        
         showMessage('Project updated successfully! Redirecting...', 'success');
         
-        // Redirect after a longer delay to ensure files are written
         setTimeout(() => {
-            window.location.href = data.url;
-        }, 2500);
+            window.location.href = job.result.url;
+        }, 1000);
         
     } catch (error) {
         showMessage(error.message, 'error');
@@ -429,6 +472,40 @@ async function handleSubmit(e) {
     }
 }
 
+async function handlePublish() {
+    const publishBtn = document.getElementById('publish-btn');
+    const btnText = publishBtn.querySelector('.btn-text');
+    const btnLoading = publishBtn.querySelector('.btn-loading');
+    
+    // Disable button and show loading
+    publishBtn.disabled = true;
+    btnText.style.display = 'none';
+    btnLoading.style.display = 'inline-flex';
+    
+    try {
+        const response = await fetch(`/api/publish-project/${currentSlug}`, {
+            method: 'POST'
+        });
+        
+        const data = await response.json();
+        
+        if (!response.ok) {
+            throw new Error(data.error || 'Failed to publish image order');
+        }
+        
+        // The image files were renamed, so reload them
+        await handleProjectSelect({ target: { value: currentSlug } });
+        showMessage(`Image order published (${Object.keys(data.renamed).length} images renamed)`, 'success');
+        
+    } catch (error) {
+        showMessage(error.message, 'error');
+    } finally {
+        publishBtn.disabled = false;
+        btnText.style.display = 'inline';
+        btnLoading.style.display = 'none';
+    }
+}
+
 async function handleDelete(e) {
     const projectName = document.getElementById('name').value;
     const year = document.getElementById('year').value;
@@ -498,6 +575,7 @@ function disableForm() {
     const deleteBtn = document.getElementById('delete-btn');
     deleteBtn.disabled = true;
     deleteBtn.style.display = 'none';
+    document.getElementById('publish-btn').style.display = 'none';
     
     // Reset preview
     document.getElementById('preview-name').textContent = 'Select a project';
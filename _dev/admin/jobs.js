@@ -0,0 +1,54 @@
+// Follow a background job started by the admin API until it finishes.
+// Uses Server-Sent Events and falls back to polling if the stream fails.
+
+const JOB_POLL_INTERVAL = 500;
+
+function waitForJob(accepted, onProgress) {
+    return new Promise((resolve, reject) => {
+        const settle = state => {
+            if (onProgress) {
+                onProgress(state);
+            }
+            if (state.status === 'done') {
+                resolve(state);
+                return true;
+            }
+            if (state.status === 'error') {
+                reject(new Error(state.error || 'Job failed'));
+                return true;
+            }
+            return false;
+        };
+
+        const poll = async () => {
+            try {
+                const response = await fetch(accepted.status_url, { cache: 'no-store' });
+                const state = await response.json();
+                if (!response.ok) {
+                    throw new Error(state.error || 'Failed to read job status');
+                }
+                if (!settle(state)) {
+                    setTimeout(poll, JOB_POLL_INTERVAL);
+                }
+            } catch (error) {
+                reject(error);
+            }
+        };
+
+        if (!window.EventSource) {
+            poll();
+            return;
+        }
+
+        const source = new EventSource(accepted.events_url);
+        source.onmessage = event => {
+            if (settle(JSON.parse(event.data))) {
+                source.close();
+            }
+        };
+        source.onerror = () => {
+            source.close();
+            poll();
+        };
+    });
+}
@@ -0,0 +1,145 @@
+// Live preview rendered by the admin server from the unsaved form.
+// Form state is posted as the user types; only the page sections that
+// changed come back, pushed over Server-Sent Events. If the server preview
+// fails, the page falls back to its own client-side preview.
+
+const PREVIEW_DEBOUNCE = 80;
+
+const livePreview = {
+    sessionId: Math.random().toString(36).slice(2) + Date.now().toString(36),
+    enabled: true,
+    streaming: false,
+    source: null,
+    timer: null,
+    pending: null,
+    fallback: null,
+    initialMarkup: null
+};
+
+// Form state in the shape the preview endpoint expects
+function collectPreviewState(images) {
+    return {
+        name: document.getElementById('name').value,
+        year: document.getElementById('year').value,
+        collaborator: document.getElementById('collaborator').value,
+        official_site: document.getElementById('official_site').value,
+        role: document.getElementById('role').value,
+        description: document.getElementById('description').value,
+        acknowledgment: document.getElementById('acknowledgment').value,
+        images: images.map(img => ({ path: img.path }))
+    };
+}
+
+// Queue a server render; returns false if the caller should render locally
+function requestLivePreview(state, fallback) {
+    if (!livePreview.enabled) {
+        return false;
+    }
+    if (livePreview.initialMarkup === null) {
+        livePreview.initialMarkup = document.getElementById('preview-container').innerHTML;
+    }
+
+    livePreview.fallback = fallback;
+    livePreview.pending = state;
+    connectPreviewEvents();
+
+    clearTimeout(livePreview.timer);
+    livePreview.timer = setTimeout(sendPreviewState, PREVIEW_DEBOUNCE);
+    return true;
+}
+
+async function sendPreviewState() {
+    const state = livePreview.pending;
+    livePreview.pending = null;
+    if (!state) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/preview/${livePreview.sessionId}`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ ...state, inline: !livePreview.streaming })
+        });
+        const data = await response.json();
+
+        if (!response.ok) {
+            throw new Error(data.error || 'Preview failed');
+        }
+        if (data.sections) {
+            applyPreviewSections(data.sections);
+        }
+    } catch (error) {
+        disableLivePreview();
+    }
+}
+
+function connectPreviewEvents() {
+    if (livePreview.source || !window.EventSource) {
+        return;
+    }
+
+    const source = new EventSource(`/api/preview/${livePreview.sessionId}/events`);
+    source.onopen = () => {
+        livePreview.streaming = true;
+    };
+    source.onmessage = event => {
+        applyPreviewSections(JSON.parse(event.data).sections);
+    };
+    source.onerror = () => {
+        // EventSource reconnects by itself; meanwhile renders come back inline
+        livePreview.streaming = false;
+    };
+    livePreview.source = source;
+}
+
+// Free the server's session (and the thread its event stream holds)
+window.addEventListener('pagehide', () => {
+    if (livePreview.source) {
+        livePreview.source.close();
+        livePreview.source = null;
+    }
+    if (navigator.sendBeacon) {
+        navigator.sendBeacon(`/api/preview/${livePreview.sessionId}/close`);
+    }
+});
+
+function applyPreviewSections(sections) {
+    if (!livePreview.enabled) {
+        return;
+    }
+
+    if ('title' in sections) {
+        document.getElementById('preview-name').textContent = sections.title;
+        document.getElementById('preview-title').textContent = sections.title;
+    }
+    if ('properties' in sections) {
+        document.getElementById('preview-properties').innerHTML = sections.properties;
+    }
+    if ('description' in sections) {
+        document.getElementById('preview-description').innerHTML =
+            sections.description || '<p>Description will appear here...</p>';
+    }
+    if ('images' in sections) {
+        document.getElementById('preview-images').innerHTML = sections.images;
+    }
+    if ('acknowledgment' in sections) {
+        document.getElementById('preview-acknowledgment').innerHTML = sections.acknowledgment;
+    }
+}
+
+function disableLivePreview() {
+    livePreview.enabled = false;
+    clearTimeout(livePreview.timer);
+    if (livePreview.source) {
+        livePreview.source.close();
+    }
+
+    // Put back the markup the client-side preview expects
+    document.getElementById('preview-container').innerHTML = livePreview.initialMarkup;
+    if (livePreview.fallback) {
+        livePreview.fallback();
+    }
+}
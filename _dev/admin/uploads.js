@@ -0,0 +1,98 @@
+// Resumable chunked uploads to the admin server.
+// The upload ID is remembered per file (name, size, modified time), so
+// choosing the same file again after an interruption resumes the transfer.
+
+const UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024;
+const UPLOAD_RETRIES = 3;
+
+async function uploadFile(file, onProgress) {
+    const resumeKey = `upload:${file.name}:${file.size}:${file.lastModified}`;
+    let state = null;
+
+    const savedId = localStorage.getItem(resumeKey);
+    if (savedId) {
+        const response = await fetch(`/api/uploads/${savedId}`);
+        if (response.ok) {
+            state = await response.json();
+        }
+    }
+
+    if (!state) {
+        const response = await fetch('/api/uploads', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ name: file.name, size: file.size })
+        });
+        state = await response.json();
+        if (!response.ok) {
+            throw new Error(state.error || `Failed to upload ${file.name}`);
+        }
+        localStorage.setItem(resumeKey, state.id);
+    }
+
+    let failures = 0;
+    while (state.status !== 'complete') {
+        if (onProgress) {
+            onProgress(state.offset, file.size);
+        }
+
+        const chunk = file.slice(state.offset, state.offset + UPLOAD_CHUNK_SIZE);
+        try {
+            const response = await fetch(`/api/uploads/${state.id}`, {
+                method: 'PATCH',
+                headers: {
+                    'Content-Type': 'application/octet-stream',
+                    'Upload-Offset': String(state.offset)
+                },
+                body: chunk
+            });
+            const data = await response.json();
+
+            if (response.status === 409) {
+                // Server has a different amount; continue from there
+                state.offset = data.offset;
+                continue;
+            }
+            if (!response.ok) {
+                throw new Error(data.error || `Failed to upload ${file.name}`);
+            }
+            state = data;
+            failures = 0;
+        } catch (error) {
+            failures++;
+            if (failures > UPLOAD_RETRIES) {
+                throw error;
+            }
+            await new Promise(resolve => setTimeout(resolve, 1000 * failures));
+            const response = await fetch(`/api/uploads/${state.id}`);
+            if (response.ok) {
+                state = await response.json();
+            }
+        }
+    }
+
+    localStorage.removeItem(resumeKey);
+    if (onProgress) {
+        onProgress(file.size, file.size);
+    }
+    return { name: file.name, path: state.path };
+}
+
+// Upload several files one after another; returns entries for loadedImages
+async function uploadFiles(files, onProgress) {
+    const uploaded = [];
+    const totalBytes = files.reduce((sum, file) => sum + file.size, 0);
+    let doneBytes = 0;
+
+    for (const file of files) {
+        uploaded.push(await uploadFile(file, sent => {
+            if (onProgress) {
+                onProgress(doneBytes + sent, totalBytes, file);
+            }
+        }));
+        doneBytes += file.size;
+    }
+    return uploaded;
+}
@@ -0,0 +1,775 @@
+#!/usr/bin/env python3
+"""
+Admin application for creating, editing and deleting projects
+
+One Flask app behind both admin UIs (/admin and /admin/edit). It keeps a
+single in-memory copy of projects-data.json for all request threads and is
+served by waitress with several worker threads. Creating and updating
+projects run as background jobs (admin_jobs.py); the API returns a job ID
+straight away. The live preview renders unsaved form state in memory
+(admin_preview.py), and images can be uploaded in resumable chunks
+(admin_uploads.py). Project images are links into the shared media store
+(media_store.py), and saved pages get their critical CSS inlined
+(critical_css.py). PIL, markdown, bs4 and markdownify are only imported when a
+request first needs them.
+
+Started by admin-server.py / admin-edit-server.py.
+"""
+
+import base64
+import json
+import mimetypes
+import os
+import re
+import threading
+from urllib.parse import quote
+
+from flask import Flask, Response, abort, request, jsonify, send_file, send_from_directory
+from werkzeug.utils import safe_join
+
+from admin_jobs import JobQueue
+from admin_preview import PreviewHub
+from admin_uploads import OffsetMismatch, UploadStore
+from covers import find_cover, write_cover
+from image_meta import ImageMetaCache
+from image_order import (ORDER_JSON, clear_image_order, image_order, list_numbered_images,
+                         publish_image_order, set_image_order)
+from listing import PROJECTS_JSON, load_projects, save_projects, year_key
+from media_store import linked_blob, release_project, remove_unreferenced, store_file
+from outputs import Outputs
+from precompress import precompressed_variant
+from project_pages import generate_html, parse_project_html
+from slugs import SLUG_INDEX_JSON, SlugIndex, slugify
+
+# Get project root
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+admin_dir = os.path.join(script_dir, 'admin')
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+MIME_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp'
+}
+# Preview event streams: seconds between keep-alives, and how many idle
+# keep-alives in a row end the stream
+PREVIEW_KEEPALIVE = 15
+PREVIEW_MAX_IDLE = 8
+
+app = Flask(__name__)
+
+
+def natural_sort_key(name):
+    """Sort file names naturally (handling numbers in filenames)"""
+    return [int(text) if text.isdigit() else text.lower()
+            for text in re.split('([0-9]+)', name)]
+
+
+def listing_entry(data, slug, cover):
+    """projects-data.json entry for a project saved from the admin form"""
+    return {
+        'name': f"{data['name']}, {data['year']}",
+        'year': str(data['year']),
+        'collaborator': data['collaborator'],
+        'link': data.get('official_site', ''),
+        'role': data['role'],
+        'slug': slug,
+        'image': f'projects/{slug}/images/{cover or "cover.jpg"}',
+        'hasDetailPage': True
+    }
+
+
+class ProjectStore:
+    """In-memory projects-data.json and parsed pages, shared by all request threads
+
+    The listing is reloaded only when the file changes on disk (e.g. after a
+    generator ran). Handlers that modify projects hold `lock` for the whole
+    read-modify-write so concurrent requests can't interleave file changes.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._projects = None
+        self._mtime = None
+        self._pages = {}  # slug -> (mtime, parsed page content)
+        self._slugs = None
+        self._slugs_mtime = None
+        self._image_meta = None
+
+    def projects(self):
+        """Current listing (a copy callers may modify)"""
+        with self.lock:
+            mtime = os.path.getmtime(PROJECTS_JSON)
+            if self._projects is None or mtime != self._mtime:
+                self._projects = load_projects()
+                self._mtime = mtime
+            return list(self._projects)
+
+    def get(self, slug):
+        return next((p for p in self.projects() if p['slug'] == slug), None)
+
+    def save(self, projects):
+        """Write the listing (and its derived artifacts)"""
+        with self.lock:
+            save_projects(projects)
+            self._projects = list(projects)
+            self._mtime = os.path.getmtime(PROJECTS_JSON)
+
+    def slugs(self):
+        """The persisted slug index, reloaded when saving the listing rewrote it"""
+        with self.lock:
+            mtime = os.path.getmtime(SLUG_INDEX_JSON) if os.path.exists(SLUG_INDEX_JSON) else None
+            if self._slugs is None or mtime != self._slugs_mtime:
+                self._slugs = SlugIndex.load() if mtime else SlugIndex.from_projects(self.projects())
+                self._slugs_mtime = mtime
+            return self._slugs
+
+    def image_meta(self, project_dir, images):
+        """{file name: metadata} of a project's images (image_meta.py), decoding only new ones"""
+        with self.lock:
+            if self._image_meta is None:
+                self._image_meta = ImageMetaCache.load()
+            cache = self._image_meta
+        meta = cache.for_images(os.path.join(project_dir, 'images'), images)
+        with self.lock:
+            cache.save()
+        return meta
+
+    def page_content(self, slug):
+        """Parsed projects/<slug>/index.html, re-parsed only when the file changed"""
+        html_path = os.path.join('projects', slug, 'index.html')
+        mtime = os.path.getmtime(html_path)
+        cached = self._pages.get(slug)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        content = parse_project_html(html_path)
+        self._pages[slug] = (mtime, content)
+        return content
+
+
+store = ProjectStore()
+jobs = JobQueue()
+previews = PreviewHub()
+uploads = UploadStore(IMAGE_EXTENSIONS)
+
+
+@app.route('/')
+@app.route('/admin')
+def admin_interface():
+    """Serve admin interface for adding projects"""
+    return send_from_directory(admin_dir, 'index.html')
+
+
+@app.route('/admin/edit')
+def admin_edit_interface():
+    """Serve admin edit interface"""
+    return send_from_directory(admin_dir, 'edit.html')
+
+
+@app.route('/admin/<path:filename>')
+def admin_static(filename):
+    """Serve admin static files"""
+    return send_from_directory(admin_dir, filename)
+
+
+def send_site_file(directory, filename):
+    """Like send_from_directory, but sends a precompressed sibling the client accepts"""
+    path = safe_join(directory, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    variant, encoding = precompressed_variant(path, request.headers.get('Accept-Encoding'))
+    response = send_file(variant, mimetype=mimetypes.guess_type(path)[0], conditional=True)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+@app.route('/styles.css')
+def serve_styles():
+    """Serve main styles.css for preview"""
+    return send_site_file(project_root, 'styles.css')
+
+
+@app.route('/index.html')
+def serve_main_site():
+    """Serve main site for back link"""
+    return send_site_file(project_root, 'index.html')
+
+
+@app.route('/projects/<slug>/')
+@app.route('/projects/<slug>/index.html')
+def serve_project(slug):
+    """Serve project detail pages"""
+    project_dir = os.path.join(project_root, 'projects', slug)
+    return send_site_file(project_dir, 'index.html')
+
+
+@app.route('/projects/<slug>/images/<filename>')
+def serve_project_image(slug, filename):
+    """Serve project images"""
+    images_dir = os.path.join(project_root, 'projects', slug, 'images')
+    return send_from_directory(images_dir, filename)
+
+
+@app.route('/api/serve-local-image', methods=['POST'])
+def serve_local_image():
+    """Serve a local image for preview (base64 encoded)"""
+    try:
+        data = request.json
+        image_path = data.get('path')
+
+        if not image_path or not os.path.exists(image_path):
+            return jsonify({'error': 'Image not found'}), 404
+
+        # Read image and convert to base64
+        with open(image_path, 'rb') as f:
+            image_data = base64.b64encode(f.read()).decode('utf-8')
+
+        ext = os.path.splitext(image_path)[1].lower()
+        mime_type = MIME_TYPES.get(ext, 'image/jpeg')
+
+        return jsonify({
+            'data': f'data:{mime_type};base64,{image_data}'
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/browse-images', methods=['POST'])
+def browse_images():
+    """List images in specified folder"""
+    try:
+        data = request.json
+        path = data.get('path', '')
+
+        if not path or not os.path.exists(path):
+            return jsonify({'error': 'Folder not found'}), 404
+
+        image_files = []
+        for file in os.listdir(path):
+            if file.lower().endswith(IMAGE_EXTENSIONS):
+                full_path = os.path.join(path, file)
+                if os.path.isfile(full_path):
+                    image_files.append({
+                        'name': file,
+                        'path': full_path
+                    })
+
+        image_files.sort(key=lambda item: natural_sort_key(item['name']))
+
+        return jsonify({'images': image_files})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/uploads', methods=['POST'])
+def create_upload():
+    """Start a resumable upload; chunks follow via PATCH /api/uploads/<id>"""
+    try:
+        data = request.json
+        return jsonify(uploads.create(data.get('name', ''), data.get('size'))), 201
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/uploads/<upload_id>', methods=['GET'])
+def upload_status(upload_id):
+    """How much of an upload has arrived (to resume from)"""
+    try:
+        return jsonify(uploads.status(upload_id))
+    except LookupError as e:
+        return jsonify({'error': str(e)}), 404
+
+
+@app.route('/api/uploads/<upload_id>', methods=['PATCH'])
+def upload_chunk(upload_id):
+    """Append the request body at the Upload-Offset header"""
+    try:
+        offset = int(request.headers.get('Upload-Offset', ''))
+        return jsonify(uploads.write_chunk(upload_id, offset, request.stream, request.content_length))
+    except LookupError as e:
+        return jsonify({'error': str(e)}), 404
+    except OffsetMismatch as e:
+        return jsonify({'error': str(e), 'offset': e.offset}), 409
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/list-projects', methods=['GET'])
+def list_projects():
+    """Get list of all projects"""
+    try:
+        # Filter out CV entry and return list
+        project_list = [
+            {
+                'slug': p['slug'],
+                'name': p['name'],
+                'year': p['year'],
+                'collaborator': p.get('collaborator', '')
+            }
+            for p in store.projects()
+            if not p.get('isCV', False)
+        ]
+
+        # Sort alphabetically by name
+        project_list.sort(key=lambda x: x['name'].lower())
+
+        return jsonify({'projects': project_list})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/load-project/<slug>', methods=['GET'])
+def load_project(slug):
+    """Load project data for editing"""
+    try:
+        project = store.get(slug)
+        if not project:
+            return jsonify({'error': 'Project not found'}), 404
+
+        html_path = os.path.join('projects', slug, 'index.html')
+        if not os.path.exists(html_path):
+            return jsonify({'error': 'Project HTML not found'}), 404
+
+        content = store.page_content(slug)
+
+        project_dir = os.path.join('projects', slug)
+        images_dir = os.path.join(project_dir, 'images')
+        names = image_order(project_dir)
+        # width, height, orientation and color, from the metadata cache
+        meta = store.image_meta(project_dir, names)
+        images = [
+            {'name': img_file, 'path': os.path.join(images_dir, img_file), **meta.get(img_file, {})}
+            for img_file in names
+        ]
+
+        return jsonify({
+            'slug': slug,
+            'name': project['name'],
+            'year': project['year'],
+            'collaborator': project.get('collaborator', ''),
+            'official_site': project.get('link', ''),
+            'role': project.get('role', ''),
+            'description': content.get('description', ''),
+            'acknowledgment': content.get('acknowledgment', ''),
+            'images': images,
+            # Reordered images not yet renamed (publish_project)
+            'pending_order': os.path.exists(os.path.join(project_dir, ORDER_JSON))
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+def copy_numbered_images(job, image_paths, images_dir):
+    """Link images into the project as 01_image.ext, 02_image.ext, ... (via the media store)"""
+    numbered_images = []
+    for idx, src_path in enumerate(image_paths, start=1):
+        job.progress(done=idx - 1, message=f'Copying image {idx} of {len(image_paths)}')
+        ext = os.path.splitext(src_path)[1]
+        dest_name = f"{idx:02d}_image{ext}"
+        store_file(src_path, os.path.join(images_dir, dest_name))
+        numbered_images.append(dest_name)
+    return numbered_images
+
+
+def finish_project(job, data, slug, numbered_images, regenerate_cover, replace_slugs=()):
+    """Cover, page and listing steps shared by create and update jobs"""
+    project_dir = os.path.join('projects', slug)
+    images_dir = os.path.join(project_dir, 'images')
+    steps_done = job.total - 2
+
+    if regenerate_cover and numbered_images:
+        job.progress(done=steps_done, message='Generating cover')
+        # Stored through Outputs: links are replaced, never written through
+        write_cover(os.path.join(images_dir, numbered_images[0]), images_dir, Outputs())
+
+    job.progress(done=steps_done + 1, message='Writing page')
+    page_path = os.path.join(project_dir, 'index.html')
+    Outputs().write_text(page_path, generate_html(data, numbered_images,
+                                                  store.image_meta(project_dir, numbered_images)))
+
+    entry = listing_entry(data, slug, find_cover(images_dir))
+    # Only the listing update needs the lock; request threads keep serving meanwhile
+    with store.lock:
+        if replace_slugs:
+            # Replace old project
+            projects = [entry if p['slug'] in replace_slugs else p for p in store.projects()]
+        else:
+            # Add to the listing, newest first
+            projects = store.projects()
+            projects.insert(0, entry)
+        projects.sort(key=year_key, reverse=True)
+        store.save(projects)
+
+    job.progress(done=job.total, message='Saved')
+    return {'slug': slug, 'url': f'/projects/{slug}/'}
+
+
+def create_project_job(job, data, slug):
+    """Copy images, generate the cover and page, and add the project to the listing"""
+    image_paths = [img['path'] for img in data.get('images', [])]
+    job.progress(done=0, total=len(image_paths) + 2)
+
+    images_dir = os.path.join('projects', slug, 'images')
+    with store.lock:
+        # Another job may have taken the slug since the request was accepted;
+        # creating the folder claims it
+        if slug_taken(slug):
+            raise ValueError('A project with this name/year already exists')
+        os.makedirs(images_dir, exist_ok=True)
+
+    # Jobs run one at a time (JobQueue), so the copies and cover need no lock
+    numbered_images = copy_numbered_images(job, image_paths, images_dir)
+    return finish_project(job, data, slug, numbered_images, regenerate_cover=True)
+
+
+def update_project_job(job, data, old_slug, new_slug):
+    """Rename, re-copy or reorder images, then rewrite the page and listing entry"""
+    image_paths = [img['path'] for img in data.get('images') or []]
+    job.progress(done=0, total=len(image_paths) + 2)
+
+    old_project_dir = os.path.join('projects', old_slug)
+    new_project_dir = os.path.join('projects', new_slug)
+    slug = old_slug
+
+    # If slug changed, rename directory (under the lock, like the create check)
+    if old_slug != new_slug and os.path.exists(old_project_dir):
+        with store.lock:
+            if os.path.exists(new_project_dir):
+                raise ValueError('A project with this name/year already exists')
+            job.progress(message='Renaming project folder')
+            os.rename(old_project_dir, new_project_dir)
+        slug = new_slug
+
+    # Jobs run one at a time (JobQueue), so the copies and cover need no lock
+    project_dir = os.path.join('projects', slug)
+    images_dir = os.path.join(project_dir, 'images')
+
+    if image_paths:
+        os.makedirs(images_dir, exist_ok=True)
+        old_blobs = [linked_blob(os.path.join(images_dir, f)) for f in os.listdir(images_dir)]
+        previous_order = image_order(project_dir)
+
+        # Paths sent by the form still point at the old folder after a rename
+        old_images_dir = os.path.join('projects', old_slug, 'images')
+        image_paths = [
+            os.path.join(images_dir, os.path.relpath(path, old_images_dir))
+            if path.startswith(old_images_dir) else path
+            for path in image_paths
+        ]
+
+        # Check if we're reordering existing images or loading new ones
+        if all(path.startswith(images_dir) for path in image_paths):
+            # Reordering existing images - record the order, rename on publish
+            job.progress(message='Saving image order')
+            numbered_images = [os.path.basename(path) for path in image_paths if os.path.exists(path)]
+            for f in list_numbered_images(images_dir):
+                if f not in numbered_images:
+                    os.remove(os.path.join(images_dir, f))
+            set_image_order(project_dir, numbered_images)
+        else:
+            # Loading new images - move any kept project images out of the way,
+            # clear old numbered images and copy everything in the new order
+            staged_paths = []
+            for path in image_paths:
+                if path.startswith(images_dir) and os.path.exists(path):
+                    temp_path = os.path.join(images_dir, f"temp_{os.path.basename(path)}")
+                    os.rename(path, temp_path)
+                    path = temp_path
+                staged_paths.append(path)
+
+            for f in list_numbered_images(images_dir):
+                os.remove(os.path.join(images_dir, f))
+            numbered_images = copy_numbered_images(job, staged_paths, images_dir)
+
+            for path in staged_paths:
+                if os.path.basename(path).startswith('temp_') and path.startswith(images_dir):
+                    os.remove(path)
+            clear_image_order(project_dir)
+
+        # The cover only depends on the first image
+        regenerate_cover = (
+            image_paths[0] != os.path.join(images_dir, previous_order[0] if previous_order else '')
+            or find_cover(images_dir) is None
+        )
+    else:
+        # Use existing images
+        numbered_images = image_order(project_dir)
+        old_blobs = []
+        regenerate_cover = False
+
+    result = finish_project(job, data, slug, numbered_images, regenerate_cover,
+                            replace_slugs=(old_slug, slug))
+
+    # Free stored images this project dropped, unless another project uses them
+    remove_unreferenced([blob for blob in old_blobs if blob])
+    return result
+
+
+def project_full_name(data):
+    return f"{data['name']}, {data['year']}"
+
+
+def slug_taken(slug):
+    """Whether a listed project or a project folder already uses slug"""
+    return store.slugs().owner(slug) is not None or os.path.exists(os.path.join('projects', slug))
+
+
+def missing_required_field(data):
+    """Name of the first empty required form field, or None"""
+    for field in ['name', 'year', 'collaborator', 'role']:
+        if not data.get(field):
+            return field
+    return None
+
+
+def job_accepted(job, slug):
+    """202 response pointing the client at the job status endpoints"""
+    return jsonify({
+        'success': True,
+        'job': job.id,
+        'slug': slug,
+        'url': f'/projects/{slug}/',
+        'status_url': f'/api/jobs/{job.id}',
+        'events_url': f'/api/jobs/{job.id}/events'
+    }), 202
+
+
+@app.route('/api/create-project', methods=['POST'])
+def create_project():
+    """Queue creation of a new project; returns a job ID straight away"""
+    try:
+        data = request.json
+
+        field = missing_required_field(data)
+        if field:
+            return jsonify({'error': f'Missing required field: {field}'}), 400
+
+        slug = slugify(project_full_name(data))
+        if not slug:
+            return jsonify({'error': 'The name has no letters or digits to make a URL from'}), 400
+        if slug_taken(slug):
+            return jsonify({'error': 'A project with this name/year already exists'}), 400
+
+        job = jobs.submit('create', create_project_job, data, slug, slug=slug)
+        return job_accepted(job, slug)
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/update-project/<slug>', methods=['POST'])
+def update_project(slug):
+    """Queue an update of an existing project; returns a job ID straight away"""
+    try:
+        data = request.json
+
+        field = missing_required_field(data)
+        if field:
+            return jsonify({'error': f'Missing required field: {field}'}), 400
+
+        # Same name and year: keep the published slug, even if slugify() differs
+        full_name = project_full_name(data)
+        new_slug = slug if store.slugs().owner(slug) == full_name else slugify(full_name)
+        if not new_slug:
+            return jsonify({'error': 'The name has no letters or digits to make a URL from'}), 400
+        # Report an obvious name clash now rather than through the job
+        if new_slug != slug and slug_taken(new_slug):
+            return jsonify({'error': 'A project with this name/year already exists'}), 400
+
+        job = jobs.submit('update', update_project_job, data, slug, new_slug, slug=new_slug)
+        return job_accepted(job, new_slug)
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Current state of a background job (for polling)"""
+    job = jobs.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict())
+
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """Stream job progress as Server-Sent Events until it finishes"""
+    job = jobs.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+
+    def stream():
+        version = None
+        while True:
+            state = job.to_dict()
+            yield f"data: {json.dumps(state)}\n\n"
+            if job.finished:
+                return
+            new_version = job.wait_for_change(version, timeout=15)
+            if new_version == version:
+                # Keep idle connections open through proxies
+                yield ': keep-alive\n\n'
+            version = new_version
+
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+def preview_image_url(path):
+    """URL the preview pane can load a form image from"""
+    if path.startswith('projects' + os.sep) and os.path.exists(path):
+        return '/' + path.replace(os.sep, '/')
+    return f'/api/local-image?path={quote(path)}'
+
+
+@app.route('/api/local-image', methods=['GET'])
+def local_image():
+    """Serve a local image file by path (for the live preview)"""
+    image_path = request.args.get('path', '')
+    if not image_path.lower().endswith(IMAGE_EXTENSIONS) or not os.path.isfile(image_path):
+        return jsonify({'error': 'Image not found'}), 404
+    return send_file(os.path.abspath(image_path))
+
+
+@app.route('/api/preview/<session_id>', methods=['POST'])
+def update_preview(session_id):
+    """Render the sections of unsaved form state that changed since the last call"""
+    try:
+        data = request.json
+        form = {
+            'name': data.get('name') or 'Project Name',
+            'year': data.get('year') or '2024',
+            'collaborator': data.get('collaborator') or 'Collaborator',
+            'official_site': data.get('official_site', ''),
+            'role': data.get('role', ''),
+            'description': data.get('description', ''),
+            'acknowledgment': data.get('acknowledgment', ''),
+            'images': [preview_image_url(img['path']) for img in data.get('images') or []]
+        }
+
+        session = previews.session(session_id)
+        changed = session.update(form)
+
+        result = {'version': session.version, 'changed': sorted(changed)}
+        # Clients without an open event stream get the HTML in the response
+        if data.get('inline'):
+            result['sections'] = changed
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/preview/<session_id>/events', methods=['GET'])
+def preview_events(session_id):
+    """Push changed preview sections as Server-Sent Events"""
+    session = previews.session(session_id)
+
+    def stream():
+        # Each open stream holds a server thread: end it when the session is
+        # closed or evicted, or after a while without changes (EventSource
+        # reconnects by itself if the tab is still there)
+        version = None
+        idle = 0
+        while not session.closed and idle < PREVIEW_MAX_IDLE:
+            new_version, sections = session.changes_since(version, timeout=PREVIEW_KEEPALIVE)
+            if session.closed:
+                break
+            if sections:
+                idle = 0
+                yield f"data: {json.dumps({'version': new_version, 'sections': sections})}\n\n"
+            else:
+                # Keep idle connections open through proxies
+                idle += 1
+                yield ': keep-alive\n\n'
+            version = new_version
+
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+@app.route('/api/preview/<session_id>/close', methods=['POST'])
+def close_preview(session_id):
+    """Release a preview session when its admin tab is closed"""
+    previews.close(session_id)
+    return '', 204
+
+
+@app.route('/api/publish-project/<slug>', methods=['POST'])
+def publish_project(slug):
+    """Rename a project's images to match its saved order"""
+    try:
+        with store.lock:
+            project_dir = os.path.join('projects', slug)
+            if not os.path.exists(project_dir):
+                return jsonify({'error': 'Project not found'}), 404
+            renames = publish_image_order(project_dir)
+
+        return jsonify({'success': True, 'renamed': renames})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/delete-project/<slug>', methods=['DELETE'])
+def delete_project(slug):
+    """Delete a project"""
+    try:
+        with store.lock:
+            project_dir = os.path.join('projects', slug)
+
+            if not os.path.exists(project_dir):
+                return jsonify({'error': 'Project not found'}), 404
+
+            # Remove project directory and the stored images only it used
+            freed = release_project(project_dir)
+            print(f"Deleted project folder: {project_dir} ({len(freed)} stored images freed)")
+
+            store.save([p for p in store.projects() if p['slug'] != slug])
+            print(f"Removed {slug} from projects-data.json")
+
+        return jsonify({
+            'success': True,
+            'message': f'Project "{slug}" deleted successfully'
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+def run(open_path='/admin', port=5000, threads=8, open_browser=True):
+    """Serve the admin app until Ctrl+C"""
+    os.chdir(project_root)
+    url = f'http://localhost:{port}{open_path}'
+
+    print("=" * 60)
+    print("🎨 Project Admin Interface")
+    print("=" * 60)
+    print(f"\nStarting server at {url}")
+    print(f"  Add projects:  http://localhost:{port}/admin")
+    print(f"  Edit projects: http://localhost:{port}/admin/edit")
+    print("\nPress Ctrl+C to stop the server\n")
+
+    if open_browser:
+        import webbrowser
+
+        # Open browser after a short delay
+        threading.Timer(1.5, webbrowser.open, args=[url]).start()
+
+    try:
+        from waitress import serve
+    except ImportError:
+        print("⚠️  waitress not installed (pip install waitress), using Flask's threaded server")
+        app.run(port=port, threaded=True, use_reloader=False)
+        return
+
+    serve(app, host='127.0.0.1', port=port, threads=threads)
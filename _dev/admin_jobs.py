@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Background job queue for slow admin operations
+
+Copying images, generating covers and rewriting pages run on a worker
+thread instead of inside the HTTP request. Each job records its progress so
+the admin UI can poll GET /api/jobs/<id> or follow /api/jobs/<id>/events
+(Server-Sent Events).
+"""
+
+import itertools
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Finished jobs kept around for late status requests
+MAX_FINISHED_JOBS = 50
+
+
+class Job:
+    """One queued operation and its progress"""
+
+    def __init__(self, job_id, kind, details):
+        self.id = job_id
+        self.kind = kind
+        self.details = details
+        self.status = 'queued'
+        self.done = 0
+        self.total = 0
+        self.message = 'Waiting to start...'
+        self.result = None
+        self.error = None
+        self.updated = time.time()
+        self._changed = threading.Condition()
+        self._version = 0
+
+    @property
+    def finished(self):
+        return self.status in ('done', 'error')
+
+    def progress(self, done=None, total=None, message=None):
+        """Report progress from inside the job function"""
+        with self._changed:
+            if done is not None:
+                self.done = done
+            if total is not None:
+                self.total = total
+            if message is not None:
+                self.message = message
+            self._touch()
+
+    def _finish(self, status, result=None, error=None, message=None):
+        with self._changed:
+            self.status = status
+            self.result = result
+            self.error = error
+            if message is not None:
+                self.message = message
+            self._touch()
+
+    def _touch(self):
+        self.updated = time.time()
+        self._version += 1
+        self._changed.notify_all()
+
+    def wait_for_change(self, version, timeout):
+        """Block until the job changes after `version`; returns the new version"""
+        with self._changed:
+            self._changed.wait_for(lambda: self._version != version, timeout=timeout)
+            return self._version
+
+    def to_dict(self):
+        with self._changed:
+            return {
+                'id': self.id,
+                'kind': self.kind,
+                'status': self.status,
+                'done': self.done,
+                'total': self.total,
+                'message': self.message,
+                'result': self.result,
+                'error': self.error,
+                **self.details
+            }
+
+
+class JobQueue:
+    """Runs jobs one at a time, in submission order, on a background thread
+
+    One worker is enough: jobs write into the project tree and listing, which
+    the admin app serialises anyway.
+    """
+
+    def __init__(self, workers=1):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='admin-job')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def submit(self, kind, fn, *args, **details):
+        """Queue fn(job, *args); extra keyword arguments are echoed in the job status"""
+        job = Job(f'{kind}-{next(self._ids)}', kind, details)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self._executor.submit(self._run, job, fn, args)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job, fn, args):
+        with job._changed:
+            job.status = 'running'
+            job.message = 'Starting...'
+            job._touch()
+        try:
+            result = fn(job, *args)
+        except Exception as e:
+            traceback.print_exc()
+            job._finish('error', error=str(e), message='Failed')
+        else:
+            job._finish('done', result=result, message='Done')
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Live preview of unsaved admin form state
+
+The admin pages post the form to /api/preview/<session> as the user types.
+Each page section is rendered in memory with the same functions as the saved
+page (project_pages.py), but only when the form fields it depends on have
+changed, so a keystroke in the description never re-renders the gallery.
+Changed sections are pushed to /api/preview/<session>/events (Server-Sent
+Events) and swapped into the preview pane. Nothing is written to disk.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from project_pages import (render_acknowledgment, render_description, render_images,
+                           render_properties)
+
+# Preview sessions kept in memory (one per open admin tab)
+MAX_SESSIONS = 20
+
+# section -> form fields it is rendered from ('images' is the image URL list)
+SECTION_FIELDS = {
+    'title': ('name', 'year'),
+    'properties': ('collaborator', 'year', 'official_site', 'role'),
+    'description': ('description',),
+    'images': ('name', 'year', 'images'),
+    'acknowledgment': ('collaborator', 'acknowledgment'),
+}
+
+
+def render_section(section, data):
+    """HTML for one preview section"""
+    if section == 'title':
+        return f"{data['name']}, {data['year']}"
+    if section == 'properties':
+        return render_properties(data)
+    if section == 'description':
+        return render_description(data)
+    if section == 'images':
+        return render_images(data, data['images'], image_base='')
+    return render_acknowledgment(data)
+
+
+class PreviewSession:
+    """Last rendered sections for one admin tab"""
+
+    def __init__(self):
+        self.version = 0
+        self.last_used = time.time()
+        self._inputs = {}    # section -> field values it was rendered from
+        self._sections = {}  # section -> (version it changed in, html)
+        self._changed = threading.Condition()
+        self.closed = False
+
+    def update(self, data):
+        """Re-render sections whose inputs changed; returns {section: html} of real changes"""
+        self.last_used = time.time()
+        changed = {}
+        with self._changed:
+            for section, fields in SECTION_FIELDS.items():
+                inputs = tuple(repr(data.get(field)) for field in fields)
+                if self._inputs.get(section) == inputs:
+                    continue
+                self._inputs[section] = inputs
+
+                html = render_section(section, data)
+                if section in self._sections and self._sections[section][1] == html:
+                    continue
+                changed[section] = html
+
+            if changed:
+                self.version += 1
+                for section, html in changed.items():
+                    self._sections[section] = (self.version, html)
+                self._changed.notify_all()
+        return changed
+
+    def close(self):
+        """Wake and end the session's event streams (evicted, or the tab went away)"""
+        with self._changed:
+            self.closed = True
+            self._changed.notify_all()
+
+    def changes_since(self, version, timeout):
+        """Wait up to `timeout` for sections newer than `version`; returns (version, {section: html})"""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version or self.closed, timeout=timeout)
+            sections = {
+                section: html
+                for section, (changed_in, html) in self._sections.items()
+                if version is None or changed_in > version
+            }
+            return self.version, sections
+
+
+class PreviewHub:
+    """Preview sessions by client-chosen ID, oldest dropped first"""
+
+    def __init__(self):
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def session(self, session_id):
+        with self._lock:
+            session = self._sessions.pop(session_id, None) or PreviewSession()
+            self._sessions[session_id] = session
+            while len(self._sessions) > MAX_SESSIONS:
+                _evicted_id, evicted = self._sessions.popitem(last=False)
+                evicted.close()
+            return session
+
+    def close(self, session_id):
+        """Drop a session and end its event streams"""
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session:
+            session.close()
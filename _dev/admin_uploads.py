@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Resumable, chunked uploads for the admin app
+
+Lets the admin UI add media from another machine instead of a local folder
+path. An upload is created with its name and size, then sent as chunks, each
+stating the offset it starts at, so an interrupted transfer resumes where it
+stopped (also across server restarts). Chunks are streamed straight to disk
+and hashed as they arrive. A finished file is stored once per content hash
+under _dev/uploads/complete/; its path goes into the form's image list, so
+create/update number it and build the cover like any other image.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+
+UPLOADS_DIR = os.path.join('_dev', 'uploads')
+
+# Read size when streaming a chunk to disk
+BLOCK_SIZE = 1 << 20
+
+
+class OffsetMismatch(ValueError):
+    """A chunk didn't start where the stored upload ends"""
+
+    def __init__(self, offset):
+        super().__init__(f'Upload is at offset {offset}')
+        self.offset = offset
+
+
+class UploadStore:
+    """Partial uploads in <root>/partial, finished files in <root>/complete"""
+
+    def __init__(self, extensions, root=UPLOADS_DIR):
+        self.extensions = extensions
+        self.partial_dir = os.path.join(root, 'partial')
+        self.complete_dir = os.path.join(root, 'complete')
+        self._lock = threading.Lock()
+        self._upload_locks = {}
+        self._hashers = {}  # upload id -> (offset hashed up to, sha256 object)
+
+    def create(self, name, size):
+        """Start an upload; returns its state"""
+        ext = os.path.splitext(name)[1].lower()
+        if ext not in self.extensions:
+            raise ValueError(f'Unsupported file type: {ext or name}')
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError('Upload size must be a positive number of bytes')
+
+        os.makedirs(self.partial_dir, exist_ok=True)
+        meta = {
+            'id': uuid.uuid4().hex,
+            'name': os.path.basename(name),
+            'ext': ext,
+            'size': size,
+            'status': 'partial'
+        }
+        open(self._part_path(meta['id']), 'wb').close()
+        self._write_meta(meta)
+        return self._state(meta)
+
+    def status(self, upload_id):
+        """Current state of an upload (raises LookupError if unknown)"""
+        return self._state(self._read_meta(upload_id))
+
+    def write_chunk(self, upload_id, offset, stream, length):
+        """Append `length` bytes from `stream` at `offset`; returns the new state"""
+        with self._upload_lock(upload_id):
+            meta = self._read_meta(upload_id)
+            if meta['status'] == 'complete':
+                return self._state(meta)
+
+            part_path = self._part_path(upload_id)
+            current = os.path.getsize(part_path)
+            if offset != current:
+                raise OffsetMismatch(current)
+            if length is None or length < 0 or current + length > meta['size']:
+                raise ValueError('Chunk length missing or past the end of the upload')
+
+            hasher = self._hasher(upload_id, part_path, current)
+            written = 0
+            with open(part_path, 'ab') as f:
+                while written < length:
+                    block = stream.read(min(BLOCK_SIZE, length - written))
+                    if not block:
+                        break
+                    f.write(block)
+                    hasher.update(block)
+                    written += len(block)
+            self._hashers[upload_id] = (current + written, hasher)
+
+            if current + written == meta['size']:
+                self._complete(meta, hasher.hexdigest())
+            return self._state(meta)
+
+    def _hasher(self, upload_id, part_path, offset):
+        """Hash of the bytes received so far, re-read from disk after a restart"""
+        hashed_to, hasher = self._hashers.get(upload_id, (None, None))
+        if hashed_to == offset:
+            return hasher
+
+        hasher = hashlib.sha256()
+        with open(part_path, 'rb') as f:
+            for block in iter(lambda: f.read(BLOCK_SIZE), b''):
+                hasher.update(block)
+        return hasher
+
+    def _complete(self, meta, digest):
+        """Move the finished file into the hash-named store (dropping duplicates)"""
+        os.makedirs(self.complete_dir, exist_ok=True)
+        dest = os.path.join(self.complete_dir, f"{digest}{meta['ext']}")
+        part_path = self._part_path(meta['id'])
+
+        with self._lock:
+            if os.path.exists(dest):
+                os.remove(part_path)
+                meta['deduplicated'] = True
+            else:
+                os.replace(part_path, dest)
+
+        meta.update(status='complete', sha256=digest, path=dest)
+        self._write_meta(meta)
+        self._hashers.pop(meta['id'], None)
+
+    def _state(self, meta):
+        state = dict(meta)
+        if meta['status'] == 'complete':
+            state['offset'] = meta['size']
+        else:
+            state['offset'] = os.path.getsize(self._part_path(meta['id']))
+        return state
+
+    def _upload_lock(self, upload_id):
+        with self._lock:
+            return self._upload_locks.setdefault(upload_id, threading.Lock())
+
+    def _part_path(self, upload_id):
+        return os.path.join(self.partial_dir, f'{upload_id}.part')
+
+    def _meta_path(self, upload_id):
+        if not upload_id.isalnum():
+            raise LookupError('Upload not found')
+        return os.path.join(self.partial_dir, f'{upload_id}.json')
+
+    def _read_meta(self, upload_id):
+        try:
+            with open(self._meta_path(upload_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise LookupError('Upload not found')
+
+    def _write_meta(self, meta):
+        with open(self._meta_path(meta['id']), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
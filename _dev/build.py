@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Build the whole site in one process
+
+The generators are stages of a small DAG. Each stage declares the artifacts
+it reads and writes; a stage runs after every earlier stage that writes one
+of its inputs or outputs, and stages with nothing between them run
+concurrently (the derived files and the legacy stubs, for instance).
+
+    listing       Notion CSV                -> projects-data.json
+    pages         listing + Notion export   -> projects/<slug>/index.html with its critical CSS
+                                               inlined (critical_css.py), images, covers (covers.py)
+    videos        pages + Notion export     -> project videos, <video> elements
+    legacy-pages  listing + pages           -> projects/<slug>.html redirect stubs (only when named)
+    derived       listing + pages           -> index.html, search-index.json,
+                                               facet-index.json, sw.js, slug index
+    compress      all of the above          -> .gz/.br siblings (precompress.py)
+    weights       pages + page-budgets.json -> page-weight report; fails over a budget (page_weight.py)
+
+The listing is loaded once and shared by every stage, and all writes go
+through one Outputs object, so --dry-run/--diff cover the whole build and
+end with a single summary. Stages that need the Notion export are skipped
+when it isn't there; the stages after them use the checked-in files.
+
+Usage:
+    python3 _dev/build.py                      # every default stage
+    python3 _dev/build.py pages legacy-pages   # only these stages
+    python3 _dev/build.py --list               # stages, their artifacts and order
+    python3 _dev/build.py --dry-run --diff
+    python3 _dev/build.py --watch              # then rebuild projects as they change (watch.py)
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import page_weight
+import precompress
+from listing import PROJECTS_JSON, refresh_derived, write_listing
+from outputs import Outputs, add_arguments
+
+NOTION_DIR = 'notion-page/Stephan Schulz/Projects and Artworks'
+NOTION_CSV = 'notion-page/Stephan Schulz/Projects and Artworks f8c7057cd41f4367aa5303e122fd0b46.csv'
+
+# Artifact names; patterns with <slug> stand for one file per project
+PROJECT_PAGES = 'projects/<slug>/index.html'
+PROJECT_IMAGES = 'projects/<slug>/images/'
+LEGACY_PAGES = 'projects/<slug>.html'
+DERIVED = ('index.html', 'search-index.json', 'facet-index.json', 'sw.js', '_dev/slug-index.json')
+PRECOMPRESSED = '<file>.gz, <file>.br'
+IMAGE_META = '_dev/.image-meta-cache.json'
+
+
+class BuildContext:
+    """State shared by the stages of one build"""
+
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self._projects = None
+        self._lock = threading.Lock()
+
+    @property
+    def projects(self):
+        """The listing, loaded once (as planned, in a dry run)"""
+        with self._lock:
+            if self._projects is None:
+                self._projects = json.loads(self.outputs.read_text(PROJECTS_JSON))
+            return self._projects
+
+    @projects.setter
+    def projects(self, projects):
+        with self._lock:
+            self._projects = projects
+
+
+class Stage:
+    def __init__(self, name, run, inputs=(), outputs=(), requires=None, default=True):
+        self.name = name
+        self.run = run
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.requires = requires  # source the stage can't run without
+        self.default = default    # part of a build with no stages named
+
+
+def generator(name):
+    """Import a _dev script by file name (they have dashes; bs4/PIL load only when needed)"""
+    return importlib.import_module(name)
+
+
+def run_listing(ctx):
+    projects = generator('generate-projects').read_projects(NOTION_CSV, NOTION_DIR)
+    write_listing(projects, ctx.outputs)
+    ctx.projects = projects
+    return f"{len(projects)} projects"
+
+
+def run_pages(ctx):
+    generated = generator('generate-notion-pages').generate_pages(ctx.projects, ctx.outputs)
+    # Covers set the listing's image paths
+    write_listing(ctx.projects, ctx.outputs)
+    return f"{generated} project pages"
+
+
+def run_videos(ctx):
+    succeeded, failed = generator('copy-videos').copy_videos(ctx.outputs)
+    return f"{succeeded} videos, {failed} failed"
+
+
+def run_legacy_pages(ctx):
+    generated = generator('generate-project-pages').generate_legacy_pages(ctx.projects, ctx.outputs)
+    return f"{generated} legacy redirect stubs"
+
+
+def run_compress(ctx):
+    count, _total_in, _total_out = precompress.precompress_site(ctx.outputs)
+    return f"{count} files precompressed"
+
+
+def run_weights(ctx):
+    # Measured on disk: in a dry run these are the pages as they were
+    report = page_weight.build_report(page_weight.load_budgets())
+    page_weight.print_budget_results(report)
+    if report['failures']:
+        raise RuntimeError(f"{report['failures']} page budget(s) exceeded (python3 _dev/page_weight.py)")
+    heaviest = report['pages'][0] if report['pages'] else None
+    return (f"{len(report['pages'])} pages, heaviest {heaviest['slug']} "
+            f"{page_weight.format_size(heaviest['transferred'])}, {report['warnings']} warning(s)"
+            if heaviest else "no pages")
+
+
+def run_derived(ctx):
+    refresh_derived(ctx.projects, ctx.outputs)
+    return ', '.join(DERIVED)
+
+
+STAGES = [
+    Stage('listing', run_listing,
+          inputs=[NOTION_CSV], outputs=[PROJECTS_JSON], requires=NOTION_CSV),
+    Stage('pages', run_pages,
+          inputs=[PROJECTS_JSON, NOTION_DIR, 'styles.css'], outputs=[PROJECT_PAGES, PROJECT_IMAGES, PROJECTS_JSON, IMAGE_META],
+          requires=NOTION_DIR),
+    Stage('videos', run_videos,
+          inputs=[PROJECT_PAGES, NOTION_DIR, 'styles.css'], outputs=[PROJECT_PAGES, PROJECT_IMAGES],
+          requires=NOTION_DIR),
+    Stage('legacy-pages', run_legacy_pages,
+          inputs=[PROJECTS_JSON, PROJECT_PAGES], outputs=[LEGACY_PAGES], default=False),
+    Stage('derived', run_derived,
+          inputs=[PROJECTS_JSON, PROJECT_PAGES, 'styles.css', 'script.js'], outputs=DERIVED),
+    Stage('compress', run_compress,
+          inputs=[PROJECTS_JSON, PROJECT_PAGES, LEGACY_PAGES, 'styles.css', 'script.js', *DERIVED],
+          outputs=[PRECOMPRESSED]),
+    Stage('weights', run_weights,
+          inputs=[PROJECT_PAGES, PROJECT_IMAGES, 'styles.css', page_weight.BUDGETS_JSON]),
+]
+
+
+def dependencies(stages):
+    """{stage name: names of the earlier stages it must wait for}
+
+    A stage waits for every earlier stage that writes something it reads
+    (or writes itself, so two stages never write the same file at once).
+    """
+    deps = {}
+    for i, stage in enumerate(stages):
+        touched = set(stage.inputs) | set(stage.outputs)
+        deps[stage.name] = {
+            earlier.name for earlier in stages[:i]
+            if touched & set(earlier.outputs)
+        }
+    return deps
+
+
+def select_stages(names):
+    """The named stages in declaration order (the default ones when none are named)"""
+    if not names:
+        return [stage for stage in STAGES if stage.default]
+    known = {stage.name for stage in STAGES}
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise SystemExit(f"Unknown stage(s): {', '.join(unknown)} (see --list)")
+    return [stage for stage in STAGES if stage.name in names]
+
+
+def run_build(stages, ctx, jobs=4):
+    """Run stages as soon as their dependencies finish; returns {name: status}"""
+    deps = dependencies(stages)
+    status = {}
+    pending = list(stages)
+    running = {}
+
+    def start(pool, stage):
+        if stage.requires and not os.path.exists(stage.requires):
+            status[stage.name] = 'skipped'
+            print(f"- {stage.name}: skipped ({stage.requires} not found)")
+            return
+        print(f"▶ {stage.name}")
+        running[pool.submit(timed, stage, ctx)] = stage
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for stage in list(pending):
+                waiting = deps[stage.name] - status.keys()
+                if waiting:
+                    continue
+                pending.remove(stage)
+                if any(status[dep] == 'failed' for dep in deps[stage.name]):
+                    status[stage.name] = 'failed'
+                    print(f"✗ {stage.name}: not run (a stage it depends on failed)")
+                else:
+                    start(pool, stage)
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                try:
+                    note, seconds = future.result()
+                    status[stage.name] = 'ok'
+                    print(f"✓ {stage.name}: {note} ({seconds:.1f}s)")
+                except Exception as e:
+                    status[stage.name] = 'failed'
+                    print(f"✗ {stage.name}: {e}")
+    return status
+
+
+def timed(stage, ctx):
+    started = time.perf_counter()
+    note = stage.run(ctx)
+    return note, time.perf_counter() - started
+
+
+def print_stages(stages):
+    deps = dependencies(stages)
+    for stage in stages:
+        after = ', '.join(sorted(deps[stage.name])) or '-'
+        print(f"{stage.name}  (after: {after})")
+        print(f"    in:  {', '.join(stage.inputs) or '-'}")
+        print(f"    out: {', '.join(stage.outputs) or '-'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the site: listing, pages, videos and derived files')
+    parser.add_argument('stages', nargs='*', help='stages to run (default: all but legacy-pages)')
+    parser.add_argument('--list', action='store_true', help='show the stages and exit')
+    parser.add_argument('--jobs', type=int, default=4, help='stages run at the same time')
+    parser.add_argument('--watch', action='store_true',
+                        help='after the build, rebuild affected projects when their sources change')
+    parser.add_argument('--poll', action='store_true', help='watch by polling instead of inotify')
+    parser.add_argument('--debounce', type=float, default=0.15,
+                        help='seconds of quiet before a burst of changes is rebuilt')
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    stages = select_stages(args.stages)
+    if args.list:
+        print_stages(stages)
+        return
+
+    # Get the project root directory (parent of _dev folder)
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(os.path.dirname(script_dir))
+
+    outputs = Outputs.from_args(args)
+    ctx = BuildContext(outputs)
+    status = run_build(stages, ctx, jobs=args.jobs)
+    outputs.print_summary()
+
+    if args.watch:
+        import watch
+        watch.watch(ctx, NOTION_DIR, debounce=args.debounce, polling=args.poll)
+    sys.exit(1 if 'failed' in status.values() else 0)
+
+
+if __name__ == '__main__':
+    main()
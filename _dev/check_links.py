@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Check that every image, video, stylesheet and link on the site resolves
+
+Checked references:
+- projects-data.json: each project's cover `image` (local) and `link` (external)
+- *.html and projects/*/index.html: <img>/<video>/<source>/<link>/<a> targets
+
+Local targets are checked against the tree on a thread pool. Files must exist
+and be non-empty, and media store blobs must still match their hash (see
+media_store.py). External URLs go through an async checker. The default sends
+HEAD requests (GET if HEAD is refused), and `--base-url` redirects them to a
+local stub server. `--checker module:factory` swaps in a different checker.
+
+Parsed pages, blob hashes and external results are cached in
+_dev/.link-check-cache.json. Pages are re-parsed only when they change, and
+external URLs are re-checked after `--max-age` days.
+
+Usage:
+    python3 _dev/check_links.py                      # local checks only
+    python3 _dev/check_links.py --external           # also check external URLs
+    python3 _dev/check_links.py --external --base-url http://localhost:8001
+    python3 _dev/check_links.py --report link-report.json
+
+Exits with status 1 when anything is broken.
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import unquote, urlsplit
+
+from listing import load_projects
+from media_store import content_hash, linked_blob
+
+CACHE_JSON = os.path.join('_dev', '.link-check-cache.json')
+CACHE_VERSION = 1
+REPORT_VERSION = 1
+
+# Tag -> attributes holding a reference
+REFERENCE_ATTRS = {
+    'img': ('src',),
+    'video': ('src', 'poster'),
+    'source': ('src',),
+    'link': ('href',),
+    'a': ('href',),
+}
+SKIPPED_SCHEMES = ('mailto', 'tel', 'javascript', 'data')
+
+
+class PageReferences(HTMLParser):
+    """Collect (tag, url) references from a page"""
+
+    def __init__(self):
+        super().__init__()
+        self.refs = []
+
+    def handle_starttag(self, tag, attrs):
+        for attr in REFERENCE_ATTRS.get(tag, ()):
+            value = dict(attrs).get(attr)
+            if value and value.strip():
+                self.refs.append([tag, value.strip()])
+
+
+def site_pages():
+    """HTML pages to scan: top-level pages and every project page"""
+    pages = sorted(f for f in os.listdir('.') if f.endswith('.html'))
+    if os.path.isdir('projects'):
+        for slug in sorted(os.listdir('projects')):
+            page = os.path.join('projects', slug, 'index.html')
+            if os.path.exists(page):
+                pages.append(page)
+    return pages
+
+
+def file_key(path):
+    """Cache key that changes whenever the file does"""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def page_references(page, cache):
+    """References in one page, re-parsed only when the page changed"""
+    cached = cache['pages'].get(page)
+    key = file_key(page)
+    if cached and cached['key'] == key:
+        return cached['refs']
+
+    parser = PageReferences()
+    with open(page, 'r', encoding='utf-8') as f:
+        parser.feed(f.read())
+    cache['pages'][page] = {'key': key, 'refs': parser.refs}
+    return parser.refs
+
+
+def classify(url):
+    """'external', 'local' or None (anchors, mailto: and the like)"""
+    parts = urlsplit(url)
+    if parts.scheme in ('http', 'https'):
+        return 'external'
+    if parts.scheme in SKIPPED_SCHEMES or url.startswith('//'):
+        return None
+    if parts.scheme or not parts.path:
+        return None
+    return 'local'
+
+
+def resolve_local(source, url):
+    """Tree path a local reference points at"""
+    path = unquote(urlsplit(url).path)
+    if path.startswith('/'):
+        target = path.lstrip('/')
+    else:
+        base = os.path.dirname(source) if source.endswith('.html') else ''
+        target = os.path.join(base, path)
+    target = os.path.normpath(target)
+    if path.endswith('/') or os.path.isdir(target):
+        target = os.path.join(target, 'index.html')
+    return target
+
+
+def check_local(target, cache):
+    """None if the file is fine, else the reason it is broken"""
+    if target.startswith('..'):
+        return 'outside the site'
+    if not os.path.exists(target):
+        return 'missing blob' if os.path.islink(target) else 'missing'
+    if os.path.getsize(target) == 0:
+        return 'empty file'
+
+    blob = linked_blob(target)
+    if blob:
+        # Content-addressed: the name is the hash of the bytes
+        key = file_key(blob)
+        cached = cache['blobs'].get(blob)
+        if not cached or cached['key'] != key:
+            cached = {'key': key, 'hash': content_hash(blob)}
+            cache['blobs'][blob] = cached
+        if not os.path.basename(blob).startswith(cached['hash']):
+            return 'blob content does not match its hash'
+    return None
+
+
+class UrllibChecker:
+    """Default external checker: HEAD (then GET) with urllib on worker threads
+
+    base_url sends every request to a stub server instead, keeping the
+    original path and query: https://example.com/a?b -> <base_url>/a?b
+    """
+
+    def __init__(self, concurrency=8, timeout=10, base_url=None):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.timeout = timeout
+        self.base_url = base_url.rstrip('/') if base_url else None
+
+    def request_url(self, url):
+        if not self.base_url:
+            return url
+        parts = urlsplit(url)
+        return self.base_url + (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+
+    def _fetch(self, url):
+        headers = {'User-Agent': 'stephanschulz.github.io link checker'}
+        for method in ('HEAD', 'GET'):
+            request = urllib.request.Request(self.request_url(url), method=method, headers=headers)
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    return {'status': response.status, 'ok': True}
+            except urllib.error.HTTPError as e:
+                if method == 'HEAD' and e.code in (403, 405, 501):
+                    continue
+                return {'status': e.code, 'ok': False, 'error': str(e.reason)}
+            except Exception as e:
+                return {'status': None, 'ok': False, 'error': str(e)}
+
+    async def check(self, url):
+        """{'status', 'ok'[, 'error']} for one URL"""
+        async with self.semaphore:
+            return await asyncio.to_thread(self._fetch, url)
+
+
+def load_checker(spec, **options):
+    """Checker from 'module:factory' (called with the default options)"""
+    module_name, _, factory = spec.partition(':')
+    return getattr(importlib.import_module(module_name), factory or 'Checker')(**options)
+
+
+async def check_external(urls, checker, cache, max_age):
+    """Results for each URL, reusing cached ones younger than max_age seconds
+
+    Results are cached under the URL actually requested (checker.request_url,
+    if the checker has one), so stub runs never answer for the real site.
+    """
+    cache_key = getattr(checker, 'request_url', lambda url: url)
+    now = time.time()
+    results = {}
+    pending = []
+    for url in urls:
+        cached = cache['external'].get(cache_key(url))
+        if cached and now - cached['checked'] < max_age:
+            results[url] = cached
+        else:
+            pending.append(url)
+
+    checked = await asyncio.gather(*(checker.check(url) for url in pending))
+    for url, result in zip(pending, checked):
+        results[url] = cache['external'][cache_key(url)] = {**result, 'checked': now}
+    return results
+
+
+def collect_references(cache):
+    """{(kind, target): [source, ...]} over the listing and all pages"""
+    references = {}
+
+    def add(source, url):
+        kind = classify(url)
+        if kind == 'local':
+            references.setdefault(('local', resolve_local(source, url)), []).append(source)
+        elif kind == 'external':
+            references.setdefault(('external', url.split('#')[0]), []).append(source)
+
+    for project in load_projects():
+        source = f"projects-data.json#{project['slug']}"
+        if project.get('image'):
+            add(source, project['image'])
+        if project.get('link'):
+            add(source, project['link'])
+
+    pages = site_pages()
+    with ThreadPoolExecutor() as pool:
+        for page, refs in zip(pages, pool.map(lambda p: page_references(p, cache), pages)):
+            for _tag, url in refs:
+                add(page, url)
+    return references
+
+
+def load_cache():
+    if os.path.exists(CACHE_JSON):
+        with open(CACHE_JSON, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == CACHE_VERSION:
+            return cache
+    return {'version': CACHE_VERSION, 'pages': {}, 'blobs': {}, 'external': {}}
+
+
+def save_cache(cache):
+    with open(CACHE_JSON, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, separators=(',', ':'))
+
+
+def build_report(checker=None, max_age=7 * 86400, workers=16):
+    """Run all checks; returns the report dict"""
+    cache = load_cache()
+    references = collect_references(cache)
+
+    local_targets = sorted(target for kind, target in references if kind == 'local')
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        local_results = dict(zip(local_targets, pool.map(lambda t: check_local(t, cache), local_targets)))
+
+    external_results = {}
+    if checker:
+        external_urls = sorted(target for kind, target in references if kind == 'external')
+        external_results = asyncio.run(check_external(external_urls, checker, cache, max_age))
+
+    save_cache(cache)
+
+    broken = []
+    for (kind, target), sources in sorted(references.items()):
+        if kind == 'local' and local_results[target]:
+            reason = local_results[target]
+        elif kind == 'external' and target in external_results and not external_results[target]['ok']:
+            result = external_results[target]
+            reason = f"HTTP {result['status']}" if result['status'] else result.get('error', 'failed')
+        else:
+            continue
+        broken.append({'kind': kind, 'target': target, 'reason': reason,
+                       'sources': sorted(set(sources))})
+
+    return {
+        'version': REPORT_VERSION,
+        'generated': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'summary': {
+            'local': {'checked': len(local_results),
+                      'broken': sum(1 for b in broken if b['kind'] == 'local')},
+            'external': {'checked': len(external_results),
+                         'broken': sum(1 for b in broken if b['kind'] == 'external')},
+        },
+        'broken': broken,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check local assets and links of the site')
+    parser.add_argument('--external', action='store_true', help='also check external URLs')
+    parser.add_argument('--base-url', help='send external checks to this stub server instead')
+    parser.add_argument('--checker', help='external checker as module:factory')
+    parser.add_argument('--concurrency', type=int, default=8, help='parallel external checks')
+    parser.add_argument('--max-age', type=float, default=7,
+                        help='days before a cached external result is re-checked')
+    parser.add_argument('--report', help='write the JSON report here (default: stdout)')
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(os.path.dirname(script_dir))
+
+    checker = None
+    if args.external or args.checker:
+        options = {'concurrency': args.concurrency, 'base_url': args.base_url}
+        checker = load_checker(args.checker, **options) if args.checker else UrllibChecker(**options)
+
+    report = build_report(checker, max_age=args.max_age * 86400)
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+        summary = report['summary']
+        print(f"Local: {summary['local']['checked']} checked, {summary['local']['broken']} broken")
+        if checker:
+            print(f"External: {summary['external']['checked']} checked, "
+                  f"{summary['external']['broken']} broken")
+        print(f"✓ Report written to {args.report}")
+    else:
+        print(output)
+
+    sys.exit(1 if report['broken'] else 0)
+
+
+if __name__ == '__main__':
+    main()
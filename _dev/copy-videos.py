@@ -2,18 +2,24 @@
 """
 Copy missing videos from notion-page export to project folders
 and update HTML to include video elements
+
+Safe to re-run: a video already in the project (same bytes) is reused and
+the page is only rewritten when its <video> element is missing.
 """
 
+import argparse
 import os
-import shutil
 import re
 from pathlib import Path
 from bs4 import BeautifulSoup
 
+from critical_css import inline_styles
+from media_store import content_hash
+from outputs import Outputs, add_arguments
+
 # Get project root
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)
-os.chdir(project_root)
 
 # Video mapping: notion folder → project slug
 VIDEO_MAPPING = {
@@ -67,7 +73,21 @@ def get_next_number(project_folder):
     
     return max(numbers) + 1 if numbers else 1
 
-def copy_video_and_update_html(project_name, project_data):
+def find_existing_video(images_folder, video_path):
+    """Name of a numbered video in the project with the same content, if any"""
+    if not os.path.exists(images_folder):
+        return None
+    size = os.path.getsize(video_path)
+    candidates = [
+        f for f in sorted(os.listdir(images_folder))
+        if re.match(r'^\d+_video', f) and os.path.getsize(os.path.join(images_folder, f)) == size
+    ]
+    if not candidates:
+        return None
+    digest = content_hash(video_path)
+    return next((f for f in candidates if content_hash(os.path.join(images_folder, f)) == digest), None)
+
+def copy_video_and_update_html(project_name, project_data, outputs):
     """Copy video to project folder and update HTML"""
     slug = project_data['slug']
     video_path = project_data['video']
@@ -89,9 +109,11 @@ def copy_video_and_update_html(project_name, project_data):
     # Get video extension
     video_ext = os.path.splitext(video_path)[1]
     
-    # Get next number
-    next_num = get_next_number(project_folder)
-    new_video_name = f"{next_num:02d}_video{video_ext}"
+    # Reuse the video if an earlier run copied it, else take the next number
+    new_video_name = find_existing_video(images_folder, video_path)
+    if not new_video_name:
+        next_num = get_next_number(project_folder)
+        new_video_name = f"{next_num:02d}_video{video_ext}"
     new_video_path = os.path.join(images_folder, new_video_name)
     
     # Copy video
@@ -99,17 +121,21 @@ def copy_video_and_update_html(project_name, project_data):
     print(f"   Copying: {os.path.basename(video_path)}")
     print(f"   To:      {new_video_name}")
     
-    shutil.copy2(video_path, new_video_path)
-    video_size_mb = os.path.getsize(new_video_path) / (1024 * 1024)
-    print(f"   ✅ Copied ({video_size_mb:.2f} MB)")
+    video_size_mb = os.path.getsize(video_path) / (1024 * 1024)
+    if outputs.copy(video_path, new_video_path):
+        print(f"   ✅ Copied ({video_size_mb:.2f} MB)")
+    else:
+        print(f"   ✓ Already copied ({video_size_mb:.2f} MB)")
     
     # Update HTML
     if not os.path.exists(html_file):
         print(f"   ⚠️  HTML file not found: {html_file}")
         return True  # Video copied but HTML not updated
     
-    with open(html_file, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    html_content = outputs.read_text(html_file)
+    if f'images/{new_video_name}' in html_content:
+        print("   ✓ HTML already has the video element")
+        return True
     
     soup = BeautifulSoup(html_content, 'html.parser')
     
@@ -137,25 +163,21 @@ def copy_video_and_update_html(project_name, project_data):
         # Append to page-body
         page_body.append(BeautifulSoup(video_html, 'html.parser'))
     
-    # Write updated HTML
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(str(soup))
+    # Write updated HTML (the video's rules join the inlined CSS)
+    outputs.write_text(html_file, inline_styles(str(soup)))
     
     print(f"   ✅ HTML updated with video element")
     
     return True
 
-def main():
-    print("=" * 70)
-    print("COPYING VIDEOS FROM NOTION EXPORT TO PROJECT FOLDERS")
-    print("=" * 70)
-    
+def copy_videos(outputs):
+    """Copy every mapped video; returns (succeeded, failed)"""
     success_count = 0
     fail_count = 0
     
     for project_name, project_data in VIDEO_MAPPING.items():
         try:
-            if copy_video_and_update_html(project_name, project_data):
+            if copy_video_and_update_html(project_name, project_data, outputs):
                 success_count += 1
             else:
                 fail_count += 1
@@ -163,11 +185,27 @@ def main():
             print(f"\n❌ Error processing {project_name}: {e}")
             fail_count += 1
     
+    return success_count, fail_count
+
+def main():
+    parser = argparse.ArgumentParser(description='Copy project videos from the Notion export')
+    add_arguments(parser)
+    outputs = Outputs.from_args(parser.parse_args())
+    
+    os.chdir(project_root)
+    
+    print("=" * 70)
+    print("COPYING VIDEOS FROM NOTION EXPORT TO PROJECT FOLDERS")
+    print("=" * 70)
+    
+    success_count, fail_count = copy_videos(outputs)
+    
     print("\n" + "=" * 70)
     print("SUMMARY")
     print("=" * 70)
     print(f"✅ Successfully processed: {success_count}")
     print(f"❌ Failed: {fail_count}")
+    outputs.print_summary()
     print("=" * 70)
 
 if __name__ == '__main__':
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Cover images for project folders
+
+Every cover is made the same way, whatever the first image is:
+- animated GIF/WebP: the first frame
+- EXIF orientation applied, then cropped to 3:2 and resized to 900x600
+- opaque images become a progressive, optimized JPEG (cover.jpg); images
+  that really use transparency become a WebP with alpha (cover.webp)
+- the quality is lowered step by step until the file fits MAX_COVER_BYTES
+
+The cover's extension follows the format, not the source, so write_cover()
+removes a previous cover.<other ext> and returns the name to put in the
+listing's `image` field. PIL is imported on first use so importing this
+module stays cheap.
+
+Usage:
+    python3 _dev/covers.py [SLUG...] [--dry-run] [--diff]   # regenerate covers, update the listing
+"""
+
+import io
+import os
+
+from outputs import Outputs, add_arguments
+
+COVER_SIZE = (900, 600)
+MAX_COVER_BYTES = 150 * 1024
+# Tried in order until the cover fits; the last one is kept regardless
+QUALITIES = (85, 78, 70, 62, 55)
+
+
+def cover_frame(img):
+    """First frame, upright, as RGB or (if any pixel is transparent) RGBA"""
+    from PIL import ImageOps
+
+    img.seek(0)
+    frame = ImageOps.exif_transpose(img)
+    if frame.mode in ('RGBA', 'LA', 'PA') or 'transparency' in frame.info:
+        frame = frame.convert('RGBA')
+        if frame.getchannel('A').getextrema()[0] < 255:
+            return frame
+    return frame.convert('RGB')
+
+
+def crop_to_ratio(img, width, height):
+    """Centered crop of img to width:height"""
+    img_width, img_height = img.size
+    if img_width / img_height > width / height:
+        new_width = int(img_height * width / height)
+        left = (img_width - new_width) // 2
+        return img.crop((left, 0, left + new_width, img_height))
+    new_height = int(img_width * height / width)
+    top = (img_height - new_height) // 2
+    return img.crop((0, top, img_width, top + new_height))
+
+
+def encode(img, quality):
+    buffer = io.BytesIO()
+    if img.mode == 'RGBA':
+        img.save(buffer, 'WEBP', quality=quality, method=6)
+    else:
+        img.save(buffer, 'JPEG', quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def render_cover(source_path, size=COVER_SIZE, max_bytes=MAX_COVER_BYTES):
+    """(cover bytes, extension) for an image; raises if PIL can't read it"""
+    from PIL import Image
+
+    with Image.open(source_path) as img:
+        frame = cover_frame(img)
+    cover = crop_to_ratio(frame, *size).resize(size, Image.Resampling.LANCZOS)
+    extension = '.webp' if cover.mode == 'RGBA' else '.jpg'
+    for quality in QUALITIES:
+        data = encode(cover, quality)
+        if len(data) <= max_bytes:
+            break
+    return data, extension
+
+
+def find_cover(images_dir):
+    """File name of the folder's cover (cover.jpg, cover.webp, ...), or None"""
+    if not os.path.isdir(images_dir):
+        return None
+    return next((name for name in sorted(os.listdir(images_dir))
+                 if os.path.splitext(name)[0] == 'cover'), None)
+
+
+def write_cover(source_path, images_dir, outputs=None):
+    """Render and store images_dir/cover.<ext> from source_path; returns its file name
+
+    Falls back to the source image itself if it can't be read.
+    """
+    outputs = outputs or Outputs()
+    try:
+        data, extension = render_cover(source_path)
+    except Exception as e:
+        print(f"Error generating cover: {e}")
+        data, extension = None, os.path.splitext(source_path)[1].lower()
+
+    cover_name = f'cover{extension}'
+    cover_path = os.path.join(images_dir, cover_name)
+    if data is None:
+        outputs.store(source_path, cover_path)
+    else:
+        # Render next to the cover, then store it only if the bytes differ
+        temp_cover_path = os.path.join(images_dir, f'.cover-new{extension}')
+        with open(temp_cover_path, 'wb') as f:
+            f.write(data)
+        try:
+            outputs.store(temp_cover_path, cover_path)
+        finally:
+            os.remove(temp_cover_path)
+
+    # A cover of another format from before
+    for name in os.listdir(images_dir):
+        if os.path.splitext(name)[0] == 'cover' and name != cover_name:
+            outputs.remove(os.path.join(images_dir, name))
+    return cover_name
+
+
+def main():
+    import argparse
+
+    from image_order import image_order
+    from listing import load_projects, save_projects
+
+    parser = argparse.ArgumentParser(description='Regenerate project covers from their first image')
+    parser.add_argument('slugs', nargs='*', help='projects to regenerate (default: all)')
+    add_arguments(parser)
+    args = parser.parse_args()
+    outputs = Outputs.from_args(args)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(os.path.dirname(script_dir))
+
+    projects = load_projects()
+    regenerated = 0
+    for project in projects:
+        slug = project['slug']
+        project_dir = os.path.join('projects', slug)
+        images = image_order(project_dir)
+        if (args.slugs and slug not in args.slugs) or not images:
+            continue
+        images_dir = os.path.join(project_dir, 'images')
+        cover = write_cover(os.path.join(images_dir, images[0]), images_dir, outputs)
+        project['image'] = f'projects/{slug}/images/{cover}'
+        regenerated += 1
+
+    save_projects(projects, outputs)
+    print(f"✓ Regenerated {regenerated} covers")
+    outputs.print_summary()
+
+
+if __name__ == '__main__':
+    main()
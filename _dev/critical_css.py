@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Inline the CSS each project page uses and load styles.css without blocking
+
+styles.css carries the gallery, about and CV rules too, so a project page's
+first render used to wait for all of it. The page renderers
+(generate-notion-pages.py, project_pages.generate_html, copy-videos.py) pass
+their HTML through inline_styles() before writing it, so that:
+- the rules that can match the page's markup (by its tags, classes and ids,
+  plus global rules such as :root, * and dark mode) are inlined, minified,
+  in a <style> block
+- styles.css is still loaded, as a preload that turns into a stylesheet
+  once it arrives (with a <noscript> fallback), for anything not inlined
+
+The block sits between critical-css:start/end comments and is rebuilt from
+scratch each time, so a page is written once, already inlined, and an
+unchanged page renders to the same bytes. Run this script after editing
+styles.css to refresh the pages without regenerating them.
+
+Matching is deliberately generous: a selector is kept when every tag,
+class and id in it occurs somewhere on the page, whatever the combinators.
+
+Usage:
+    python3 _dev/critical_css.py [--dry-run] [--diff]
+"""
+
+import functools
+import os
+import re
+from html.parser import HTMLParser
+
+from outputs import Outputs, add_arguments
+
+STYLES_CSS = 'styles.css'
+START_MARKER = '<!-- critical-css:start -->'
+END_MARKER = '<!-- critical-css:end -->'
+
+COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+STYLESHEET_LINK_RE = re.compile(
+    r'<link\b(?=[^>]*\brel="stylesheet")[^>]*\bhref="(?P<href>(?:\.\./)*styles\.css)"[^>]*>')
+BLOCK_RE = re.compile(re.escape(START_MARKER) + r'.*?' + re.escape(END_MARKER), re.S)
+BLOCK_HREF_RE = re.compile(r'<noscript><link rel="stylesheet" href="([^"]+)"')
+
+# Parts of a selector that don't name an element: :not(...) arguments,
+# pseudo-classes/elements and attribute tests
+SELECTOR_NOISE_RE = re.compile(r'\([^)]*\)|::?[\w-]+|\[[^\]]*\]')
+CLASS_RE = re.compile(r'\.([\w-]+)')
+ID_RE = re.compile(r'#([\w-]+)')
+TAG_RE = re.compile(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)')
+ANIMATION_RE = re.compile(r'animation(?:-name)?\s*:\s*([^;]+)')
+
+
+class PageTokens(HTMLParser):
+    """Tags, classes and ids used in a page"""
+
+    def __init__(self):
+        super().__init__()
+        self.tags = set()
+        self.classes = set()
+        self.ids = set()
+
+    def handle_starttag(self, tag, attrs):
+        self.tags.add(tag)
+        for name, value in attrs:
+            if name == 'class' and value:
+                self.classes.update(value.split())
+            elif name == 'id' and value:
+                self.ids.add(value)
+
+
+def parse_css(css):
+    """[(prelude, body)] blocks; bodies of @media/@supports/@keyframes are parsed into lists too"""
+    css = COMMENT_RE.sub('', css)
+    blocks = []
+    i = 0
+    while i < len(css):
+        open_brace = css.find('{', i)
+        if open_brace < 0:
+            break
+        prelude = ' '.join(css[i:open_brace].split())
+        depth = 0
+        for j in range(open_brace, len(css)):
+            if css[j] == '{':
+                depth += 1
+            elif css[j] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+        body = css[open_brace + 1:j]
+        if prelude.startswith(('@media', '@supports', '@keyframes')):
+            blocks.append((prelude, parse_css(body)))
+        else:
+            blocks.append((prelude, minify_declarations(body)))
+        i = j + 1
+    return blocks
+
+
+def minify_declarations(body):
+    """'color: red;  margin: 0;' -> 'color:red;margin:0'"""
+    declarations = []
+    for declaration in body.split(';'):
+        name, colon, value = declaration.partition(':')
+        if name.strip():
+            declarations.append(f"{name.strip()}{colon}{' '.join(value.split())}")
+    return ';'.join(declarations)
+
+
+def selector_matches(selector, tokens):
+    """Whether every tag, class and id in the selector occurs on the page"""
+    plain = SELECTOR_NOISE_RE.sub('', selector)
+    return (all(c in tokens.classes for c in CLASS_RE.findall(plain))
+            and all(i in tokens.ids for i in ID_RE.findall(plain))
+            and all(t.lower() in tokens.tags for t in TAG_RE.findall(plain)))
+
+
+def prune(blocks, tokens):
+    """Minified CSS of the blocks that can apply to the page (keyframes resolved separately)"""
+    kept = []
+    for prelude, body in blocks:
+        if prelude.startswith('@keyframes'):
+            continue
+        elif isinstance(body, list):
+            inner = prune(body, tokens)
+            if inner:
+                kept.append(f'{prelude}{{{inner}}}')
+        elif prelude.startswith('@'):
+            kept.append(f'{prelude}{{{body}}}')
+        else:
+            selectors = [s.strip() for s in prelude.split(',')]
+            matching = [s for s in selectors if selector_matches(s, tokens)]
+            if matching:
+                kept.append(f"{','.join(matching)}{{{body}}}")
+    return ''.join(kept)
+
+
+def keyframes_for(css, blocks):
+    """The @keyframes blocks named by animations in css"""
+    names = set()
+    for value in ANIMATION_RE.findall(css):
+        names.update(value.replace(',', ' ').split())
+    return ''.join(f"{prelude}{{{''.join(f'{step}{{{rules}}}' for step, rules in body)}}}"
+                   for prelude, body in blocks
+                   if prelude.startswith('@keyframes') and prelude.split()[-1] in names)
+
+
+def critical_css(html, blocks):
+    tokens = PageTokens()
+    tokens.feed(html)
+    css = prune(blocks, tokens)
+    return css + keyframes_for(css, blocks)
+
+
+def unwrap(html):
+    """The page with any inlined block turned back into a plain stylesheet link"""
+    def restore(match):
+        href = BLOCK_HREF_RE.search(match.group(0))
+        return f'<link rel="stylesheet" href="{href.group(1) if href else "../../styles.css"}">'
+    return BLOCK_RE.sub(restore, html)
+
+
+def inline_critical_css(html, blocks):
+    """Page HTML with its critical CSS inlined (unchanged if it doesn't link styles.css)"""
+    html = unwrap(html)
+    link = STYLESHEET_LINK_RE.search(html)
+    if not link:
+        return html
+    href = link.group('href')
+    css = critical_css(html[:link.start()] + html[link.end():], blocks)
+    block = (
+        f'{START_MARKER}\n'
+        f'<style>{css}</style>\n'
+        f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+        f'<noscript><link rel="stylesheet" href="{href}"></noscript>\n'
+        f'{END_MARKER}'
+    )
+    return html[:link.start()] + block + html[link.end():]
+
+
+def project_pages(projects_dir='projects'):
+    if not os.path.isdir(projects_dir):
+        return []
+    return [
+        os.path.join(projects_dir, slug, 'index.html')
+        for slug in sorted(os.listdir(projects_dir))
+        if os.path.isfile(os.path.join(projects_dir, slug, 'index.html'))
+    ]
+
+
+def load_blocks(outputs):
+    return parse_css(outputs.read_text(STYLES_CSS))
+
+
+@functools.lru_cache(maxsize=4)
+def _parsed_styles(path, mtime_ns, size):
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_css(f.read())
+
+
+def styles_blocks(path=STYLES_CSS):
+    """Parsed styles.css, parsed again only when the file changes"""
+    stat = os.stat(path)
+    return _parsed_styles(path, stat.st_mtime_ns, stat.st_size)
+
+
+def inline_styles(html):
+    """Page HTML with the critical CSS of the current styles.css inlined"""
+    return inline_critical_css(html, styles_blocks())
+
+
+def inline_page(path, outputs, blocks=None):
+    """Rewrite one page; returns True if it changed"""
+    blocks = blocks if blocks is not None else load_blocks(outputs)
+    return outputs.write_text(path, inline_critical_css(outputs.read_text(path), blocks))
+
+
+def inline_project_pages(outputs=None):
+    """Inline critical CSS into every project page; returns how many pages were processed"""
+    outputs = outputs or Outputs()
+    blocks = load_blocks(outputs)
+    pages = project_pages()
+    for path in pages:
+        inline_page(path, outputs, blocks)
+    return len(pages)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Inline critical CSS into the project pages')
+    add_arguments(parser)
+    outputs = Outputs.from_args(parser.parse_args())
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(os.path.dirname(script_dir))
+
+    count = inline_project_pages(outputs)
+    print(f"✓ Inlined critical CSS in {count} project pages")
+    outputs.print_summary()
+
+
+if __name__ == '__main__':
+    main()
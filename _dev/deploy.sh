@@ -46,6 +46,25 @@ else
     echo "✅ Remote added"
 fi
 
+echo ""
+echo "🔢 Publishing reordered images..."
+
+# Rename images to the order saved in the admin and drop the manifests (_dev/image_order.py)
+if ! python3 _dev/image_order.py; then
+    echo "❌ Error: Could not publish the pending image orders"
+    exit 1
+fi
+
+echo ""
+echo "⚖️  Checking page weights..."
+
+# Stop before pushing pages over a fail budget (_dev/page-budgets.json)
+if ! python3 _dev/page_weight.py --top 10; then
+    echo "❌ Error: Pages exceed their weight budget"
+    echo "Shrink them, or raise their budget in _dev/page-budgets.json"
+    exit 1
+fi
+
 echo ""
 echo "📝 Preparing files for deployment..."
 
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Build facet-index.json, the precomputed filters and sort orders for the gallery
+
+Format (doc ids are positions in "docs", which follows projects-data.json,
+the same numbering as search-index.json):
+
+    {
+      "version": 1,
+      "docs": [slug, ...],
+      "order": {"year": [id, ...], "alpha": [id, ...]},
+      "facets": {
+        "year": [{"value": "2024", "count": 6, "ids": [3, 4, ...]}, ...],
+        "collaborator": [...],
+        "role": [...]
+      }
+    }
+
+"ids" are sorted ascending so script.js can intersect selections with a
+linear merge, then walk an "order" list to display them without sorting.
+"""
+
+import json
+import re
+import unicodedata
+
+from listing import year_key
+from outputs import Outputs
+
+FACET_INDEX_JSON = 'facet-index.json'
+INDEX_VERSION = 1
+
+COLLABORATOR_SPLIT_RE = re.compile(r',|\s+and\s+')
+
+
+def alpha_key(project):
+    """Accent- and case-insensitive name key (approximates localeCompare in script.js)"""
+    name = unicodedata.normalize('NFKD', project['name'].casefold())
+    return ''.join(c for c in name if not unicodedata.combining(c))
+
+
+def project_facets(project):
+    """Facet values for one listing entry"""
+    collaborators = [
+        c.strip().lstrip('@').strip()
+        for c in COLLABORATOR_SPLIT_RE.split(project.get('collaborator', ''))
+    ]
+    roles = [r.strip() for r in project.get('role', '').split(',')]
+    return {
+        'year': [project['year']] if project.get('year') else [],
+        'collaborator': [c for c in collaborators if c],
+        'role': [r for r in roles if r],
+    }
+
+
+def build_facet_index(projects):
+    """Build the index structure for a project listing"""
+    values = {'year': {}, 'collaborator': {}, 'role': {}}
+    for doc_id, project in enumerate(projects):
+        for facet, facet_values in project_facets(project).items():
+            for value in dict.fromkeys(facet_values):
+                values[facet].setdefault(value, []).append(doc_id)
+
+    facets = {}
+    for facet, ids_by_value in values.items():
+        entries = [
+            {'value': value, 'count': len(ids), 'ids': ids}
+            for value, ids in ids_by_value.items()
+        ]
+        if facet == 'year':
+            entries.sort(key=lambda e: year_key({'year': e['value']}), reverse=True)
+        else:
+            entries.sort(key=lambda e: (-e['count'], e['value'].casefold()))
+        facets[facet] = entries
+
+    ids = range(len(projects))
+    return {
+        'version': INDEX_VERSION,
+        'docs': [p['slug'] for p in projects],
+        'order': {
+            # sorted() is stable, like Array.prototype.sort in the browser
+            'year': sorted(ids, key=lambda i: year_key(projects[i]), reverse=True),
+            'alpha': sorted(ids, key=lambda i: alpha_key(projects[i])),
+        },
+        'facets': facets,
+    }
+
+
+def write_facet_index(projects, outputs=None):
+    """Write facet-index.json; returns True if the file changed"""
+    outputs = outputs or Outputs()
+    content = json.dumps(build_facet_index(projects), ensure_ascii=False, separators=(',', ':'))
+    return outputs.write_text(FACET_INDEX_JSON, content)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Pre-render the first page of the project gallery into index.html
+
+The cards between the gallery markers are produced with the same markup as
+createProjectCard() in script.js, in the default "by Year" order, so the
+gallery paints with the first HTML byte. script.js hydrates these cards
+instead of rebuilding them.
+"""
+
+import html
+import re
+
+from listing import year_key
+from outputs import Outputs
+
+INDEX_HTML = 'index.html'
+SCRIPT_JS = 'script.js'
+
+GALLERY_START = '<!-- gallery:start -->'
+GALLERY_END = '<!-- gallery:end -->'
+CARD_INDENT = ' ' * 16
+# Cards in the first row at the widest layout (.projects-grid in styles.css):
+# the above-the-fold covers, loaded eagerly
+FIRST_ROW_CARDS = 4
+
+
+def projects_per_page():
+    """Read PROJECTS_PER_PAGE from script.js so there is a single source of truth"""
+    with open(SCRIPT_JS, 'r', encoding='utf-8') as f:
+        match = re.search(r'const PROJECTS_PER_PAGE = (\d+);', f.read())
+    return int(match.group(1)) if match else 16
+
+
+def render_project_card(project, index, per_page):
+    """Render one gallery card (mirrors createProjectCard in script.js)"""
+    name = html.escape(project['name'])
+    if index == 0:
+        loading = 'loading="eager" fetchpriority="high"'
+    elif index < FIRST_ROW_CARDS:
+        loading = 'loading="eager"'
+    else:
+        loading = 'loading="lazy"'
+    delay = f"{(index % per_page) * 0.05:.2f}".rstrip('0').rstrip('.')
+    return (
+        f'{CARD_INDENT}<div class="project-card" data-slug="{html.escape(project["slug"])}" '
+        f'style="animation-delay: {delay}s; cursor: pointer;">\n'
+        f'{CARD_INDENT}    <div class="project-image">'
+        f'<img src="{html.escape(project["image"])}" alt="{name}" {loading}></div>\n'
+        f'{CARD_INDENT}    <div class="project-info">'
+        f'<h3 class="project-title">{name}</h3>'
+        f'<p class="project-collaborator">{html.escape(project["collaborator"])}</p></div>\n'
+        f'{CARD_INDENT}</div>\n'
+    )
+
+
+def render_gallery(projects, per_page):
+    """Render the first page of cards in "by Year" order"""
+    # sorted() is stable, like Array.prototype.sort in the browser
+    first_page = sorted(projects, key=year_key, reverse=True)[:per_page]
+    return ''.join(render_project_card(p, i, per_page) for i, p in enumerate(first_page))
+
+
+def prerender_index(projects, outputs=None):
+    """Replace the gallery region in index.html; returns True if the file changed"""
+    outputs = outputs or Outputs()
+    page = outputs.read_text(INDEX_HTML)
+
+    start = page.find(GALLERY_START)
+    end = page.find(GALLERY_END)
+    if start == -1 or end == -1:
+        print(f"⚠️  Gallery markers not found in {INDEX_HTML}, skipping pre-render")
+        return False
+
+    per_page = projects_per_page()
+    cards = render_gallery(projects, per_page)
+    new_page = (
+        page[:start + len(GALLERY_START)] + '\n' + cards + CARD_INDENT + page[end:]
+    )
+
+    # Show "Load More" only when there is more than the first page
+    load_more_class = 'load-more-container' if len(projects) > per_page else 'load-more-container hidden'
+    new_page = re.sub(
+        r'class="load-more-container[^"]*" id="load-more-container"',
+        f'class="{load_more_class}" id="load-more-container"',
+        new_page
+    )
+
+    return outputs.write_text(INDEX_HTML, new_page)
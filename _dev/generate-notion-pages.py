@@ -1,80 +1,63 @@
 #!/usr/bin/env python3
-import json
+"""
+Generate project pages (projects/<slug>/index.html) from the Notion export
+
+Also a stage of build.py, which imports build_project_page/generate_pages.
+Pages are written with their critical CSS already inlined (critical_css.py).
+"""
+import argparse
 import os
-import shutil
 from pathlib import Path
 from bs4 import BeautifulSoup
 import re
 import unicodedata
-from PIL import Image
+
+from covers import write_cover
+from critical_css import inline_styles
+from image_meta import ImageMetaCache
+from image_order import ORDER_JSON
+from listing import load_projects, save_projects
+from outputs import Outputs, add_arguments
+from project_pages import image_attributes
 
 # Get the project root directory (parent of _dev folder)
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)
-os.chdir(project_root)
-
-# Load projects data
-with open('projects-data.json', 'r', encoding='utf-8') as f:
-    projects_data = json.load(f)
 
 # Projects will be created in individual folders
 # No need for separate assets directories
 
 notion_dir = "notion-page/Stephan Schulz/Projects and Artworks"
 
-def clean_slug(text):
-    slug = text.lower()
-    slug = slug.replace(',', '').replace(':', '').replace('&', 'and')
-    slug = slug.replace(' ', '-').replace('(', '').replace(')', '')
-    slug = slug.replace('/', '-').replace('+', '-')
-    slug = slug.replace('--', '-').replace('---', '-')
-    slug = slug.replace('é', 'e').replace('ó', 'o').replace('ü', 'u')
-    slug = slug.replace("'", '')
-    return slug
+def matches_notion_entry(project_name, entry):
+    """Whether a Notion export folder or file belongs to the project
+
+    Folders and pages are named after the project without the year; names
+    with slashes appear with spaces, and macOS may store them as NFD.
+    """
+    name_base = project_name.split(',')[0].strip()
+    name_base_normalized = name_base.replace(' / ', ' ')
+    entry = unicodedata.normalize('NFC', entry)
+    return (unicodedata.normalize('NFC', name_base) in entry or
+            unicodedata.normalize('NFC', name_base_normalized) in entry)
 
 def natural_sort_key(filename):
     """Sort files naturally (handling numbers in filenames)"""
     return [int(text) if text.isdigit() else text.lower()
             for text in re.split('([0-9]+)', str(filename))]
 
-def generate_cover_from_first_image(first_image_path, cover_path):
-    """Generate cover image from first image with 3:2 aspect ratio"""
-    try:
-        img = Image.open(first_image_path)
-        width, height = img.size
-        target_ratio = 3 / 2
-        current_ratio = width / height
-        
-        if current_ratio > target_ratio:
-            new_width = int(height * target_ratio)
-            left = (width - new_width) // 2
-            img_cropped = img.crop((left, 0, left + new_width, height))
-        else:
-            new_height = int(width / target_ratio)
-            top = (height - new_height) // 2
-            img_cropped = img.crop((0, top, width, top + new_height))
-        
-        img_resized = img_cropped.resize((900, 600), Image.Resampling.LANCZOS)
-        img_resized.save(cover_path, quality=90, optimize=True)
-        return True
-    except Exception:
-        return False
+def copy_project_images(project_name, slug, outputs):
+    """Copy and rename images to numbered format in project folder
 
-def copy_project_images(project_name, slug):
-    """Copy and rename images to numbered format in project folder"""
+    Returns the page's image paths and the cover's file name (None without images).
+    """
     # Find the project folder with Unicode normalization
-    name_base = project_name.split(',')[0].strip()
-    name_base_norm = unicodedata.normalize('NFC', name_base)
-    name_base_normalized = name_base.replace(' / ', ' ')
-    name_base_normalized_norm = unicodedata.normalize('NFC', name_base_normalized)
-    
     folders = [f for f in os.listdir(notion_dir) 
                if os.path.isdir(os.path.join(notion_dir, f)) and 
-               (name_base_norm in unicodedata.normalize('NFC', f) or 
-                name_base_normalized_norm in unicodedata.normalize('NFC', f))]
+               matches_notion_entry(project_name, f)]
     
     if not folders:
-        return []
+        return [], None
     
     folder_path = os.path.join(notion_dir, folders[0])
     
@@ -82,6 +65,8 @@ def copy_project_images(project_name, slug):
     project_dir = os.path.join('projects', slug)
     image_dir = os.path.join(project_dir, 'images')
     os.makedirs(image_dir, exist_ok=True)
+    # Images are renumbered below, so a pending admin order no longer applies
+    outputs.remove(os.path.join(project_dir, ORDER_JSON))
     
     # Get all images and sort them
     image_files = []
@@ -90,39 +75,31 @@ def copy_project_images(project_name, slug):
     
     image_files.sort(key=natural_sort_key)
     
-    # Copy and rename with numbered prefixes
+    # Copy and rename with numbered prefixes (unchanged images are left alone)
     images = []
     for idx, img_path in enumerate(image_files, start=1):
         ext = img_path.suffix
         new_name = f"{idx:02d}_image{ext}"
         dest = os.path.join(image_dir, new_name)
-        shutil.copy2(str(img_path), dest)
+        outputs.store(str(img_path), dest)
         images.append(f'images/{new_name}')
     
+    # Numbered images left over from an earlier export
+    for name in os.listdir(image_dir):
+        if re.match(r'\d+_image\.', name) and f'images/{name}' not in images:
+            outputs.remove(os.path.join(image_dir, name))
+    
     # Generate cover image from first image
-    if image_files:
-        first_image_path = os.path.join(image_dir, f"01_image{image_files[0].suffix}")
-        cover_ext = image_files[0].suffix
-        cover_path = os.path.join(image_dir, f"cover{cover_ext}")
-        
-        if not generate_cover_from_first_image(first_image_path, cover_path):
-            # Fallback: copy first image
-            shutil.copy2(first_image_path, cover_path)
+    cover = write_cover(str(image_files[0]), image_dir, outputs) if image_files else None
     
-    return images
+    return images, cover
 
 def parse_notion_html(project_name):
     """Extract content from Notion HTML export"""
     # Find the HTML file - handle slashes and Unicode normalization
-    name_base = project_name.split(',')[0].strip()
-    name_base_norm = unicodedata.normalize('NFC', name_base)
-    name_base_normalized = name_base.replace(' / ', ' ')
-    name_base_normalized_norm = unicodedata.normalize('NFC', name_base_normalized)
-    
     html_files = [f for f in os.listdir(notion_dir) 
                   if f.endswith('.html') and 
-                  (name_base_norm in unicodedata.normalize('NFC', f) or 
-                   name_base_normalized_norm in unicodedata.normalize('NFC', f))]
+                  matches_notion_entry(project_name, f)]
     
     if not html_files:
         return None
@@ -172,8 +149,8 @@ def parse_notion_html(project_name):
         'acknowledgment': acknowledgment
     }
 
-def generate_project_page(project, content, images):
-    """Generate HTML for a project page"""
+def generate_project_page(project, content, images, meta=None):
+    """Generate HTML for a project page, critical CSS inlined"""
     
     # Extract properties
     props = content['properties']
@@ -232,7 +209,9 @@ def generate_project_page(project, content, images):
             </tbody>
         </table>'''
     
-    # Build images gallery
+    # Build images gallery (sizes and placeholder colors from the metadata cache)
+    meta = meta or {}
+    attrs = lambda img: image_attributes(meta.get(os.path.basename(img)))
     images_html = ''
     if images:
         # First two images in two columns
@@ -240,10 +219,10 @@ def generate_project_page(project, content, images):
             images_html += f'''
         <div class="image-grid">
             <div class="image-column">
-                <img src="{images[0]}" alt="{project['name']}" loading="lazy">
+                <img src="{images[0]}" alt="{project['name']}" loading="lazy"{attrs(images[0])}>
             </div>
             <div class="image-column">
-                <img src="{images[1]}" alt="{project['name']}" loading="lazy">
+                <img src="{images[1]}" alt="{project['name']}" loading="lazy"{attrs(images[1])}>
             </div>
         </div>'''
         
@@ -251,7 +230,7 @@ def generate_project_page(project, content, images):
         for img in images[2:]:
             images_html += f'''
         <div class="image-full">
-            <img src="{img}" alt="{project['name']}" loading="lazy">
+            <img src="{img}" alt="{project['name']}" loading="lazy"{attrs(img)}>
         </div>'''
     
     # Build description - convert URLs to links
@@ -283,7 +262,7 @@ def generate_project_page(project, content, images):
         <h3>Acknowledgment</h3>
         <p>{content['acknowledgment']}</p>'''
     
-    return f'''<!DOCTYPE html>
+    return inline_styles(f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -315,15 +294,14 @@ def generate_project_page(project, content, images):
         </div>
     </main>
 </body>
-</html>'''
+</html>''')
 
-# Generate project pages
-generated = 0
+def build_project_page(project, outputs, meta_cache=None):
+    """Parse, copy images, render and write one project's page; False if not in the export
 
-for project in projects_data:
-    if not project.get('hasDetailPage'):
-        continue
-    
+    Sets the project's listing `image` to its generated cover. Image metadata
+    comes from meta_cache (loaded and saved here if not given).
+    """
     slug = project['slug']
     name = project['name']
     
@@ -331,25 +309,60 @@ for project in projects_data:
     notion_content = parse_notion_html(name)
     if not notion_content:
         print(f"⚠️  No Notion content found for: {name}")
-        continue
+        return False
     
     # Copy all images
-    images = copy_project_images(name, slug)
+    images, cover = copy_project_images(name, slug, outputs)
+    if cover:
+        # The cover's format can differ from the first image's
+        project['image'] = f'projects/{slug}/images/{cover}'
+    
+    # Image sizes and colors, decoding only images not seen before
+    cache = meta_cache or ImageMetaCache.load()
+    meta = cache.for_images(os.path.join('projects', slug, 'images'),
+                            [os.path.basename(img) for img in images])
+    if meta_cache is None:
+        cache.save(outputs)
     
     # Generate HTML
-    html = generate_project_page(project, notion_content, images)
+    html = generate_project_page(project, notion_content, images, meta)
     
     # Ensure project directory exists
     project_dir = f'projects/{slug}'
     os.makedirs(project_dir, exist_ok=True)
     
-    # Write file
-    with open(f'{project_dir}/index.html', 'w', encoding='utf-8') as f:
-        f.write(html)
-    
-    generated += 1
+    # Write file (skipped when the page is unchanged)
+    outputs.write_text(f'{project_dir}/index.html', html)
+    return True
+
+def generate_pages(projects_data, outputs):
+    """Generate every project page; returns how many were generated"""
+    generated = 0
+    meta_cache = ImageMetaCache.load()
+    for project in projects_data:
+        if project.get('hasDetailPage') and build_project_page(project, outputs, meta_cache):
+            generated += 1
+    meta_cache.save(outputs)
+    return generated
 
-print(f"✓ Generated {generated} Notion-style project pages")
-print(f"✓ Images organized with numbered prefixes (01_image.jpg, etc.)")
-print(f"✓ Cover images auto-generated with 3:2 aspect ratio")
+def main():
+    parser = argparse.ArgumentParser(description='Generate project pages from the Notion export')
+    add_arguments(parser)
+    outputs = Outputs.from_args(parser.parse_args())
+    
+    os.chdir(project_root)
+    projects_data = load_projects()
+    
+    generated = generate_pages(projects_data, outputs)
+    
+    # Covers may have changed the listing, and page text feeds the search
+    # index, so save both now the pages exist
+    save_projects(projects_data, outputs)
+    
+    print(f"✓ Generated {generated} Notion-style project pages")
+    print(f"✓ Images organized with numbered prefixes (01_image.jpg, etc.)")
+    print(f"✓ Cover images auto-generated with 3:2 aspect ratio (JPEG, or WebP if transparent)")
+    outputs.print_summary()
 
+if __name__ == '__main__':
+    main()
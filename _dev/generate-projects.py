@@ -1,98 +1,170 @@
 #!/usr/bin/env python3
+"""
+Build projects-data.json from the Notion CSV export
+
+Rows are read and turned into listing entries one at a time
+(iter_projects), so only the entries themselves are kept for the final
+sort by year. Slugs come from slugs.py; projects already in the listing
+keep theirs. Problems with a row (missing or non-numeric year, duplicate
+slug, stray fields) are reported with its line number; --strict
+makes them fatal, and --check validates the export without writing.
+"""
+import argparse
 import csv
-import json
 import os
-from pathlib import Path
+import sys
 import unicodedata
 
+from listing import save_projects, year_key
+from outputs import Outputs, add_arguments
+from slugs import SlugIndex, legacy_slug
+
 # Get the project root directory (parent of _dev folder)
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)
-os.chdir(project_root)
-
-# Read the CSV file
-projects = []
-csv_path = 'notion-page/Stephan Schulz/Projects and Artworks f8c7057cd41f4367aa5303e122fd0b46.csv'
-projects_dir = 'notion-page/Stephan Schulz/Projects and Artworks'
-
-with open(csv_path, 'r', encoding='utf-8-sig') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        name = row['Name']
-        year = row['Year']
-        
-        # Skip non-project entries
-        if not name or not year or name in ['Acknowledgment', 'Biography and Curriculum Vitae']:
-            continue
-            
-        # Create slug from name (without year for image matching)
-        slug = name.lower()
-        # Remove year from slug for image filename
-        slug_no_year = slug.split(',')[0].strip()
-        # Handle slashes - remove them for slug but keep spaces around them
-        slug_no_year = slug_no_year.replace(' / ', '-').replace('/', '-')
-        slug_no_year = slug_no_year.replace(':', '').replace('&', 'and')
-        slug_no_year = slug_no_year.replace(' ', '-').replace('(', '').replace(')', '')
-        slug_no_year = slug_no_year.replace('+', '-')
-        slug_no_year = slug_no_year.replace('--', '-').replace('---', '-')
-        slug_no_year = slug_no_year.replace('é', 'e').replace('ó', 'o').replace('ü', 'u')
-        slug_no_year = slug_no_year.replace("'", '')
-        
-        # Full slug with year for detail pages
-        slug = name.lower()
-        slug = slug.replace(' / ', '-').replace('/', '-')
-        slug = slug.replace(',', '').replace(':', '').replace('&', 'and')
-        slug = slug.replace(' ', '-').replace('(', '').replace(')', '')
-        slug = slug.replace('+', '-')
-        slug = slug.replace('--', '-').replace('---', '-')
-        slug = slug.replace('é', 'e').replace('ó', 'o').replace('ü', 'u')
-        slug = slug.replace("'", '')
-        
-        # Find corresponding folder and image
-        # Handle slashes in names - Notion folders use spaces instead
-        name_base = name.split(',')[0].strip()
-        name_base_normalized = name_base.replace(' / ', ' ')
-        
+
+CSV_PATH = 'notion-page/Stephan Schulz/Projects and Artworks f8c7057cd41f4367aa5303e122fd0b46.csv'
+PROJECTS_DIR = 'notion-page/Stephan Schulz/Projects and Artworks'
+
+REQUIRED_COLUMNS = ('Name', 'Year', 'for', 'Official Site', 'I did')
+# Pages in the database that aren't projects
+SKIPPED_NAMES = ('Acknowledgment', 'Biography and Curriculum Vitae')
+# First match wins, as in the listing's cover paths
+COVER_EXTENSIONS = ('jpg', 'png', 'jpeg')
+
+
+class ExportFolders:
+    """Project folders of the export, listed once and matched by name"""
+
+    def __init__(self, projects_dir):
+        self.projects_dir = projects_dir
         # Normalize Unicode for proper matching (macOS uses NFD, CSV uses NFC)
-        name_base_norm = unicodedata.normalize('NFC', name_base)
-        name_base_normalized_norm = unicodedata.normalize('NFC', name_base_normalized)
-        
-        folder_candidates = [
-            f for f in os.listdir(projects_dir) 
-            if os.path.isdir(os.path.join(projects_dir, f)) and 
-            (name_base_norm in unicodedata.normalize('NFC', f) or 
-             name_base_normalized_norm in unicodedata.normalize('NFC', f))
+        self.folders = [
+            (unicodedata.normalize('NFC', f), f) for f in sorted(os.listdir(projects_dir))
+            if os.path.isdir(os.path.join(projects_dir, f))
         ]
-        
-        image_path = None
-        if folder_candidates:
-            folder_path = os.path.join(projects_dir, folder_candidates[0])
-            # Find first image in folder
-            for ext in ['jpg', 'png', 'jpeg']:
-                images = list(Path(folder_path).glob(f'*.{ext}'))
-                if images:
-                    image_path = f'assets/projects/{slug_no_year}.{ext}'
-                    break
-        
-        project = {
-            'name': name,
-            'year': year,
-            'collaborator': row['for'] if row['for'] else 'Stephan Schulz',
-            'link': row['Official Site'],
-            'role': row['I did'],
-            'slug': slug,
-            'image': image_path if image_path else f'assets/projects/{slug_no_year}.jpg',
-            'hasDetailPage': bool(folder_candidates)
-        }
-        projects.append(project)
-
-# Sort by year (descending)
-projects.sort(key=lambda x: int(x['year']) if x['year'].isdigit() else 0, reverse=True)
-
-# Write to JSON
-with open('projects-data.json', 'w', encoding='utf-8') as f:
-    json.dump(projects, f, indent=2, ensure_ascii=False)
-
-print(f"✓ Generated {len(projects)} projects")
-print(f"✓ Saved to projects-data.json")
 
+    def find(self, name):
+        """Folder for a project name, if any"""
+        # Handle slashes in names - Notion folders use spaces instead
+        name_base = unicodedata.normalize('NFC', name.split(',')[0].strip())
+        name_base_normalized = name_base.replace(' / ', ' ')
+        return next((f for norm, f in self.folders
+                     if name_base in norm or name_base_normalized in norm), None)
+
+    def cover_extension(self, folder):
+        """Extension of the folder's cover candidates, by COVER_EXTENSIONS order
+
+        Matched case-insensitively (IMG.JPG counts as jpg), like the glob on
+        macOS, where the export is made.
+        """
+        found = set()
+        with os.scandir(os.path.join(self.projects_dir, folder)) as entries:
+            for entry in entries:
+                ext = entry.name.rsplit('.', 1)[-1].lower() if '.' in entry.name else ''
+                if ext in COVER_EXTENSIONS and not entry.name.startswith('.'):
+                    found.add(ext)
+        return next((ext for ext in COVER_EXTENSIONS if ext in found), None)
+
+
+def check_columns(fieldnames):
+    """Raise ValueError if the export lacks a column the listing needs"""
+    missing = [c for c in REQUIRED_COLUMNS if c not in (fieldnames or ())]
+    if missing:
+        raise ValueError(f"CSV is missing column(s): {', '.join(missing)}")
+
+
+def print_row_error(line, message):
+    print(f"⚠️  line {line}: {message}", file=sys.stderr)
+
+
+def iter_projects(csv_path=CSV_PATH, projects_dir=PROJECTS_DIR, on_error=print_row_error):
+    """Yield listing entries in CSV order; on_error(line, message) gets each row problem"""
+    folders = ExportFolders(projects_dir)
+    # Projects already in the listing keep their slug
+    index = SlugIndex.load()
+    seen_slugs = set()
+
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        check_columns(reader.fieldnames)
+
+        for row in reader:
+            line = reader.line_num
+            name = row['Name'] or ''
+            year = row['Year'] or ''
+
+            if not name or name in SKIPPED_NAMES:
+                continue
+            if None in row:
+                on_error(line, f"{name}: {len(row[None])} field(s) beyond the header")
+            if not year:
+                on_error(line, f"{name}: no Year, row skipped")
+                continue
+            if not year.isdigit():
+                on_error(line, f"{name}: Year {year!r} is not a number (sorted last)")
+
+            # Full slug with year for detail pages; without it for cover file names
+            slug = index.slug_for(name)
+            if slug in seen_slugs:
+                on_error(line, f"{name}: slug {slug!r} already used by an earlier row")
+            seen_slugs.add(slug)
+            slug_no_year = legacy_slug(name.split(',')[0].strip())
+
+            folder = folders.find(name)
+            ext = folders.cover_extension(folder) if folder else None
+
+            yield {
+                'name': name,
+                'year': year,
+                'collaborator': row['for'] or 'Stephan Schulz',
+                'link': row['Official Site'] or '',
+                'role': row['I did'] or '',
+                'slug': slug,
+                'image': f'assets/projects/{slug_no_year}.{ext or "jpg"}',
+                'hasDetailPage': folder is not None
+            }
+
+
+def read_projects(csv_path=CSV_PATH, projects_dir=PROJECTS_DIR, on_error=print_row_error):
+    """Project listing from the Notion CSV export, newest first"""
+    return sorted(iter_projects(csv_path, projects_dir, on_error), key=year_key, reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build projects-data.json from the Notion CSV export')
+    parser.add_argument('--check', action='store_true', help='validate the CSV only, write nothing')
+    parser.add_argument('--strict', action='store_true', help='fail if any row has a problem')
+    add_arguments(parser)
+    args = parser.parse_args()
+    outputs = Outputs.from_args(args)
+
+    os.chdir(project_root)
+
+    problems = 0
+    def on_error(line, message):
+        nonlocal problems
+        problems += 1
+        print_row_error(line, message)
+
+    try:
+        if args.check:
+            count = sum(1 for _ in iter_projects(on_error=on_error))
+            print(f"✓ {count} projects, {problems} row problem(s)")
+            sys.exit(1 if problems else 0)
+        projects = read_projects(on_error=on_error)
+    except ValueError as e:
+        sys.exit(f"❌ {e}")
+
+    if args.strict and problems:
+        sys.exit(f"❌ {problems} row problem(s); nothing written")
+
+    # Write to JSON (only files whose content changed are rewritten)
+    save_projects(projects, outputs)
+
+    print(f"✓ Generated {len(projects)} projects")
+    print(f"✓ Saved to projects-data.json")
+    outputs.print_summary()
+
+if __name__ == '__main__':
+    main()
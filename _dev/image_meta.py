@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Image metadata cache: dimensions, EXIF orientation and dominant color
+
+Renderers use it to give each <img> its width/height (no layout shift) and
+a placeholder background color, and /api/load-project returns it with the
+images, without opening any image on the way. Entries are keyed by content
+hash, so an image shared by several projects or re-imported under another
+name is decoded once. For project images linked into the media store the
+hash is the blob's name; other files are hashed once per change (mtime and
+size).
+
+  width, height   as displayed, i.e. swapped for EXIF-rotated images
+  orientation     EXIF orientation tag (1 when there is none)
+  color           dominant color as #rrggbb
+
+The cache is _dev/.image-meta-cache.json (not committed). fill() decodes
+missing images on a thread pool; PIL is imported on first use.
+
+Usage:
+    python3 _dev/image_meta.py [--jobs N]   # fill the cache for every project image
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from media_store import MEDIA_EXTENSIONS, content_hash, linked_blob, project_files
+from outputs import Outputs
+
+META_JSON = os.path.join('_dev', '.image-meta-cache.json')
+META_VERSION = 1
+
+EXIF_ORIENTATION = 0x0112
+# Orientations that turn the image by 90 degrees
+TRANSPOSED = (5, 6, 7, 8)
+# Decoded size used to find the dominant color
+COLOR_SAMPLE = (64, 64)
+
+
+def file_key(path):
+    """Cache key that changes whenever the file does"""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def dominant_color(img):
+    """Most common color of a small, palette-reduced copy, as #rrggbb"""
+    from PIL import Image
+
+    if img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info:
+        # Transparent areas show the page, which is white
+        rgba = img.convert('RGBA')
+        img = Image.new('RGB', rgba.size, (255, 255, 255))
+        img.paste(rgba, mask=rgba.getchannel('A'))
+    sample = img.convert('RGB')
+    sample.thumbnail(COLOR_SAMPLE)
+    quantized = sample.quantize(colors=8)
+    _count, index = max(quantized.getcolors())
+    r, g, b = quantized.getpalette()[index * 3:index * 3 + 3]
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
+def read_meta(path):
+    """Metadata of one image file (decodes a reduced copy for the color)"""
+    from PIL import Image
+
+    with Image.open(path) as img:
+        width, height = img.size
+        orientation = img.getexif().get(EXIF_ORIENTATION, 1)
+        if orientation in TRANSPOSED:
+            width, height = height, width
+        # JPEGs can be decoded at a fraction of their size
+        img.draft('RGB', (COLOR_SAMPLE[0] * 4, COLOR_SAMPLE[1] * 4))
+        color = dominant_color(img)
+    return {'width': width, 'height': height, 'orientation': orientation, 'color': color}
+
+
+class ImageMetaCache:
+    """content hash -> metadata, plus the hash of each plain file by path"""
+
+    def __init__(self, images=None, files=None):
+        self.images = dict(images or {})
+        self.files = dict(files or {})  # path -> {'key': file_key, 'hash': ...}
+        self.changed = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=META_JSON):
+        """The persisted cache (empty if there is none yet)"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != META_VERSION:
+            return cls()
+        return cls(data['images'], data['files'])
+
+    def content_hash(self, path):
+        """Hash of an image's bytes: the blob name for store links, else cached by mtime/size"""
+        blob = linked_blob(path)
+        if blob:
+            return os.path.splitext(os.path.basename(blob))[0]
+        key = file_key(path)
+        with self._lock:
+            cached = self.files.get(path)
+        if cached and cached['key'] == key:
+            return cached['hash']
+        digest = content_hash(path)
+        with self._lock:
+            self.files[path] = {'key': key, 'hash': digest}
+            self.changed = True
+        return digest
+
+    def get(self, path):
+        """Metadata for an image file, reading it on a miss; None if it can't be read"""
+        try:
+            digest = self.content_hash(path)
+        except OSError:
+            return None
+        with self._lock:
+            meta = self.images.get(digest)
+        if meta is not None:
+            return meta
+        try:
+            meta = read_meta(path)
+        except Exception as e:
+            print(f"⚠️  {path}: {e}")
+            return None
+        with self._lock:
+            self.images[digest] = meta
+            self.changed = True
+        return meta
+
+    def fill(self, paths, workers=None):
+        """{path: metadata} for the paths, reading the missing ones in parallel"""
+        paths = list(paths)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            metas = list(pool.map(self.get, paths))
+        return {path: meta for path, meta in zip(paths, metas) if meta is not None}
+
+    def for_images(self, images_dir, names, workers=None):
+        """{file name: metadata} for images in one folder, as the renderers take it"""
+        metas = self.fill([os.path.join(images_dir, name) for name in names], workers)
+        return {os.path.basename(path): meta for path, meta in metas.items()}
+
+    def to_json(self):
+        with self._lock:
+            return json.dumps({
+                'version': META_VERSION,
+                'images': dict(sorted(self.images.items())),
+                'files': dict(sorted(self.files.items())),
+            }, separators=(',', ':'))
+
+    def save(self, outputs=None):
+        """Write the cache if anything was added; returns True if the file changed"""
+        if not self.changed:
+            return False
+        self.changed = False
+        return (outputs or Outputs()).write_text(META_JSON, self.to_json())
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Fill the image metadata cache for every project image')
+    parser.add_argument('--jobs', type=int, default=None, help='decoding threads')
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(os.path.dirname(script_dir))
+
+    cache = ImageMetaCache.load()
+    known = len(cache.images)
+    paths = [path for path in project_files() if path.lower().endswith(MEDIA_EXTENSIONS)]
+    metas = cache.fill(paths, workers=args.jobs)
+    cache.save()
+    print(f"✓ {len(metas)} of {len(paths)} images described, {len(cache.images) - known} decoded")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Image order for project pages, kept in a small manifest until published
+
+Project images are named 01_image.jpg, 02_image.png, ... in page order.
+Reordering them in the admin used to rename every file twice. Instead, the
+new order is written to projects/<slug>/image-order.json and the page is
+rendered with the files in that order under their current names. Publishing
+renames the files to match the order, rewrites the page's image references
+and removes the manifest.
+
+Usage:
+    python3 _dev/image_order.py          # publish every project with a pending order
+    python3 _dev/image_order.py SLUG...  # publish the given projects
+"""
+
+import json
+import os
+import re
+import sys
+
+ORDER_JSON = 'image-order.json'
+
+IMAGE_SRC_RE = re.compile(r'(?<=images/)(\d+_image\.\w+)')
+
+
+def list_numbered_images(images_dir):
+    """Numbered project images (01_image.jpg, ...) in order, without the cover"""
+    if not os.path.exists(images_dir):
+        return []
+    return sorted(
+        [f for f in os.listdir(images_dir) if f[:1].isdigit()],
+        key=lambda x: int(x.split('_')[0]) if '_' in x else 0
+    )
+
+
+def image_order(project_dir):
+    """Image file names in page order (the manifest's, else by number)"""
+    images_dir = os.path.join(project_dir, 'images')
+    numbered = list_numbered_images(images_dir)
+    order_path = os.path.join(project_dir, ORDER_JSON)
+    if not os.path.exists(order_path):
+        return numbered
+
+    with open(order_path, 'r', encoding='utf-8') as f:
+        ordered = json.load(f)['images']
+    # Ignore files that have gone; keep any new ones at the end
+    present = set(numbered)
+    ordered = [name for name in ordered if name in present]
+    return ordered + [name for name in numbered if name not in ordered]
+
+
+def set_image_order(project_dir, images):
+    """Record the page order of a project's images (no files are renamed)"""
+    order_path = os.path.join(project_dir, ORDER_JSON)
+    if images == list_numbered_images(os.path.join(project_dir, 'images')):
+        # Already the numbered order; nothing to publish
+        clear_image_order(project_dir)
+        return
+
+    with open(order_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': 1, 'images': images}, f, indent=2)
+
+
+def clear_image_order(project_dir):
+    """Drop a pending order (after the numbered files were rewritten)"""
+    order_path = os.path.join(project_dir, ORDER_JSON)
+    if os.path.exists(order_path):
+        os.remove(order_path)
+
+
+def publish_image_order(project_dir):
+    """Rename images to match the pending order; returns {old name: new name}"""
+    images_dir = os.path.join(project_dir, 'images')
+    order = image_order(project_dir)
+    renames = {
+        name: f"{idx:02d}_image{os.path.splitext(name)[1]}"
+        for idx, name in enumerate(order, start=1)
+    }
+    renames = {old: new for old, new in renames.items() if old != new}
+
+    # Via temporary names, so swapped files don't overwrite each other
+    for old in renames:
+        os.rename(os.path.join(images_dir, old), os.path.join(images_dir, f"temp_{old}"))
+    for old, new in renames.items():
+        os.rename(os.path.join(images_dir, f"temp_{old}"), os.path.join(images_dir, new))
+
+    html_path = os.path.join(project_dir, 'index.html')
+    if renames and os.path.exists(html_path):
+        with open(html_path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        html = IMAGE_SRC_RE.sub(lambda m: renames.get(m.group(1), m.group(1)), html)
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+
+    clear_image_order(project_dir)
+    return renames
+
+
+def pending_projects(projects_dir='projects'):
+    """Slugs of projects with an unpublished image order"""
+    return sorted(
+        slug for slug in os.listdir(projects_dir)
+        if os.path.exists(os.path.join(projects_dir, slug, ORDER_JSON))
+    )
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(os.path.dirname(script_dir))
+
+    slugs = sys.argv[1:] or pending_projects()
+    for slug in slugs:
+        renames = publish_image_order(os.path.join('projects', slug))
+        print(f"✓ {slug}: renamed {len(renames)} images")
+    if not slugs:
+        print("No pending image orders")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Shared access to projects-data.json
+
+Every script that rewrites the project listing goes through save_projects()
+so the artifacts derived from it (the pre-rendered gallery in index.html,
+search-index.json, facet-index.json, the sw.js precache manifest and
+_dev/slug-index.json) never drift out of sync with the JSON.
+
+Paths are relative to the project root; callers chdir there first.
+"""
+
+import json
+
+from outputs import Outputs
+
+PROJECTS_JSON = 'projects-data.json'
+
+
+def year_key(project):
+    """Sort key for the "by Year" view (matches parseInt(year) || 0 in script.js)"""
+    year = project.get('year', '')
+    return int(year) if year.isdigit() else 0
+
+
+def load_projects():
+    """Load the project listing"""
+    with open(PROJECTS_JSON, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_listing(projects, outputs=None):
+    """Write projects-data.json alone (build.py refreshes the rest as its own stage)"""
+    outputs = outputs or Outputs()
+    outputs.write_text(PROJECTS_JSON, json.dumps(projects, indent=2, ensure_ascii=False))
+
+
+def save_projects(projects, outputs=None):
+    """Write the project listing and refresh everything derived from it"""
+    outputs = outputs or Outputs()
+    write_listing(projects, outputs)
+    refresh_derived(projects, outputs)
+
+
+def refresh_derived(projects, outputs=None):
+    """Regenerate the static artifacts built from the listing (unchanged files aren't rewritten)"""
+    import facet_index
+    import gallery_prerender
+    import search_index
+    import service_worker
+    import slugs
+
+    outputs = outputs or Outputs()
+    slugs.write_slug_index(projects, outputs)
+    gallery_prerender.prerender_index(projects, outputs)
+    search_index.write_search_index(projects, outputs)
+    facet_index.write_facet_index(projects, outputs)
+    # Last: its manifest hashes the files written above
+    service_worker.write_service_worker(projects, outputs)
+
+
+if __name__ == '__main__':
+    import argparse
+    import os
+
+    from outputs import add_arguments
+
+    parser = argparse.ArgumentParser(description='Refresh the artifacts derived from projects-data.json')
+    add_arguments(parser)
+    outputs = Outputs.from_args(parser.parse_args())
+
+    # Get the project root directory (parent of _dev folder)
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(os.path.dirname(script_dir))
+
+    refresh_derived(load_projects(), outputs)
+    print("✓ Refreshed artifacts derived from projects-data.json")
+    outputs.print_summary()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Content-addressed media store shared by all project folders
+
+Each distinct image is stored once as media/<ab>/<sha256>.<ext>; the files in
+projects/<slug>/images/ are relative symlinks to it, so a photo used by
+several projects (or imported twice) takes space once. Blobs are reference
+counted by the links pointing at them: deleting a project frees the blobs no
+other project uses. The deploy workflow replaces the links with the files
+before uploading the site, so URLs and the published pages don't change.
+
+Usage:
+    python3 _dev/media_store.py             # report links, blobs and orphans
+    python3 _dev/media_store.py --migrate   # move existing project images into the store
+    python3 _dev/media_store.py --gc        # delete blobs nothing links to
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+from collections import Counter
+
+MEDIA_DIR = 'media'
+PROJECTS_DIR = 'projects'
+
+# File types kept in the store (videos stay as plain files)
+MEDIA_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+
+def content_hash(path):
+    """sha256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def blob_path(digest, ext):
+    """Store path for content with this hash"""
+    return os.path.join(MEDIA_DIR, digest[:2], f'{digest}{ext.lower()}')
+
+
+def linked_blob(path):
+    """Store path a project file links to, or None for a plain file"""
+    if not os.path.islink(path):
+        return None
+    target = os.path.normpath(os.path.join(os.path.dirname(path), os.readlink(path)))
+    if os.path.commonpath([target, MEDIA_DIR]) != MEDIA_DIR:
+        return None
+    return target
+
+
+def store_file(src_path, dest_path, move=False):
+    """Put src_path's content in the store and link dest_path to it; returns the blob path
+
+    An existing dest_path is replaced, never written through, so a blob
+    shared with other projects is left untouched.
+    """
+    blob = blob_path(content_hash(src_path), os.path.splitext(src_path)[1])
+    if not os.path.exists(blob):
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        temp_blob = f'{blob}.tmp'
+        if move and not os.path.islink(src_path):
+            shutil.move(src_path, temp_blob)
+        else:
+            shutil.copyfile(src_path, temp_blob)
+        os.replace(temp_blob, blob)
+    elif move and not os.path.samefile(src_path, blob):
+        os.remove(src_path)
+
+    if os.path.lexists(dest_path):
+        os.remove(dest_path)
+    os.symlink(os.path.relpath(blob, os.path.dirname(dest_path)), dest_path)
+    return blob
+
+
+def project_files():
+    """Every file in the projects' images/ folders"""
+    if not os.path.isdir(PROJECTS_DIR):
+        return
+    for slug in sorted(os.listdir(PROJECTS_DIR)):
+        images_dir = os.path.join(PROJECTS_DIR, slug, 'images')
+        if os.path.isdir(images_dir):
+            for name in sorted(os.listdir(images_dir)):
+                yield os.path.join(images_dir, name)
+
+
+def reference_counts():
+    """Number of project links to each blob"""
+    return Counter(blob for blob in map(linked_blob, project_files()) if blob)
+
+
+def stored_blobs():
+    """Every blob in the store"""
+    if not os.path.isdir(MEDIA_DIR):
+        return []
+    return sorted(
+        os.path.join(MEDIA_DIR, prefix, name)
+        for prefix in os.listdir(MEDIA_DIR)
+        if os.path.isdir(os.path.join(MEDIA_DIR, prefix))
+        for name in os.listdir(os.path.join(MEDIA_DIR, prefix))
+        if not name.endswith('.tmp')
+    )
+
+
+def remove_unreferenced(candidates=None):
+    """Delete blobs no project links to (only among `candidates` if given); returns them"""
+    counts = reference_counts()
+    blobs = stored_blobs() if candidates is None else sorted(set(candidates))
+    freed = [blob for blob in blobs if counts[blob] == 0 and os.path.exists(blob)]
+    for blob in freed:
+        os.remove(blob)
+    return freed
+
+
+def release_project(project_dir):
+    """Remove a project folder and the blobs only it used; returns the freed blobs"""
+    images_dir = os.path.join(project_dir, 'images')
+    blobs = []
+    if os.path.isdir(images_dir):
+        blobs = [linked_blob(os.path.join(images_dir, name)) for name in os.listdir(images_dir)]
+    shutil.rmtree(project_dir)
+    return remove_unreferenced([blob for blob in blobs if blob])
+
+
+def migrate():
+    """Replace plain project images with links into the store; returns (files, bytes saved)"""
+    moved = 0
+    saved = 0
+    for path in project_files():
+        if os.path.islink(path) or not path.lower().endswith(MEDIA_EXTENSIONS):
+            continue
+        size = os.path.getsize(path)
+        blob = blob_path(content_hash(path), os.path.splitext(path)[1])
+        if os.path.exists(blob):
+            saved += size
+        store_file(path, path, move=True)
+        moved += 1
+    return moved, saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage the shared media store')
+    parser.add_argument('--migrate', action='store_true',
+                        help='move plain project images into the store')
+    parser.add_argument('--gc', action='store_true',
+                        help='delete blobs no project links to')
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(os.path.dirname(script_dir))
+
+    if args.migrate:
+        moved, saved = migrate()
+        print(f"✓ Moved {moved} images into {MEDIA_DIR}/ ({saved / 1e6:.1f} MB of duplicates removed)")
+
+    if args.gc:
+        freed = remove_unreferenced()
+        print(f"✓ Deleted {len(freed)} unreferenced blobs")
+
+    counts = reference_counts()
+    blobs = stored_blobs()
+    orphans = [blob for blob in blobs if counts[blob] == 0]
+    shared = [blob for blob, count in counts.items() if count > 1]
+    print(f"{sum(counts.values())} links to {len(blobs)} blobs "
+          f"({len(shared)} shared, {len(orphans)} unreferenced)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Write generated files only when their bytes change
+
+Generators send every file they produce through an Outputs object. Content
+identical to what is on disk is not rewritten, so a no-op rebuild leaves the
+tree (and git, and visitors' caches) untouched. With --dry-run nothing is
+written at all: planned content is kept in memory, and later steps that read
+a planned file (the derived artifacts, the sw.js hashes) see the new version.
+Each run ends with a summary of created, changed, unchanged and removed files.
+"""
+
+import difflib
+import hashlib
+import os
+import shutil
+
+from media_store import content_hash, store_file
+
+
+def add_arguments(parser):
+    """Add --dry-run and --diff to a generator's argument parser"""
+    parser.add_argument('--dry-run', action='store_true',
+                        help='compute outputs and report changes without writing anything')
+    parser.add_argument('--diff', action='store_true',
+                        help='print a unified diff for each changed text file')
+
+
+class Outputs:
+    """Tracks what a generator writes (or would write)"""
+
+    def __init__(self, dry_run=False, diff=False):
+        self.dry_run = dry_run
+        self.diff = diff
+        self.pending = {}  # path -> bytes planned in a dry run
+        self.removed_paths = set()
+        self.status = {}   # path -> 'created' | 'changed' | 'unchanged' | 'removed'
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(dry_run=args.dry_run, diff=args.diff)
+
+    def exists(self, path):
+        if path in self.removed_paths:
+            return False
+        return path in self.pending or os.path.exists(path)
+
+    def read_bytes(self, path):
+        """Current content of a file, including changes planned in a dry run"""
+        if path in self.pending:
+            return self.pending[path]
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def read_text(self, path):
+        return self.read_bytes(path).decode('utf-8')
+
+    def hash(self, path):
+        """sha256 of a file's (possibly planned) content"""
+        if path in self.pending:
+            return hashlib.sha256(self.pending[path]).hexdigest()
+        return content_hash(path)
+
+    def write_text(self, path, content):
+        """Write text if it differs from the file; returns True if it changed"""
+        return self.write_bytes(path, content.encode('utf-8'))
+
+    def write_bytes(self, path, data):
+        old = self.read_bytes(path) if self.exists(path) else None
+        if old == data:
+            self._record(path, 'unchanged')
+            return False
+
+        if self.diff and old is not None:
+            self._print_diff(path, old, data)
+        self._record(path, 'created' if old is None else 'changed')
+
+        if self.dry_run:
+            self.pending[path] = data
+        else:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(data)
+        self.removed_paths.discard(path)
+        return True
+
+    def store(self, src_path, dest_path):
+        """Link dest_path to src_path's content in the media store, if it differs"""
+        if self.exists(dest_path) and self.hash(dest_path) == content_hash(src_path):
+            self._record(dest_path, 'unchanged')
+            return False
+
+        self._record(dest_path, 'changed' if self.exists(dest_path) else 'created')
+        if self.dry_run:
+            self.pending[dest_path] = self._read_file(src_path)
+        else:
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            store_file(src_path, dest_path)
+        self.removed_paths.discard(dest_path)
+        return True
+
+    def copy(self, src_path, dest_path):
+        """Copy a file as a plain file (not via the store), if the bytes differ"""
+        if self.exists(dest_path) and self.hash(dest_path) == content_hash(src_path):
+            self._record(dest_path, 'unchanged')
+            return False
+
+        self._record(dest_path, 'changed' if self.exists(dest_path) else 'created')
+        if self.dry_run:
+            self.pending[dest_path] = self._read_file(src_path)
+        else:
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            if os.path.islink(dest_path):
+                # Replace the link rather than write into a shared blob
+                os.remove(dest_path)
+            shutil.copy2(src_path, dest_path)
+        self.removed_paths.discard(dest_path)
+        return True
+
+    def remove(self, path):
+        """Delete a stale output"""
+        if not self.exists(path):
+            return False
+        self._record(path, 'removed')
+        self.pending.pop(path, None)
+        self.removed_paths.add(path)
+        if not self.dry_run and os.path.lexists(path):
+            os.remove(path)
+        return True
+
+    def _read_file(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def _record(self, path, status):
+        # A file written twice in one run keeps its first real change
+        if self.status.get(path) in ('created', 'changed') and status == 'unchanged':
+            return
+        self.status[path] = status
+
+    def _print_diff(self, path, old, new):
+        try:
+            old_lines = old.decode('utf-8').splitlines(keepends=True)
+            new_lines = new.decode('utf-8').splitlines(keepends=True)
+        except UnicodeDecodeError:
+            print(f"Binary file {path} differs")
+            return
+        print(''.join(difflib.unified_diff(old_lines, new_lines, f'a/{path}', f'b/{path}')), end='')
+
+    def changed_paths(self):
+        return sorted(p for p, s in self.status.items() if s != 'unchanged')
+
+    def print_summary(self):
+        counts = {s: 0 for s in ('created', 'changed', 'unchanged', 'removed')}
+        for status in self.status.values():
+            counts[status] += 1
+
+        marks = {'created': '+', 'changed': '~', 'removed': '-'}
+        for path in self.changed_paths():
+            print(f"  {marks[self.status[path]]} {path}")
+
+        note = ' (dry run: nothing written)' if self.dry_run else ''
+        print(f"✓ {counts['created']} created, {counts['changed']} changed, "
+              f"{counts['unchanged']} unchanged, {counts['removed']} removed{note}")
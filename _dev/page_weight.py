@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Page-weight report for the project pages, checked against budgets
+
+For every projects/<slug>/index.html this adds up what a visit downloads:
+the page, its stylesheet, images and videos (each file once per page,
+external embeds not counted). Text files are counted as is and gzipped
+(level 9, as precompress.py does); images and videos are already compressed
+and count the same in both columns. Pages are ranked by transferred bytes.
+
+Budgets apply to the transferred (gzipped) bytes, per kind of resource
+(html, css, images, video, other) and in total. They are read from
+_dev/page-budgets.json:
+
+    {
+      "warn": {"total": "8 MB", "images": "6 MB"},
+      "fail": {"total": "60 MB"},
+      "pages": {"<slug>": {"fail": {"total": "80 MB"}}}
+    }
+
+"pages" overrides the defaults for single projects. A page over a "fail"
+budget makes the script exit with 1 (unless --warn-only), so deploy.sh stops
+before pushing it. References that don't resolve are listed but weigh
+nothing; check_links.py reports them.
+
+Usage:
+    python3 _dev/page_weight.py                  # top 20 pages and budget results
+    python3 _dev/page_weight.py --top 0          # every page
+    python3 _dev/page_weight.py --json weights.json
+    python3 _dev/page_weight.py --warn-only
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from check_links import PageReferences, classify, resolve_local
+from critical_css import project_pages
+
+BUDGETS_JSON = os.path.join('_dev', 'page-budgets.json')
+REPORT_VERSION = 1
+
+KINDS = ('html', 'css', 'images', 'video', 'other')
+KIND_EXTENSIONS = {
+    'html': ('.html',),
+    'css': ('.css',),
+    'images': ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.avif'),
+    'video': ('.mp4', '.mov', '.webm', '.m4v', '.ogv'),
+}
+# Served gzipped; everything else is sent as is
+TEXT_EXTENSIONS = ('.html', '.css', '.js', '.json', '.svg', '.xml', '.txt')
+# Tags whose references are downloaded with the page (not links to other pages)
+RESOURCE_TAGS = ('img', 'video', 'source', 'link')
+
+SIZE_RE = re.compile(r'^\s*([\d.]+)\s*([KMG]?B?)\s*$', re.I)
+SIZE_UNITS = {'': 1, 'B': 1, 'K': 1024, 'KB': 1024, 'M': 1024 ** 2, 'MB': 1024 ** 2,
+              'G': 1024 ** 3, 'GB': 1024 ** 3}
+
+
+def parse_size(value):
+    """Bytes from 1500, "500 KB" or "2.5 MB" """
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = SIZE_RE.match(str(value))
+    if not match:
+        raise ValueError(f"not a size: {value!r}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+
+def format_size(size):
+    for unit, factor in (('MB', 1024 ** 2), ('KB', 1024)):
+        if size >= factor:
+            return f"{size / factor:.1f} {unit}"
+    return f"{size} B"
+
+
+def resource_kind(path):
+    ext = os.path.splitext(path)[1].lower()
+    return next((kind for kind, exts in KIND_EXTENSIONS.items() if ext in exts), 'other')
+
+
+def file_weight(path):
+    """(bytes, bytes transferred) of one file; None if it doesn't exist"""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return None
+    if not path.lower().endswith(TEXT_EXTENSIONS):
+        return size, size
+    with open(path, 'rb') as f:
+        compressed = len(gzip.compress(f.read(), compresslevel=9, mtime=0))
+    return size, min(size, compressed)
+
+
+def page_resources(page):
+    """Local files a page loads, in order, the page itself first"""
+    parser = PageReferences()
+    with open(page, 'r', encoding='utf-8') as f:
+        parser.feed(f.read())
+    resources = [page]
+    for tag, url in parser.refs:
+        if tag in RESOURCE_TAGS and classify(url) == 'local':
+            target = resolve_local(page, url)
+            if target not in resources:
+                resources.append(target)
+    return resources
+
+
+def measure_pages(pages, workers=None):
+    """[{page, slug, kinds: {kind: [bytes, transferred]}, total, transferred, missing}]"""
+    resources = {page: page_resources(page) for page in pages}
+    files = sorted({path for paths in resources.values() for path in paths})
+    # Shared files (styles.css) are measured once
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        weights = dict(zip(files, pool.map(file_weight, files)))
+
+    results = []
+    for page in pages:
+        kinds = {kind: [0, 0] for kind in KINDS}
+        missing = []
+        for path in resources[page]:
+            weight = weights[path]
+            if weight is None:
+                missing.append(path)
+                continue
+            kind = resource_kind(path)
+            kinds[kind][0] += weight[0]
+            kinds[kind][1] += weight[1]
+        results.append({
+            'page': page,
+            'slug': os.path.basename(os.path.dirname(page)),
+            'kinds': kinds,
+            'total': sum(size for size, _ in kinds.values()),
+            'transferred': sum(transferred for _, transferred in kinds.values()),
+            'missing': missing,
+        })
+    results.sort(key=lambda result: result['transferred'], reverse=True)
+    return results
+
+
+def load_budgets(path=BUDGETS_JSON):
+    """{'warn': {kind: bytes}, 'fail': {...}, 'pages': {slug: {'warn': ..., 'fail': ...}}}"""
+    if not os.path.exists(path):
+        return {'warn': {}, 'fail': {}, 'pages': {}}
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    def sizes(levels):
+        return {level: {kind: parse_size(value) for kind, value in levels.get(level, {}).items()}
+                for level in ('warn', 'fail')}
+
+    budgets = sizes(config)
+    budgets['pages'] = {slug: sizes(levels) for slug, levels in config.get('pages', {}).items()}
+    unknown = {kind for levels in [budgets, *budgets['pages'].values()]
+               for level in ('warn', 'fail') for kind in levels[level]} - {*KINDS, 'total'}
+    if unknown:
+        raise ValueError(f"unknown budget(s) in {path}: {', '.join(sorted(unknown))}")
+    return budgets
+
+
+def check_budgets(result, budgets):
+    """[(level, kind, transferred, budget)] for every budget the page is over"""
+    overrides = budgets['pages'].get(result['slug'], {})
+    transferred = {kind: result['kinds'][kind][1] for kind in KINDS}
+    transferred['total'] = result['transferred']
+    over = []
+    for level in ('fail', 'warn'):
+        limits = {**budgets[level], **overrides.get(level, {})}
+        for kind, limit in limits.items():
+            if transferred[kind] > limit and not any(k == kind for _, k, _, _ in over):
+                over.append((level, kind, transferred[kind], limit))
+    return over
+
+
+def build_report(budgets, workers=None):
+    results = measure_pages(project_pages(), workers)
+    for result in results:
+        result['over'] = [
+            {'level': level, 'kind': kind, 'transferred': size, 'budget': limit}
+            for level, kind, size, limit in check_budgets(result, budgets)
+        ]
+    return {
+        'version': REPORT_VERSION,
+        'pages': results,
+        'total': sum(result['total'] for result in results),
+        'transferred': sum(result['transferred'] for result in results),
+        'warnings': sum(1 for r in results for o in r['over'] if o['level'] == 'warn'),
+        'failures': sum(1 for r in results for o in r['over'] if o['level'] == 'fail'),
+    }
+
+
+def budget_message(slug, over):
+    """One line for a budget a page is over: its size, the excess and the limit"""
+    icon = '❌' if over['level'] == 'fail' else '⚠️ '
+    excess = over['transferred'] - over['budget']
+    return (f"{icon} {slug}: {over['kind']} {format_size(over['transferred'])} transferred, "
+            f"{format_size(excess)} over the {over['level']} budget of {format_size(over['budget'])}")
+
+
+def print_budget_results(report):
+    """The budget lines of a report"""
+    for result in report['pages']:
+        for over in result['over']:
+            print(budget_message(result['slug'], over))
+
+
+def print_report(report, top=20):
+    pages = report['pages'][:top] if top else report['pages']
+    print(f"{'transferred':>11} {'raw':>10} {'html':>9} {'images':>10} {'video':>10}  page")
+    for result in pages:
+        kinds = result['kinds']
+        print(f"{format_size(result['transferred']):>11} {format_size(result['total']):>10} "
+              f"{format_size(kinds['html'][1]):>9} {format_size(kinds['images'][1]):>10} "
+              f"{format_size(kinds['video'][1]):>10}  {result['slug']}")
+    if top and len(report['pages']) > top:
+        print(f"  ... {len(report['pages']) - top} lighter pages (--top 0 lists them all)")
+
+    print()
+    for result in report['pages']:
+        for over in result['over']:
+            print(budget_message(result['slug'], over))
+        if result['missing']:
+            print(f"   {result['slug']}: {len(result['missing'])} missing file(s) not counted")
+    print(f"✓ {len(report['pages'])} pages, {format_size(report['transferred'])} transferred "
+          f"({format_size(report['total'])} uncompressed); "
+          f"{report['warnings']} warning(s), {report['failures']} failure(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rank project pages by weight and check them against budgets')
+    parser.add_argument('--budgets', default=BUDGETS_JSON, help=f'budget file (default: {BUDGETS_JSON})')
+    parser.add_argument('--top', type=int, default=20, help='pages to list, heaviest first (0: all)')
+    parser.add_argument('--json', metavar='PATH', help="write the full report as JSON ('-' for stdout)")
+    parser.add_argument('--warn-only', action='store_true', help="don't fail on pages over a fail budget")
+    parser.add_argument('--jobs', type=int, default=None, help='threads measuring files')
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(os.path.dirname(script_dir))
+
+    try:
+        budgets = load_budgets(args.budgets)
+    except ValueError as e:
+        sys.exit(f"❌ {e}")
+    report = build_report(budgets, workers=args.jobs)
+
+    if args.json == '-':
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+        print_report(report, args.top)
+    sys.exit(1 if report['failures'] and not args.warn_only else 0)
+
+
+if __name__ == '__main__':
+    main()
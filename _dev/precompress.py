@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Precompressed .gz and .br siblings for the site's text files
+
+Every page, stylesheet, script and JSON file gets a gzip (level 9) and a
+brotli (quality 11) copy next to it, compressed once on a thread pool
+instead of on every request. The admin server and the preview server pick a
+sibling by the request's Accept-Encoding (precompressed_variant); a sibling
+older than its source is ignored, so a page edited after the last build is
+still served fresh, just uncompressed.
+
+Output is deterministic (no timestamps in the gzip header) and written
+through Outputs, so unchanged siblings are left alone. A sibling that
+wouldn't be smaller than its source is not kept. brotli is optional
+(`pip install brotli`); without it only .gz files are written.
+
+The siblings are build output and are not committed (.gitignore).
+
+Usage:
+    python3 _dev/precompress.py [--dry-run]
+"""
+
+import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from outputs import Outputs, add_arguments
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE = ('.html', '.css', '.js', '.json', '.svg', '.xml', '.txt')
+# Not part of the published site (media/ is resolved away by the deploy workflow)
+SKIPPED_DIRS = ('_dev', 'media', 'notion-page', 'node_modules')
+
+# Content-Encoding -> sibling suffix, in order of preference
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def compress(data, encoding):
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data, quality=11)
+
+
+def available_encodings():
+    return [(encoding, suffix) for encoding, suffix in ENCODINGS
+            if encoding != 'br' or brotli is not None]
+
+
+def compressible_files(root='.'):
+    """Site files worth precompressing, relative to root"""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames
+                             if not d.startswith('.') and not (dirpath == root and d in SKIPPED_DIRS))
+        for name in sorted(filenames):
+            if name.endswith(COMPRESSIBLE) and not name.startswith('.'):
+                files.append(os.path.relpath(os.path.join(dirpath, name), root))
+    return files
+
+
+def compress_file(path, outputs):
+    """Write path's siblings; returns {suffix: compressed size or None if not kept}"""
+    data = outputs.read_bytes(path)
+    sizes = {}
+    for encoding, suffix in available_encodings():
+        sibling = path + suffix
+        compressed = compress(data, encoding)
+        if len(compressed) >= len(data):
+            outputs.remove(sibling)
+            sizes[suffix] = None
+            continue
+        if not outputs.write_bytes(sibling, compressed) and not outputs.dry_run:
+            # Same bytes as before: mark it current for the freshness check
+            if os.path.getmtime(sibling) < os.path.getmtime(path):
+                os.utime(sibling)
+        sizes[suffix] = len(compressed)
+    return sizes
+
+
+def stale_siblings(files, root='.'):
+    """.gz/.br files whose source is gone"""
+    sources = set(files)
+    stale = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames
+                       if not d.startswith('.') and not (dirpath == root and d in SKIPPED_DIRS)]
+        for name in filenames:
+            for _encoding, suffix in ENCODINGS:
+                if name.endswith(suffix):
+                    path = os.path.relpath(os.path.join(dirpath, name), root)
+                    if path[:-len(suffix)].endswith(COMPRESSIBLE) and path[:-len(suffix)] not in sources:
+                        stale.append(path)
+    return stale
+
+
+def precompress_site(outputs=None, workers=None):
+    """Compress every site text file in parallel; returns (files, bytes in, bytes out per suffix)"""
+    outputs = outputs or Outputs()
+    files = compressible_files()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda path: compress_file(path, outputs), files))
+    for path in stale_siblings(files):
+        outputs.remove(path)
+
+    total_in = sum(len(outputs.read_bytes(path)) for path in files)
+    total_out = {}
+    for path, sizes in zip(files, results):
+        for suffix, size in sizes.items():
+            total_out[suffix] = total_out.get(suffix, 0) + (size or len(outputs.read_bytes(path)))
+    return len(files), total_in, total_out
+
+
+def parse_accept_encoding(header):
+    """{coding: q} from an Accept-Encoding header"""
+    accepted = {}
+    for item in (header or '').split(','):
+        coding, _, params = item.strip().partition(';')
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def precompressed_variant(path, accept_encoding):
+    """(file to send, Content-Encoding or None) for a request for path"""
+    if not path.endswith(COMPRESSIBLE):
+        return path, None
+    accepted = parse_accept_encoding(accept_encoding)
+    try:
+        source_mtime = os.path.getmtime(path)
+    except OSError:
+        return path, None
+    for encoding, suffix in ENCODINGS:
+        if accepted.get(encoding, accepted.get('*', 0)) <= 0:
+            continue
+        sibling = path + suffix
+        try:
+            if os.path.getmtime(sibling) >= source_mtime:
+                return sibling, encoding
+        except OSError:
+            continue
+    return path, None
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Write .gz/.br siblings for the site text files')
+    parser.add_argument('--jobs', type=int, default=None, help='compression threads')
+    add_arguments(parser)
+    args = parser.parse_args()
+    outputs = Outputs.from_args(args)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(os.path.dirname(script_dir))
+
+    count, total_in, total_out = precompress_site(outputs, workers=args.jobs)
+    for suffix, size in sorted(total_out.items()):
+        print(f"  {suffix}: {total_in / 1024:.0f} KB -> {size / 1024:.0f} KB")
+    if brotli is None:
+        print("  (brotli not installed: .br files skipped)")
+    print(f"✓ Precompressed {count} files")
+    outputs.print_summary()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Static preview of the site, served the way GitHub Pages serves it
+
+Replaces `python -m http.server` for checking the site before a deploy:
+- /dir/ and /dir serve dir/index.html (/dir redirects to /dir/ first), and
+  /page serves page.html when there is no such directory
+- unknown paths get 404.html if there is one
+- Cache-Control: max-age=600, ETag and Last-Modified, with 304 responses to
+  If-None-Match / If-Modified-Since
+- Range requests (single ranges) for videos and other large files
+- .br/.gz siblings from precompress.py, chosen by Accept-Encoding
+- dotfiles and media/ are hidden, as in the deployed artifact (project
+  images are symlinks into media/ and resolve normally)
+
+--bench runs a throughput benchmark against the server instead: a number of
+keep-alive clients request a set of paths and the requests/s and latency
+percentiles are printed.
+
+Usage:
+    python3 _dev/preview_server.py                    # http://localhost:8001/
+    python3 _dev/preview_server.py --port 8080
+    python3 _dev/preview_server.py --bench            # 2000 requests, 8 clients
+    python3 _dev/preview_server.py --bench --requests 10000 --concurrency 32 /index.html /styles.css
+"""
+
+import argparse
+import email.utils
+import http.client
+import mimetypes
+import os
+import posixpath
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from precompress import precompressed_variant
+
+CACHE_CONTROL = 'max-age=600'  # what GitHub Pages sends
+HIDDEN_DIRS = ('media',)
+COPY_CHUNK = 64 * 1024
+
+
+class SiteRequestHandler(BaseHTTPRequestHandler):
+    """GET/HEAD for the files under the server's root"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'PreviewServer'
+    # Headers and body are separate writes; with Nagle on, keep-alive
+    # responses stall on the client's delayed ACK (~40 ms each)
+    disable_nagle_algorithm = True
+    quiet = False
+
+    def do_GET(self):
+        self.serve(send_body=True)
+
+    def do_HEAD(self):
+        self.serve(send_body=False)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def resolve(self, url_path):
+        """(file path, redirect location) for a URL path; both None if not found"""
+        path = posixpath.normpath(unquote(url_path))
+        parts = [p for p in path.split('/') if p]
+        if any(p.startswith('.') for p in parts) or (parts and parts[0] in HIDDEN_DIRS):
+            return None, None
+
+        fs_path = os.path.join(self.server.root, *parts)
+        if os.path.isdir(fs_path):
+            if not url_path.endswith('/'):
+                return None, url_path + '/'
+            fs_path = os.path.join(fs_path, 'index.html')
+        elif not os.path.exists(fs_path) and os.path.isfile(fs_path + '.html'):
+            fs_path += '.html'
+        return (fs_path, None) if os.path.isfile(fs_path) else (None, None)
+
+    def serve(self, send_body):
+        url = urlsplit(self.path)
+        fs_path, redirect = self.resolve(url.path)
+        if redirect:
+            location = redirect + (f'?{url.query}' if url.query else '')
+            return self.send_empty(301, {'Location': location})
+        if fs_path is None:
+            not_found = os.path.join(self.server.root, '404.html')
+            if os.path.isfile(not_found):
+                return self.send_file(not_found, send_body, status=404)
+            return self.send_empty(404)
+        self.send_file(fs_path, send_body)
+
+    def send_file(self, fs_path, send_body, status=200):
+        variant, encoding = precompressed_variant(fs_path, self.headers.get('Accept-Encoding'))
+        stat = os.stat(variant)
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"'
+        last_modified = email.utils.formatdate(stat.st_mtime, usegmt=True)
+        headers = {
+            'Content-Type': mimetypes.guess_type(fs_path)[0] or 'application/octet-stream',
+            'Cache-Control': CACHE_CONTROL,
+            'ETag': etag,
+            'Last-Modified': last_modified,
+            'Accept-Ranges': 'bytes',
+            'Vary': 'Accept-Encoding',
+        }
+        if encoding:
+            headers['Content-Encoding'] = encoding
+
+        if status == 200 and self.not_modified(etag, stat.st_mtime):
+            return self.send_empty(304, {k: headers[k] for k in ('ETag', 'Last-Modified', 'Cache-Control', 'Vary')})
+
+        start, end = 0, stat.st_size - 1
+        range_header = self.headers.get('Range')
+        if status == 200 and range_header and self.range_applies(etag, stat.st_mtime):
+            byte_range = parse_range(range_header, stat.st_size)
+            if byte_range is None:
+                return self.send_empty(416, {'Content-Range': f'bytes */{stat.st_size}'})
+            if byte_range != (0, stat.st_size - 1):
+                start, end = byte_range
+                status = 206
+                headers['Content-Range'] = f'bytes {start}-{end}/{stat.st_size}'
+
+        headers['Content-Length'] = str(end - start + 1)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body:
+            with open(variant, 'rb') as f:
+                f.seek(start)
+                copy_range(f, self.wfile, end - start + 1)
+
+    def not_modified(self, etag, mtime):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [t.strip().removeprefix('W/') for t in if_none_match.split(',')]
+            return '*' in tags or etag in tags
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since
+        return False
+
+    def range_applies(self, etag, mtime):
+        """If-Range: serve the range only if the file is still the one the client has"""
+        if_range = self.headers.get('If-Range')
+        if not if_range:
+            return True
+        if if_range.startswith(('"', 'W/')):
+            return if_range == etag
+        try:
+            return int(mtime) <= email.utils.parsedate_to_datetime(if_range).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+    def send_empty(self, status, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+def parse_range(header, size):
+    """(start, end) of a single 'bytes=' range, or None if unsatisfiable
+
+    Multiple ranges are answered with the whole file, as a server may.
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip() != 'bytes' or ',' in spec:
+        return 0, size - 1
+    first, _, last = spec.strip().partition('-')
+    try:
+        if not first:
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length <= 0:
+                return None
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        return 0, size - 1
+    if start >= size or end < start:
+        return None
+    return start, end
+
+
+def copy_range(src, dest, length):
+    while length > 0:
+        chunk = src.read(min(COPY_CHUNK, length))
+        if not chunk:
+            break
+        dest.write(chunk)
+        length -= len(chunk)
+
+
+def make_server(root, host='127.0.0.1', port=8001, quiet=False):
+    handler = type('Handler', (SiteRequestHandler,), {'quiet': quiet})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.root = os.path.abspath(root)
+    return server
+
+
+def default_bench_paths(root):
+    """Home page, listing, CSS/JS and the first project page and cover"""
+    paths = ['/', '/projects-data.json', '/styles.css', '/script.js']
+    projects_dir = os.path.join(root, 'projects')
+    for slug in sorted(os.listdir(projects_dir)) if os.path.isdir(projects_dir) else []:
+        if os.path.isfile(os.path.join(projects_dir, slug, 'index.html')):
+            paths.append(f'/projects/{slug}/')
+            break
+    return paths
+
+
+def bench(host, port, paths, requests=2000, concurrency=8, accept_encoding='gzip, br'):
+    """Latencies (seconds) and wall time for `requests` GETs spread over the paths"""
+    counter = iter(range(requests))
+    lock = threading.Lock()
+    latencies = []
+    errors = []
+
+    def client():
+        conn = http.client.HTTPConnection(host, port, timeout=10)
+        local = []
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                break
+            path = paths[i % len(paths)]
+            started = time.perf_counter()
+            try:
+                conn.request('GET', path, headers={'Accept-Encoding': accept_encoding})
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 400:
+                    errors.append(f'{path}: HTTP {response.status}')
+            except (OSError, http.client.HTTPException) as e:
+                errors.append(f'{path}: {e}')
+                conn.close()
+                conn = http.client.HTTPConnection(host, port, timeout=10)
+                continue
+            local.append(time.perf_counter() - started)
+        conn.close()
+        with lock:
+            latencies.extend(local)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(client)
+    return latencies, time.perf_counter() - started, errors
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def print_bench(latencies, elapsed, errors):
+    latencies.sort()
+    print(f"Requests:   {len(latencies)} in {elapsed:.2f}s ({len(errors)} errors)")
+    print(f"Throughput: {len(latencies) / elapsed:.0f} requests/s")
+    print(f"Latency:    p50 {percentile(latencies, 0.50) * 1000:.2f} ms, "
+          f"p90 {percentile(latencies, 0.90) * 1000:.2f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f} ms, "
+          f"max {latencies[-1] * 1000 if latencies else 0:.2f} ms")
+    for error in errors[:5]:
+        print(f"  ✗ {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the site like GitHub Pages, or benchmark it')
+    parser.add_argument('paths', nargs='*', help='paths to request in --bench mode')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--bench', action='store_true', help='run a throughput benchmark and exit')
+    parser.add_argument('--requests', type=int, default=2000, help='requests in the benchmark')
+    parser.add_argument('--concurrency', type=int, default=8, help='keep-alive clients in the benchmark')
+    parser.add_argument('--accept-encoding', default='gzip, br',
+                        help="Accept-Encoding sent by the benchmark ('' for uncompressed)")
+    args = parser.parse_args()
+
+    # Get the project root directory (parent of _dev folder)
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    root = os.path.dirname(script_dir)
+
+    if not args.bench:
+        server = make_server(root, args.host, args.port)
+        print(f"Serving {root} at http://{args.host}:{args.port}/ (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    # Benchmark against a quiet server on a free port in this process
+    server = make_server(root, args.host, 0, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    paths = args.paths or default_bench_paths(root)
+    print(f"Benchmarking {', '.join(paths)} with {args.concurrency} clients")
+    latencies, elapsed, errors = bench(args.host, server.server_address[1], paths,
+                                       args.requests, args.concurrency, args.accept_encoding)
+    server.shutdown()
+    print_bench(latencies, elapsed, errors)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == '__main__':
+    main()
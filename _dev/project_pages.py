@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Render and parse project detail pages (projects/<slug>/index.html)
+
+Shared by the admin server for creating, editing and previewing projects.
+markdown, bs4 and markdownify are imported on first use so importing this
+module stays cheap. Pages come out with their critical CSS inlined
+(critical_css.py).
+"""
+
+from critical_css import inline_styles
+
+
+def render_markdown(text):
+    """Convert admin form Markdown to HTML"""
+    import markdown
+
+    md = markdown.Markdown(extensions=['extra', 'nl2br'])
+    return md.convert(text)
+
+
+def parse_project_html(html_path):
+    """Parse existing project HTML to extract content"""
+    from bs4 import BeautifulSoup
+    from markdownify import markdownify as md
+
+    try:
+        with open(html_path, 'r', encoding='utf-8') as f:
+            soup = BeautifulSoup(f.read(), 'html.parser')
+            
+            # Extract title
+            title_elem = soup.select_one('h1.page-title')
+            title = title_elem.get_text().strip() if title_elem else ''
+            
+            # Extract properties
+            properties = {}
+            for row in soup.select('.property-row'):
+                th = row.select_one('th')
+                td = row.select_one('td')
+                if th and td:
+                    key = th.get_text().strip().lower().replace('i did', 'role')
+                    if key == 'for':
+                        properties['collaborator'] = td.get_text().strip()
+                    elif key == 'year':
+                        properties['year'] = td.get_text().strip()
+                    elif key == 'official site':
+                        link = td.select_one('a')
+                        properties['official_site'] = link['href'] if link else ''
+                    elif key == 'role':
+                        tags = [tag.get_text().strip() for tag in td.select('.tag')]
+                        properties['role'] = ', '.join(tags)
+            
+            # Extract description and convert HTML back to Markdown
+            description_elem = soup.select_one('.page-body')
+            description = ''
+            if description_elem:
+                # Find all content before the images
+                content_parts = []
+                for child in description_elem.children:
+                    # Stop at images or hr
+                    if child.name in ['hr', 'div']:
+                        break
+                    if child.name == 'p':
+                        # Convert paragraph HTML to Markdown
+                        content_parts.append(md(str(child)).strip())
+                    elif child.name in ['ul', 'ol']:
+                        # Convert lists to Markdown
+                        content_parts.append(md(str(child)).strip())
+                    elif child.name and child.get_text().strip():
+                        # Other block elements
+                        content_parts.append(md(str(child)).strip())
+                
+                description = '\n\n'.join(content_parts) if content_parts else ''
+            
+            # Extract acknowledgment and convert HTML to Markdown - always populate so user can edit
+            acknowledgment = ''
+            ack_h3 = soup.find('h3', string='Acknowledgment')
+            if ack_h3:
+                # Get all content after the h3 until the next hr or end of page-body
+                ack_parts = []
+                for sibling in ack_h3.next_siblings:
+                    if sibling.name == 'p':
+                        # Convert paragraph HTML to Markdown
+                        ack_markdown = md(str(sibling)).strip()
+                        ack_parts.append(ack_markdown)
+                    elif sibling.name in ['ul', 'ol']:
+                        # Convert lists to Markdown
+                        ack_markdown = md(str(sibling)).strip()
+                        ack_parts.append(ack_markdown)
+                    elif sibling.name in ['h3', 'hr']:
+                        break
+                
+                if ack_parts:
+                    acknowledgment = '\n\n'.join(ack_parts)
+            
+            return {
+                'title': title,
+                'description': description.strip(),
+                'acknowledgment': acknowledgment,
+                **properties
+            }
+    except Exception as e:
+        print(f"Error parsing HTML: {e}")
+        return {}
+
+
+def render_properties(data):
+    """Rows of the properties table (for, Year, Official Site, I did)"""
+    collaborator = data['collaborator']
+    year = data['year']
+    official_site = data.get('official_site', '')
+    role = data.get('role', '')
+    
+    # Generate role tags
+    roles = [r.strip() for r in role.split(',')]
+    role_tags_html = ' '.join([f'<span class="tag">{r}</span>' for r in roles if r])
+    
+    # Generate official site row if present
+    official_site_row = ''
+    if official_site:
+        site_text = official_site.replace('https://', '').replace('http://', '').replace('www.', '')
+        if len(site_text) > 50:
+            site_text = 'View Project'
+        official_site_row = f"""
+                <tr class="property-row">
+                    <th><span class="icon">🔗</span>Official Site</th>
+                    <td><a href="{official_site}" target="_blank" class="url-value">{site_text}</a></td>
+                </tr>"""
+    
+    # Generate role row
+    role_row = ''
+    if role_tags_html:
+        role_row = f"""
+                <tr class="property-row">
+                    <th><span class="icon">📋</span>I did</th>
+                    <td>{role_tags_html}</td>
+                </tr>"""
+    
+    return f"""                    <tr class="property-row">
+                        <th><span class="icon">👤</span>for</th>
+                        <td>{collaborator}</td>
+                    </tr>
+                    <tr class="property-row">
+                        <th><span class="icon">#</span>Year</th>
+                        <td>{year}</td>
+                    </tr>{official_site_row}{role_row}"""
+
+
+def render_description(data):
+    """Description HTML from Markdown"""
+    description = data.get('description', '')
+    description_html = ''
+    if description:
+        # Parse Markdown to HTML
+        html = render_markdown(description)
+        # Indent for template
+        lines = html.split('\n')
+        description_html = '\n'.join([f'        {line}' if line else '' for line in lines])
+    return description_html
+
+
+def image_attributes(meta):
+    """width/height and placeholder color of an <img>, from image_meta.py metadata"""
+    if not meta:
+        return ''
+    return f' width="{meta["width"]}" height="{meta["height"]}" style="background-color:{meta["color"]}"'
+
+
+def render_images(data, images, image_base='images/', meta=None):
+    """Image gallery HTML: first two images side by side, the rest full width
+
+    meta maps image file names to their metadata (image_meta.py), if known.
+    """
+    name = data['name']
+    year = data['year']
+    meta = meta or {}
+    
+    images_html = ''
+    if len(images) > 0:
+        if len(images) == 1:
+            images_html = f"""
+        <div class="image-full">
+            <img src="{image_base}{images[0]}" alt="{name}, {year}" loading="lazy"{image_attributes(meta.get(images[0]))}>
+        </div>"""
+        elif len(images) >= 2:
+            images_html = f"""
+        <div class="image-grid">
+            <div class="image-column">
+                <img src="{image_base}{images[0]}" alt="{name}, {year}" loading="lazy"{image_attributes(meta.get(images[0]))}>
+            </div>
+            <div class="image-column">
+                <img src="{image_base}{images[1]}" alt="{name}, {year}" loading="lazy"{image_attributes(meta.get(images[1]))}>
+            </div>
+        </div>"""
+            
+            for img in images[2:]:
+                images_html += f"""
+        <div class="image-full">
+            <img src="{image_base}{img}" alt="{name}, {year}" loading="lazy"{image_attributes(meta.get(img))}>
+        </div>"""
+    return images_html
+
+
+def render_acknowledgment(data):
+    """Acknowledgment section (fixed text for Rafael Lozano-Hemmer projects)"""
+    collaborator = data['collaborator']
+    acknowledgment = data.get('acknowledgment', '')
+    
+    acknowledgment_html = ''
+    is_rlh = 'rafael lozano-hemmer' in collaborator.lower()
+    
+    if is_rlh:
+        acknowledgment_html = """
+        <hr>
+        <h3>Acknowledgment</h3>
+        <p>This artwork by Rafael Lozano-Hemmer is the result of the combined efforts of a talented and diverse group of professionals. Each person has contributed unique skills and expertise to the creation of this piece. For more information about the team and their roles, please visit our <a href="https://www.lozano-hemmer.com/" target="_blank" class="url-value">official website</a>.</p>"""
+    elif acknowledgment:
+        # Parse Markdown for acknowledgment too
+        ack_html = render_markdown(acknowledgment)
+        lines = ack_html.split('\n')
+        ack_content = '\n'.join([f'        {line}' if line else '' for line in lines])
+        acknowledgment_html = f"""
+        <hr>
+        <h3>Acknowledgment</h3>
+{ack_content}"""
+    return acknowledgment_html
+
+
+def generate_html(data, images, meta=None):
+    """Generate project HTML (meta: image metadata by file name, see render_images)"""
+    name = data['name']
+    year = data['year']
+    
+    # Generate full HTML
+    html = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{name}, {year} - Stephan Schulz</title>
+    <link rel="stylesheet" href="../../styles.css">
+</head>
+<body>
+    <main class="container">
+        <div class="breadcrumb">
+            <a href="../../index.html">Stephan Schulz</a> / 
+            <a href="../../index.html">Projects and Artworks</a> / 
+            {name}, {year}
+        </div>
+
+        <header>
+            <h1 class="page-title">{name}, {year}</h1>
+            
+            <table class="properties">
+                <tbody>
+{render_properties(data)}
+                </tbody>
+            </table>
+        </header>
+
+        <hr class="properties-divider">
+
+        <div class="page-body">
+{render_description(data)}
+            
+{render_images(data, images, meta=meta)}
+{render_acknowledgment(data)}
+        </div>
+    </main>
+</body>
+</html>"""
+    
+    return inline_styles(html)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Build search-index.json, the inverted index behind the gallery search box
+
+Indexed text per project: name, collaborator, roles and the description
+paragraphs of its generated page (projects/<slug>/index.html, which is
+rendered from the Notion export or the admin Markdown).
+
+Format (doc ids are positions in "docs", which follows projects-data.json):
+
+    {"version": 2, "docs": [slug, ...], "stopwords": [word, ...],
+     "terms": [term, ...], "postings": [[id, ...], ...]}
+
+"terms" is sorted so script.js can binary-search a prefix and walk forward,
+answering as-you-type queries without fetching any project page. Stopwords
+and single characters are not indexed; script.js drops them from queries
+too, using "stopwords", so a full title always finds its project.
+"""
+
+import json
+import os
+import re
+import unicodedata
+from html.parser import HTMLParser
+
+from outputs import Outputs
+
+SEARCH_INDEX_JSON = 'search-index.json'
+INDEX_VERSION = 2
+
+TOKEN_RE = re.compile(r'[^\W_]+')
+STOPWORDS = {
+    'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'in', 'is',
+    'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'with',
+}
+
+
+def tokenize(text):
+    """Lowercase, strip accents and split into words (mirrors normalizeSearchText in script.js)"""
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return [t for t in TOKEN_RE.findall(text) if len(t) > 1 and t not in STOPWORDS]
+
+
+class PageBodyText(HTMLParser):
+    """Collect the description text of a generated project page
+
+    Reads <p>/<li> text inside .page-body up to the first <hr>, which is where
+    the acknowledgment starts (the same cut-off the edit server uses).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.in_body = False
+        self.done = False
+        self.capture = 0
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if not self.in_body:
+            classes = (dict(attrs).get('class') or '').split()
+            self.in_body = tag == 'div' and 'page-body' in classes
+        elif tag == 'hr':
+            self.done = True
+        elif tag in ('p', 'li'):
+            self.capture += 1
+
+    def handle_endtag(self, tag):
+        if self.in_body and tag in ('p', 'li') and self.capture:
+            self.capture -= 1
+
+    def handle_data(self, data):
+        if self.capture and not self.done:
+            self.parts.append(data)
+
+
+def page_description(slug, outputs=None):
+    """Description text of projects/<slug>/index.html ('' if there is no page)"""
+    outputs = outputs or Outputs()
+    html_path = os.path.join('projects', slug, 'index.html')
+    if not outputs.exists(html_path):
+        return ''
+
+    parser = PageBodyText()
+    parser.feed(outputs.read_text(html_path))
+    return ' '.join(parser.parts)
+
+
+def project_text(project, outputs=None):
+    """All searchable text for one listing entry"""
+    fields = [project['name'], project.get('collaborator', ''), project.get('role', '')]
+    if project.get('hasDetailPage'):
+        fields.append(page_description(project['slug'], outputs))
+    return ' '.join(fields)
+
+
+def build_search_index(projects, outputs=None):
+    """Build the index structure for a project listing"""
+    term_docs = {}
+    for doc_id, project in enumerate(projects):
+        for term in set(tokenize(project_text(project, outputs))):
+            term_docs.setdefault(term, []).append(doc_id)
+
+    terms = sorted(term_docs)
+    return {
+        'version': INDEX_VERSION,
+        'docs': [p['slug'] for p in projects],
+        'stopwords': sorted(STOPWORDS),
+        'terms': terms,
+        'postings': [term_docs[t] for t in terms],
+    }
+
+
+def write_search_index(projects, outputs=None):
+    """Write search-index.json; returns True if the file changed"""
+    outputs = outputs or Outputs()
+    content = json.dumps(build_search_index(projects, outputs), ensure_ascii=False, separators=(',', ':'))
+    return outputs.write_text(SEARCH_INDEX_JSON, content)
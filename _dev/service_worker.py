@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Generate sw.js, the service worker that caches the gallery for repeat visits
+
+The precache manifest lists every file the gallery needs with a hash of its
+contents, so a deploy only re-downloads what actually changed:
+- core files (listing JSON, indexes, CSS, JS) are fetched when the worker installs
+- project covers are cached the first time they are shown, not at install:
+  all of them together are several MB, more than a first visit should pay
+- HTML pages (home and project pages) are served stale-while-revalidate
+  from a cache capped at MAX_PAGES entries, oldest dropped first
+
+Both caches bypass the browser's HTTP cache when they fill, so an entry
+never holds the previous deploy's bytes under a new revision. Caches from
+older versions of the worker are deleted when it activates.
+"""
+
+import json
+
+from outputs import Outputs
+
+SERVICE_WORKER_JS = 'sw.js'
+# Project pages kept for offline and repeat visits
+MAX_PAGES = 40
+
+# Fetched up front; missing files are skipped
+CORE_FILES = [
+    'projects-data.json',
+    'search-index.json',
+    'facet-index.json',
+    'styles.css',
+    'script.js',
+]
+
+SW_TEMPLATE = '''// Generated by _dev/service_worker.py - do not edit by hand
+const CORE = __CORE__;
+const COVERS = __COVERS__;
+
+const PRECACHE = 'precache-v1';
+const PAGES = 'pages-v1';
+const MAX_PAGES = __MAX_PAGES__;
+
+const scope = new URL(self.registration.scope);
+const revisions = new Map([...CORE, ...COVERS].map(([path, rev]) => [new URL(path, scope).href, rev]));
+
+// One cache entry per content hash: unchanged files survive a deploy
+const revisionKey = (url, rev) => `${url}?__rev=${rev}`;
+
+// Project pages, also when fetched by the gallery's prefetch (not a navigation)
+const isProjectPage = url => url.pathname.startsWith(scope.pathname)
+    && /^projects\/[^/]+\/(index\.html)?$/.test(url.pathname.slice(scope.pathname.length));
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(PRECACHE);
+        await Promise.all(CORE.map(async ([path, rev]) => {
+            const url = new URL(path, scope).href;
+            const key = revisionKey(url, rev);
+            if (!(await cache.match(key))) {
+                const response = await fetch(url, { cache: 'no-cache' });
+                if (response.ok) {
+                    await cache.put(key, response);
+                }
+            }
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        // Drop revisions that are no longer in the manifest
+        const cache = await caches.open(PRECACHE);
+        const current = new Set([...revisions].map(([url, rev]) => revisionKey(url, rev)));
+        const keys = await cache.keys();
+        await Promise.all(keys.filter(request => !current.has(request.url)).map(request => cache.delete(request)));
+        // And caches of older workers
+        const names = await caches.keys();
+        await Promise.all(names.filter(name => name !== PRECACHE && name !== PAGES).map(name => caches.delete(name)));
+        await trimPages(await caches.open(PAGES));
+        await self.clients.claim();
+    })());
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') {
+        return;
+    }
+
+    const url = new URL(request.url);
+    url.hash = '';
+    if (url.origin !== scope.origin) {
+        return;
+    }
+
+    const rev = url.search ? undefined : revisions.get(url.href);
+    if (rev) {
+        event.respondWith(cacheFirst(url.href, rev));
+    } else if (request.mode === 'navigate' || request.destination === 'document' || isProjectPage(url)) {
+        event.respondWith(staleWhileRevalidate(event, request));
+    }
+});
+
+async function cacheFirst(url, rev) {
+    const cache = await caches.open(PRECACHE);
+    const key = revisionKey(url, rev);
+    const cached = await cache.match(key);
+    if (cached) {
+        return cached;
+    }
+    // Past the HTTP cache, which may still hold the previous revision
+    const response = await fetch(url, { cache: 'no-cache' });
+    if (response.ok) {
+        await cache.put(key, response.clone());
+    }
+    return response;
+}
+
+async function staleWhileRevalidate(event, request) {
+    const cache = await caches.open(PAGES);
+    const cached = await cache.match(request, { ignoreSearch: true });
+    const network = fetch(request, { cache: 'no-cache' }).then(async response => {
+        if (response.ok) {
+            await cache.put(request, response.clone());
+            await trimPages(cache);
+        }
+        return response;
+    });
+
+    if (cached) {
+        // Refresh in the background; the next visit gets the new page
+        event.waitUntil(network.catch(() => undefined));
+        return cached;
+    }
+    return network;
+}
+
+// Keep the most recently stored pages (keys() lists them oldest first)
+async function trimPages(cache) {
+    const keys = await cache.keys();
+    await Promise.all(keys.slice(0, Math.max(0, keys.length - MAX_PAGES)).map(request => cache.delete(request)));
+}
+'''
+
+
+def file_revision(path, outputs):
+    """Short content hash of a file (as written by this run)"""
+    return outputs.hash(path)[:12]
+
+
+def precache_manifest(projects, outputs):
+    """[path, revision] pairs for the core files and the project covers"""
+    core = [[path, file_revision(path, outputs)] for path in CORE_FILES if outputs.exists(path)]
+
+    covers = []
+    for image in dict.fromkeys(p['image'] for p in projects if p.get('image')):
+        if outputs.exists(image):
+            covers.append([image, file_revision(image, outputs)])
+
+    return core, covers
+
+
+def render_service_worker(projects, outputs=None):
+    """sw.js source with the manifest filled in"""
+    core, covers = precache_manifest(projects, outputs or Outputs())
+    core_js = json.dumps(core, ensure_ascii=False, separators=(',', ':'))
+    covers_js = json.dumps(covers, ensure_ascii=False, separators=(',', ':'))
+    return (SW_TEMPLATE.replace('__CORE__', core_js).replace('__COVERS__', covers_js)
+            .replace('__MAX_PAGES__', str(MAX_PAGES)))
+
+
+def write_service_worker(projects, outputs=None):
+    """Write sw.js; returns True if the file changed"""
+    outputs = outputs or Outputs()
+    return outputs.write_text(SERVICE_WORKER_JS, render_service_worker(projects, outputs))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Project slugs: the one slug function and an index of the slugs in use
+
+slugify() makes every new slug: case folding, Unicode decomposition with the
+accents dropped (ü -> u, ß -> ss, æ -> ae), "&" -> "and", apostrophes
+removed, and any other run of characters collapsed to a single "-".
+
+Published projects keep the slug their URL was made with, even where
+slugify() would now give a different one (grußt-unsre-berge-2000 rather than
+grusst-unsre-berge-2000); SlugIndex.slug_for() returns a known project's
+existing slug. The index (_dev/slug-index.json) maps every slug in
+projects-data.json to its project name and is rewritten with the listing's
+other derived files, so collision checks in the admin are dict lookups.
+
+Usage:
+    python3 _dev/slugs.py            # migration report: slugs slugify() would change
+    python3 _dev/slugs.py --json
+"""
+
+import json
+import os
+import re
+import sys
+import unicodedata
+
+from outputs import Outputs
+
+SLUG_INDEX_JSON = os.path.join('_dev', 'slug-index.json')
+SLUG_INDEX_VERSION = 1
+
+# Applied after casefold(): letters NFKD doesn't decompose, and the words and
+# marks that aren't separators
+FOLD = str.maketrans({
+    'æ': 'ae', 'œ': 'oe', 'ø': 'o', 'đ': 'd', 'ð': 'd', 'þ': 'th', 'ł': 'l', 'ı': 'i',
+    '&': ' and ', "'": None, '’': None, 'ʼ': None, '`': None,
+})
+SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+# The rules slugs were made with before slugify(), still used for the
+# assets/projects/<name>.<ext> cover paths
+LEGACY_SEPARATORS = str.maketrans({
+    '/': '-', ',': None, ':': None, '&': 'and', ' ': '-',
+    '(': None, ')': None, '+': '-',
+})
+LEGACY_LETTERS = str.maketrans({'é': 'e', 'ó': 'o', 'ü': 'u', "'": None})
+
+
+def slugify(text):
+    """URL slug for a project name: "Grüßt uns're Berge, 2000" -> grusst-unsre-berge-2000"""
+    text = unicodedata.normalize('NFKD', text.casefold().translate(FOLD))
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return SEPARATOR_RE.sub('-', text).strip('-')
+
+
+def legacy_slug(text):
+    """Slug by the old replace chains (kept byte-for-byte for existing file names)"""
+    slug = text.lower().replace(' / ', '-').translate(LEGACY_SEPARATORS)
+    slug = slug.replace('--', '-').replace('---', '-')
+    return slug.translate(LEGACY_LETTERS)
+
+
+class SlugIndex:
+    """slug -> project name for every project in the listing"""
+
+    def __init__(self, slugs=None):
+        self.slugs = dict(slugs or {})
+        self.by_name = {name: slug for slug, name in self.slugs.items()}
+
+    @classmethod
+    def from_projects(cls, projects):
+        return cls({p['slug']: p['name'] for p in projects})
+
+    @classmethod
+    def load(cls, path=SLUG_INDEX_JSON):
+        """The persisted index (empty if there is none yet)"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['slugs'] if data.get('version') == SLUG_INDEX_VERSION else {})
+
+    def owner(self, slug):
+        """Name of the project using slug, or None"""
+        return self.slugs.get(slug)
+
+    def slug_for(self, name):
+        """A project's existing slug, or a new one for a name not in the listing"""
+        return self.by_name.get(name) or slugify(name)
+
+    def to_json(self):
+        return json.dumps({'version': SLUG_INDEX_VERSION, 'slugs': dict(sorted(self.slugs.items()))},
+                          indent=2, ensure_ascii=False)
+
+
+def write_slug_index(projects, outputs=None):
+    """Write _dev/slug-index.json; returns True if the file changed"""
+    outputs = outputs or Outputs()
+    return outputs.write_text(SLUG_INDEX_JSON, SlugIndex.from_projects(projects).to_json())
+
+
+def migration_report(projects):
+    """Projects whose slug differs from slugify(name), and slugify() clashes"""
+    changes = [
+        {'name': p['name'], 'slug': p['slug'], 'slugify': slugify(p['name'])}
+        for p in projects if slugify(p['name']) != p['slug']
+    ]
+    by_slug = {}
+    for p in projects:
+        by_slug.setdefault(slugify(p['name']), []).append(p['name'])
+    clashes = {slug: names for slug, names in sorted(by_slug.items()) if len(names) > 1}
+    return {'checked': len(projects), 'changes': changes, 'clashes': clashes}
+
+
+def main():
+    from listing import load_projects
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(os.path.dirname(script_dir))
+
+    report = migration_report(load_projects())
+    if '--json' in sys.argv[1:]:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+
+    for change in report['changes']:
+        print(f"  {change['slug']}  ->  {change['slugify']}")
+    for slug, names in report['clashes'].items():
+        print(f"⚠️  {slug} would be shared by: {'; '.join(names)}")
+    print(f"✓ {report['checked']} slugs checked, {len(report['changes'])} would change, "
+          f"{len(report['clashes'])} clashes (existing slugs are kept)")
+
+
+if __name__ == '__main__':
+    main()
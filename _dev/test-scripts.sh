@@ -10,6 +10,10 @@ echo ""
 echo "Test 2: generate-notion-pages.py"  
 python3 _dev/generate-notion-pages.py --help 2>&1 | head -1 || echo "  (Needs notion-page/ to run, but path resolution works)"
 
+echo ""
+echo "Test 3: search finds every project by its full title"
+python3 _dev/test_search.py 2>&1 | tail -1
+
 echo ""
 echo "✓ All scripts are configured to work from _dev/ folder"
 echo "✓ They automatically change to project root directory"
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Check that searching a project's full title finds that project
+
+Builds the search index from the current listing and pages, then runs the
+gallery's own searchProjects() (script.js, in node) for every project name.
+Skipped when node isn't installed.
+
+Usage:
+    python3 _dev/test_search.py
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import unittest
+
+from listing import load_projects
+from search_index import build_search_index
+
+# Loads script.js with just enough of a browser around it, then answers one
+# query per line of stdin with the matching slugs
+HARNESS = r'''
+const fs = require('fs');
+const vm = require('vm');
+const [indexJson, queries] = JSON.parse(fs.readFileSync(0, 'utf8'));
+const noop = () => {};
+const context = vm.createContext({
+    console,
+    document: { addEventListener: noop },
+    window: { addEventListener: noop },
+    navigator: {},
+    fetch: () => Promise.resolve({ json: () => indexJson }),
+});
+vm.runInContext(fs.readFileSync('script.js', 'utf8'), context);
+context.queries = queries;
+vm.runInContext(`loadSearchIndex().then(() => {
+    const results = queries.map(query => [...(searchProjects(query) || [])]);
+    console.log(JSON.stringify(results));
+})`, context);
+'''
+
+
+@unittest.skipUnless(shutil.which('node'), 'node is not installed')
+class FullTitleSearchTest(unittest.TestCase):
+    def setUp(self):
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        os.chdir(os.path.dirname(script_dir))
+
+    def test_every_title_finds_its_project(self):
+        projects = load_projects()
+        index = build_search_index(projects)
+        queries = [project['name'] for project in projects]
+        result = subprocess.run(['node', '-e', HARNESS], input=json.dumps([index, queries]),
+                                capture_output=True, text=True, check=True)
+        matches = json.loads(result.stdout)
+
+        missed = [project['name'] for project, slugs in zip(projects, matches)
+                  if project['slug'] not in slugs]
+        self.assertEqual(missed, [], f"{len(missed)} of {len(projects)} titles don't find their project")
+
+
+if __name__ == '__main__':
+    unittest.main()
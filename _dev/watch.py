@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Rebuild project pages as their sources change (used by build.py --watch)
+
+Watched:
+- notion-page/.../Projects and Artworks: a change to a project's Notion page
+  or to a file in its folder re-runs that project's parse, image copy, render
+  and cover steps (generate-notion-pages.build_project_page)
+- projects/<slug>/images/ and image-order.json: the page is re-rendered from
+  its current content with the images in page order. A dropped-in image
+  without a number is adopted as the next NN_image, and the cover is
+  regenerated when the first image changed
+
+Changes are collected until the tree has been quiet for --debounce seconds
+(at most one second after the first change), so a burst such as a Notion
+re-export rebuilds each affected project once. On Linux the tree is watched
+with inotify; elsewhere it is polled.
+
+Files the rebuild itself writes (pages, covers, numbered image links) are
+ignored until a burst arrives without any of them, so a rebuild never
+triggers another one, even when its events straddle two debounce windows.
+"""
+
+import ctypes
+import ctypes.util
+import importlib
+import os
+import re
+import select
+import struct
+import time
+
+from covers import find_cover, write_cover
+from image_meta import ImageMetaCache
+from image_order import ORDER_JSON, image_order
+from listing import refresh_derived, write_listing
+from outputs import Outputs
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+NUMBERED_IMAGE_RE = re.compile(r'^\d+_')
+
+DEBOUNCE = 0.15      # seconds of quiet that end a burst
+MAX_DELAY = 1.0      # ... but never wait longer than this after the first change
+POLL_INTERVAL = 0.25
+
+# inotify(7)
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """Changed paths under some directory trees, from inotify"""
+
+    def __init__(self, roots):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError('inotify is not available')
+        self._libc = libc
+        self.fd = libc.inotify_init1(IN_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.dirs = {}  # watch descriptor -> directory
+        for root in roots:
+            self._add_tree(root)
+
+    def _add_tree(self, root):
+        added = []
+        for dirpath, _dirnames, filenames in os.walk(root):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(dirpath), WATCH_MASK)
+            if wd >= 0:
+                self.dirs[wd] = dirpath
+            added.extend(os.path.join(dirpath, name) for name in filenames)
+        return added
+
+    def changes(self, timeout=None):
+        """Paths changed since the last call (waits up to timeout seconds for one)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            readable, _, _ = select.select([self.fd], [], [], remaining)
+            if not readable:
+                return []
+            paths = self._read_events()
+            if paths:
+                return paths
+
+    def _read_events(self):
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        paths = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+            offset += length
+            if wd not in self.dirs or not name:
+                continue
+            path = os.path.join(self.dirs[wd], name)
+            if mask & IN_ISDIR:
+                # A folder moved or created in: watch it and report what's inside
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    paths.extend(self._add_tree(path))
+                continue
+            paths.append(path)
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Changed paths under some directory trees, by comparing snapshots"""
+
+    def __init__(self, roots, interval=POLL_INTERVAL):
+        self.roots = roots
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for root in self.roots:
+            for dirpath, _dirnames, filenames in os.walk(root):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        stat = os.lstat(path)
+                    except FileNotFoundError:
+                        continue
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def changes(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval if deadline is None
+                       else max(0, min(self.interval, deadline - time.monotonic())))
+            snapshot = self._scan()
+            changed = [path for path in snapshot.keys() | self.snapshot.keys()
+                       if snapshot.get(path) != self.snapshot.get(path)]
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+def make_watcher(roots, polling=False):
+    """inotify where available, else polling"""
+    if not polling:
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots)
+
+
+def bursts(watcher, debounce=DEBOUNCE, max_delay=MAX_DELAY):
+    """Yield sets of changed paths, one per burst of changes"""
+    while True:
+        batch = set(watcher.changes())
+        if not batch:
+            continue
+        first = time.monotonic()
+        while True:
+            remaining = max_delay - (time.monotonic() - first)
+            if remaining <= 0:
+                break
+            more = watcher.changes(timeout=min(debounce, remaining))
+            if not more:
+                break
+            batch.update(more)
+        yield batch
+
+
+def affected_projects(paths, projects, notion_dir):
+    """{slug: {'notion', 'images'}} for the projects whose sources changed"""
+    slugs = {project['slug'] for project in projects}
+    affected = {}
+    for path in paths:
+        parts = os.path.normpath(path).split(os.sep)
+
+        if parts[0] == 'projects' and len(parts) >= 3 and parts[1] in slugs:
+            if parts[2] == ORDER_JSON or (parts[2] == 'images' and len(parts) == 4
+                                          and is_source_image(parts[3])):
+                affected.setdefault(parts[1], set()).add('images')
+
+        elif notion_dir and path.startswith(notion_dir + os.sep):
+            entry = os.path.relpath(path, notion_dir).split(os.sep)[0]
+            for project in notion_projects(projects, entry):
+                affected.setdefault(project['slug'], set()).add('notion')
+    return affected
+
+
+def is_source_image(name):
+    """An image a person put in the folder (not a cover or a temp file)"""
+    stem, ext = os.path.splitext(name)
+    return (ext.lower() in IMAGE_EXTENSIONS and not name.startswith(('.', 'temp_'))
+            and stem != 'cover')
+
+
+def notion_projects(projects, entry):
+    """Projects a Notion export folder or page belongs to"""
+    notion_pages = importlib.import_module('generate-notion-pages')
+    return [project for project in projects
+            if project.get('hasDetailPage') and notion_pages.matches_notion_entry(project['name'], entry)]
+
+
+def adopt_new_images(images_dir, outputs):
+    """Give images dropped into the folder the next NN_image name; returns their new names"""
+    names = sorted(os.listdir(images_dir))
+    numbers = [int(NUMBERED_IMAGE_RE.match(n).group(0)[:-1]) for n in names if NUMBERED_IMAGE_RE.match(n)]
+    next_number = max(numbers, default=0) + 1
+    adopted = []
+    for name in names:
+        if NUMBERED_IMAGE_RE.match(name) or not is_source_image(name):
+            continue
+        new_name = f"{next_number:02d}_image{os.path.splitext(name)[1].lower()}"
+        outputs.store(os.path.join(images_dir, name), os.path.join(images_dir, new_name))
+        outputs.remove(os.path.join(images_dir, name))
+        adopted.append(new_name)
+        next_number += 1
+    return adopted
+
+
+def page_data(project, html_path):
+    """Form-style data for project_pages.generate_html, from the current page"""
+    from project_pages import parse_project_html
+
+    content = parse_project_html(html_path)
+    name = project['name']
+    suffix = f", {project['year']}"
+    return {
+        'name': name[:-len(suffix)] if name.endswith(suffix) else name,
+        'year': content.get('year', project['year']),
+        'collaborator': content.get('collaborator', project.get('collaborator', '')),
+        'official_site': content.get('official_site', project.get('link', '')),
+        'role': content.get('role', project.get('role', '')),
+        'description': content.get('description', ''),
+        'acknowledgment': content.get('acknowledgment', ''),
+    }
+
+
+def rerender_project(project, changed_paths, outputs):
+    """Re-render a page from its images folder; returns the listing entry's new cover path"""
+    from project_pages import generate_html
+
+    slug = project['slug']
+    project_dir = os.path.join('projects', slug)
+    images_dir = os.path.join(project_dir, 'images')
+    html_path = os.path.join(project_dir, 'index.html')
+    if not os.path.exists(html_path) or not os.path.isdir(images_dir):
+        return project['image']
+
+    adopt_new_images(images_dir, outputs)
+    images = image_order(project_dir)
+    meta_cache = ImageMetaCache.load()
+    meta = meta_cache.for_images(images_dir, images)
+    meta_cache.save(outputs)
+    outputs.write_text(html_path, generate_html(page_data(project, html_path), images, meta))
+    if not images:
+        return project['image']
+
+    first_image = os.path.join(images_dir, images[0])
+    cover = find_cover(images_dir)
+    if (cover is None or first_image in changed_paths
+            or os.path.join(project_dir, ORDER_JSON) in changed_paths):
+        cover = write_cover(first_image, images_dir, outputs)
+    return f'projects/{slug}/images/{cover}'
+
+
+def rebuild(affected, paths, ctx):
+    """Rebuild the affected projects, then the derived files; returns the paths written"""
+    # A fresh summary per rebuild; files planned in a dry run carry over
+    outputs = Outputs(dry_run=ctx.outputs.dry_run, diff=ctx.outputs.diff)
+    outputs.pending = ctx.outputs.pending
+    outputs.removed_paths = ctx.outputs.removed_paths
+    ctx.outputs = outputs
+    listing_changed = False
+
+    for slug, kinds in sorted(affected.items()):
+        project = next(p for p in ctx.projects if p['slug'] == slug)
+        started = time.perf_counter()
+        if 'notion' in kinds:
+            image = project['image']
+            importlib.import_module('generate-notion-pages').build_project_page(project, outputs)
+            listing_changed |= project['image'] != image
+        else:
+            cover = rerender_project(project, paths, outputs)
+            if cover != project['image']:
+                project['image'] = cover
+                listing_changed = True
+        print(f"✓ {slug} rebuilt ({time.perf_counter() - started:.2f}s)")
+
+    if listing_changed:
+        write_listing(ctx.projects, outputs)
+    # Page text feeds the search index
+    refresh_derived(ctx.projects, outputs)
+    outputs.print_summary()
+    return set(outputs.changed_paths())
+
+
+def watch(ctx, notion_dir, debounce=DEBOUNCE, polling=False):
+    """Rebuild affected projects until interrupted"""
+    roots = ['projects'] + ([notion_dir] if os.path.isdir(notion_dir) else [])
+    watcher = make_watcher(roots, polling)
+    kind = 'polling' if isinstance(watcher, PollingWatcher) else 'inotify'
+    print(f"👀 Watching {', '.join(roots)} ({kind}); Ctrl+C to stop")
+
+    written = set()
+    try:
+        for paths in bursts(watcher, debounce=debounce):
+            # Our own writes come back as events, possibly over several bursts;
+            # they are forgotten once a burst brings none of them
+            ours = paths & written
+            paths -= written
+            if not ours:
+                written = set()
+            affected = affected_projects(paths, ctx.projects,
+                                         notion_dir if os.path.isdir(notion_dir) else None)
+            if not affected:
+                continue
+            started = time.perf_counter()
+            try:
+                written |= rebuild(affected, paths, ctx)
+            except Exception as e:
+                print(f"✗ Rebuild failed: {e}")
+                continue
+            print(f"✓ {len(affected)} project(s) rebuilt in {time.perf_counter() - started:.2f}s")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
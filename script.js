@@ -5,17 +5,72 @@ let currentSort = 'year';
 const PROJECTS_PER_PAGE = 16;
 let currentPage = 1;
 
+// Windowed grid: only rows near the viewport are in the DOM
+const GRID_BUFFER_ROWS = 2;
+const GRID_POOL_SIZE = PROJECTS_PER_PAGE;
+const gridState = {
+    cards: new Map(),   // slug -> card element currently in the grid
+    pool: [],           // detached cards kept for reuse
+    rowHeights: [],     // measured row heights in px, by row
+    columns: 0,
+    topSpacer: null,
+    bottomSpacer: null,
+    noResults: null,
+    frame: 0
+};
+
+// Prefetch project pages (and their first images) ahead of a click
+const PREFETCH_CONCURRENCY = 2;
+const PREFETCH_BUDGET_BYTES = 2 * 1024 * 1024;
+const PREFETCH_IMAGES_PER_PAGE = 2;
+const prefetchState = {
+    queue: [],          // projects waiting, most urgent first
+    seen: new Set(),    // slugs already queued or fetched
+    active: 0,
+    bytes: 0,
+    observer: null,
+    timers: new WeakMap() // card -> pending prefetch timer
+};
+
+// Search (index built by _dev/search_index.py)
+let searchIndex = null;
+let searchIndexPromise = null;
+let searchQuery = '';
+let searchMatches = null; // Set of matching slugs, null when not searching
+
+// Facet filters and sort orders (index built by _dev/facet_index.py)
+let facetIndex = null;
+let activeFilters = {}; // facet name -> selected value
+
 document.addEventListener('DOMContentLoaded', function() {
     loadProjects();
     initializeUI();
 });
 
+// Offline cache of the listing, covers and pages (generated by _dev/service_worker.py)
+if ('serviceWorker' in navigator) {
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register('sw.js').catch(error => {
+            console.error('Service worker registration failed:', error);
+        });
+    });
+}
+
 // Load projects from JSON
 async function loadProjects() {
+    // Fetch the facet index alongside the listing; it is only used once both are in
+    const facetIndexPromise = fetch('facet-index.json')
+        .then(response => response.json())
+        .catch(error => {
+            console.error('Error loading facet index:', error);
+            return null;
+        });
+    
     try {
         const response = await fetch('projects-data.json');
         allProjects = await response.json();
         displayProjects();
+        initializeFilters(await facetIndexPromise);
     } catch (error) {
         console.error('Error loading projects:', error);
         // Fallback to manual data if JSON fails
@@ -43,8 +98,60 @@ function displayProjects() {
     const grid = document.getElementById('projects-grid');
     const loadMoreContainer = document.getElementById('load-more-container');
     
+    const sortedProjects = getVisibleProjects();
+    
+    // Get projects to display
+    const projectsToShow = sortedProjects.slice(0, currentPage * PROJECTS_PER_PAGE);
+    
+    // Reuse the cards pre-rendered into index.html on first display
+    if (!gridState.topSpacer) {
+        initializeGrid(grid, projectsToShow);
+    }
+    
+    // "Load more" keeps the shown list as a prefix: only the new cards are added
+    const previousCount = displayedProjects.length;
+    const isAppend = projectsToShow.length >= previousCount &&
+        displayedProjects.every((project, index) => project === projectsToShow[index]);
+    if (!isAppend) {
+        gridState.rowHeights = [];
+    }
+    displayedProjects = projectsToShow;
+    
+    renderGridWindow(isAppend ? previousCount : 0);
+    
+    // Empty result message
+    if (projectsToShow.length === 0 && allProjects.length > 0) {
+        gridState.noResults.textContent = searchQuery
+            ? `No projects match "${searchQuery}"`
+            : 'No projects match the selected filters';
+        grid.appendChild(gridState.noResults);
+    } else {
+        gridState.noResults.remove();
+    }
+    
+    // Show/hide load more button
+    if (projectsToShow.length < sortedProjects.length) {
+        loadMoreContainer.classList.remove('hidden');
+    } else {
+        loadMoreContainer.classList.add('hidden');
+    }
+}
+
+// Projects to show, in the current sort order, after search and filters
+function getVisibleProjects() {
+    const matchesSearch = project => !searchMatches || searchMatches.has(project.slug);
+    
+    // Precomputed orders and facet id lists: no sorting or full scan per filter
+    if (facetIndex) {
+        const mask = getFilterMask();
+        return facetIndex.order[currentSort]
+            .filter(id => !mask || mask[id])
+            .map(id => allProjects[id])
+            .filter(matchesSearch);
+    }
+    
     // Sort projects
-    let sortedProjects = [...allProjects];
+    const sortedProjects = [...allProjects];
     if (currentSort === 'year') {
         sortedProjects.sort((a, b) => {
             const yearA = parseInt(a.year) || 0;
@@ -55,47 +162,262 @@ function displayProjects() {
         sortedProjects.sort((a, b) => a.name.localeCompare(b.name));
     }
     
-    // Get projects to display
-    const projectsToShow = sortedProjects.slice(0, currentPage * PROJECTS_PER_PAGE);
-    displayedProjects = projectsToShow;
+    return sortedProjects.filter(matchesSearch);
+}
+
+// Byte mask of doc ids passing every active filter, null when nothing is selected
+function getFilterMask() {
+    let ids = null;
+    for (const [facet, value] of Object.entries(activeFilters)) {
+        const entry = facetIndex.facets[facet].find(e => e.value === value);
+        const facetIds = entry ? entry.ids : [];
+        ids = ids ? intersectSortedIds(ids, facetIds) : facetIds;
+    }
     
-    // Clear grid
-    grid.innerHTML = '';
+    if (!ids) {
+        return null;
+    }
     
-    // Create project cards
-    projectsToShow.forEach((project, index) => {
-        const card = createProjectCard(project, index);
-        grid.appendChild(card);
+    const mask = new Uint8Array(facetIndex.docs.length);
+    ids.forEach(id => { mask[id] = 1; });
+    return mask;
+}
+
+// Linear merge of two ascending id lists
+function intersectSortedIds(a, b) {
+    const result = [];
+    let i = 0;
+    let j = 0;
+    while (i < a.length && j < b.length) {
+        if (a[i] === b[j]) {
+            result.push(a[i]);
+            i++;
+            j++;
+        } else if (a[i] < b[j]) {
+            i++;
+        } else {
+            j++;
+        }
+    }
+    return result;
+}
+
+// Fill the filter dropdowns once the facet index is known to match the listing
+function initializeFilters(index) {
+    const sameListing = index && index.docs.length === allProjects.length &&
+        index.docs.every((slug, id) => slug === allProjects[id].slug);
+    if (!sameListing) {
+        // Stale or missing index: keep sorting in the browser, without filters
+        return;
+    }
+    
+    facetIndex = index;
+    
+    document.querySelectorAll('.filter-select').forEach(select => {
+        const facet = select.dataset.facet;
+        facetIndex.facets[facet].forEach(entry => {
+            const option = document.createElement('option');
+            option.value = entry.value;
+            option.textContent = `${entry.value} (${entry.count})`;
+            select.appendChild(option);
+        });
+        
+        select.addEventListener('change', function() {
+            if (this.value) {
+                activeFilters[facet] = this.value;
+            } else {
+                delete activeFilters[facet];
+            }
+            this.classList.toggle('active', Boolean(this.value));
+            currentPage = 1;
+            displayProjects();
+        });
     });
     
-    // Show/hide load more button
-    if (projectsToShow.length < sortedProjects.length) {
-        loadMoreContainer.classList.remove('hidden');
-    } else {
-        loadMoreContainer.classList.add('hidden');
+    document.getElementById('filter-controls').classList.remove('hidden');
+}
+
+// Set up the grid spacers and adopt the cards pre-rendered by _dev/gallery_prerender.py
+function initializeGrid(grid, projectsToShow) {
+    const prerendered = [...grid.querySelectorAll('.project-card[data-slug]')];
+    const matches = prerendered.length > 0 && prerendered.length <= projectsToShow.length &&
+        prerendered.every((card, index) => card.dataset.slug === projectsToShow[index].slug);
+    
+    // Drop markers and whitespace so only cards and spacers remain in the grid
+    [...grid.childNodes].forEach(node => {
+        if (node.nodeType !== Node.ELEMENT_NODE || (!matches && node.dataset.slug)) {
+            node.remove();
+        }
+    });
+    
+    if (matches) {
+        prerendered.forEach((card, index) => {
+            bindProjectCard(card, projectsToShow[index]);
+            delete card.dataset.slug;
+            gridState.cards.set(projectsToShow[index].slug, card);
+        });
+    }
+    
+    gridState.topSpacer = createGridSpacer();
+    gridState.bottomSpacer = createGridSpacer();
+    gridState.noResults = document.createElement('p');
+    gridState.noResults.className = 'no-results';
+    grid.prepend(gridState.topSpacer);
+    grid.appendChild(gridState.bottomSpacer);
+    
+    // Re-window on scroll and resize, at most once per frame
+    const scheduleRender = () => {
+        if (!gridState.frame) {
+            gridState.frame = requestAnimationFrame(() => {
+                gridState.frame = 0;
+                renderGridWindow(Infinity);
+            });
+        }
+    };
+    window.addEventListener('scroll', scheduleRender, { passive: true });
+    window.addEventListener('resize', scheduleRender);
+}
+
+function createGridSpacer() {
+    const spacer = document.createElement('div');
+    spacer.className = 'grid-spacer';
+    spacer.setAttribute('aria-hidden', 'true');
+    spacer.style.display = 'none';
+    return spacer;
+}
+
+// Render only the rows of displayedProjects near the viewport
+// Cards at index >= animateFrom are new to the list and get the staggered fade-in
+function renderGridWindow(animateFrom) {
+    const grid = document.getElementById('projects-grid');
+    const projects = displayedProjects;
+    const gridStyle = getComputedStyle(grid);
+    
+    const columns = Math.max(1, gridStyle.gridTemplateColumns.split(' ').length);
+    if (columns !== gridState.columns) {
+        gridState.columns = columns;
+        gridState.rowHeights = [];
+    }
+    
+    // Unmeasured rows are estimated from the measured ones (or the 3:2 cover + caption)
+    const gap = parseFloat(gridStyle.rowGap) || 0;
+    const measured = gridState.rowHeights.filter(Boolean);
+    const estimate = measured.length > 0
+        ? measured.reduce((sum, h) => sum + h, 0) / measured.length
+        : (grid.clientWidth / columns) * (2 / 3) + 64;
+    const rowHeight = row => gridState.rowHeights[row] || estimate;
+    
+    // Find the rows intersecting the viewport, plus a buffer on each side
+    const rowCount = Math.ceil(projects.length / columns);
+    const viewTop = -grid.getBoundingClientRect().top;
+    const viewBottom = viewTop + window.innerHeight;
+    let firstRow = rowCount;
+    let lastRow = -1;
+    for (let row = 0, y = 0; row < rowCount; row++) {
+        const bottom = y + rowHeight(row);
+        if (bottom >= viewTop && y <= viewBottom) {
+            firstRow = Math.min(firstRow, row);
+            lastRow = row;
+        }
+        y = bottom + gap;
+    }
+    if (lastRow < 0) {
+        // Grid is entirely above or below the viewport: keep the rows nearest to it
+        firstRow = viewTop < 0 ? 0 : Math.max(0, rowCount - 1);
+        lastRow = firstRow;
+    }
+    firstRow = Math.max(0, firstRow - GRID_BUFFER_ROWS);
+    lastRow = Math.min(rowCount - 1, lastRow + GRID_BUFFER_ROWS);
+    
+    const start = firstRow * columns;
+    const end = Math.min(projects.length, (lastRow + 1) * columns);
+    
+    // Detach cards that left the window and keep a few for reuse
+    const wanted = new Set(projects.slice(start, end).map(project => project.slug));
+    gridState.cards.forEach((card, slug) => {
+        if (!wanted.has(slug)) {
+            card.remove();
+            gridState.cards.delete(slug);
+            // Let the observer drop it too (pooled cards are observed again on reuse)
+            unobserveForPrefetch(card);
+            if (gridState.pool.length < GRID_POOL_SIZE) {
+                gridState.pool.push(card);
+            }
+        }
+    });
+    
+    // Insert missing cards in order, leaving cards already in place untouched
+    let ref = gridState.topSpacer.nextElementSibling;
+    for (let index = start; index < end; index++) {
+        const project = projects[index];
+        let card = gridState.cards.get(project.slug);
+        if (!card) {
+            card = acquireProjectCard(project, index);
+            card.style.animationDelay = index >= animateFrom
+                ? `${(index % PROJECTS_PER_PAGE) * 0.05}s`
+                : '0s';
+            gridState.cards.set(project.slug, card);
+        }
+        if (card === ref) {
+            ref = ref.nextElementSibling;
+        } else {
+            grid.insertBefore(card, ref);
+        }
+    }
+    
+    // Spacers stand in for the rows that are not rendered
+    const spacerHeight = (fromRow, toRow) => {
+        let height = 0;
+        for (let row = fromRow; row < toRow; row++) {
+            height += rowHeight(row) + (row > fromRow ? gap : 0);
+        }
+        return height;
+    };
+    setSpacerHeight(gridState.topSpacer, spacerHeight(0, firstRow));
+    setSpacerHeight(gridState.bottomSpacer, spacerHeight(lastRow + 1, rowCount));
+    
+    // Measure the rendered rows so later estimates are exact
+    for (let index = start; index < end; index++) {
+        const row = Math.floor(index / columns);
+        const height = gridState.cards.get(projects[index].slug).offsetHeight;
+        if (index % columns === 0 || height > gridState.rowHeights[row]) {
+            gridState.rowHeights[row] = height;
+        }
     }
 }
 
+function setSpacerHeight(spacer, height) {
+    // A zero-height grid item would still add a row gap, so hide it instead
+    spacer.style.display = height > 0 ? '' : 'none';
+    spacer.style.height = `${height}px`;
+}
+
+// Reuse a detached card if one is available, otherwise build a new one
+function acquireProjectCard(project, index) {
+    const card = gridState.pool.pop();
+    if (!card) {
+        return createProjectCard(project, index);
+    }
+    
+    card.project = project;
+    const imageDiv = card.querySelector('.project-image');
+    const img = imageDiv.querySelector('img');
+    img.style.display = '';
+    imageDiv.style.background = '';
+    img.src = project.image;
+    img.alt = project.name;
+    card.querySelector('.project-title').textContent = project.name;
+    card.querySelector('.project-collaborator').textContent = project.collaborator;
+    observeForPrefetch(card);
+    return card;
+}
+
 // Create a project card element
 function createProjectCard(project, index) {
     const card = document.createElement('div');
     card.className = 'project-card';
     card.style.animationDelay = `${(index % PROJECTS_PER_PAGE) * 0.05}s`;
-    
-    // Make card clickable - prioritize detail pages over external links
     card.style.cursor = 'pointer';
-    card.addEventListener('click', () => {
-        if (project.isCV) {
-            // CV links directly to cv.html
-            window.location.href = 'cv.html';
-        } else if (project.hasDetailPage) {
-            // Go to project folder (contains index.html)
-            window.location.href = `projects/${project.slug}/`;
-        } else if (project.link) {
-            // Fallback to external link if no detail page
-            window.open(project.link, '_blank');
-        }
-    });
     
     // Create image container
     const imageDiv = document.createElement('div');
@@ -106,12 +428,6 @@ function createProjectCard(project, index) {
     img.alt = project.name;
     img.loading = 'lazy';
     
-    // Handle image load errors
-    img.onerror = function() {
-        this.style.display = 'none';
-        imageDiv.style.background = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)';
-    };
-    
     imageDiv.appendChild(img);
     
     // Create info container
@@ -132,13 +448,276 @@ function createProjectCard(project, index) {
     card.appendChild(imageDiv);
     card.appendChild(infoDiv);
     
+    bindProjectCard(card, project);
+    
     return card;
 }
 
+// Attach click and image-error handling to a card (created or pre-rendered)
+// Handlers read card.project so recycled cards follow the project they now show
+function bindProjectCard(card, project) {
+    card.project = project;
+    
+    // Warm up the detail page when the pointer or focus lands on the card
+    const prefetchNow = () => prefetchProject(card.project, true);
+    card.addEventListener('mouseenter', prefetchNow);
+    card.addEventListener('focusin', prefetchNow);
+    card.addEventListener('touchstart', prefetchNow, { passive: true });
+    observeForPrefetch(card);
+    
+    // Make card clickable - prioritize detail pages over external links
+    card.addEventListener('click', () => {
+        const current = card.project;
+        if (current.isCV) {
+            // CV links directly to cv.html
+            window.location.href = 'cv.html';
+        } else if (current.hasDetailPage) {
+            // Go to project folder (contains index.html)
+            window.location.href = `projects/${current.slug}/`;
+        } else if (current.link) {
+            // Fallback to external link if no detail page
+            window.open(current.link, '_blank');
+        }
+    });
+    
+    const imageDiv = card.querySelector('.project-image');
+    const img = imageDiv.querySelector('img');
+    const showImageFallback = () => {
+        img.style.display = 'none';
+        imageDiv.style.background = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)';
+    };
+    
+    // Handle image load errors
+    img.onerror = showImageFallback;
+    
+    // Pre-rendered images may have failed before this script ran
+    if (img.complete && img.naturalWidth === 0 && img.getAttribute('src')) {
+        showImageFallback();
+    }
+}
+
+// Prefetch cards' pages once they have been on screen for a moment
+function observeForPrefetch(card) {
+    if (!('IntersectionObserver' in window)) {
+        return;
+    }
+    
+    if (!prefetchState.observer) {
+        const timers = prefetchState.timers;
+        prefetchState.observer = new IntersectionObserver(entries => {
+            entries.forEach(entry => {
+                const target = entry.target;
+                clearTimeout(timers.get(target));
+                if (entry.isIntersecting) {
+                    // Skip cards that only flash past while scrolling
+                    timers.set(target, setTimeout(() => prefetchProject(target.project, false), 300));
+                }
+            });
+        }, { rootMargin: '100px' });
+    }
+    
+    prefetchState.observer.observe(card);
+}
+
+// Stop watching a card that left the grid, and drop its pending prefetch
+function unobserveForPrefetch(card) {
+    if (!prefetchState.observer) {
+        return;
+    }
+    prefetchState.observer.unobserve(card);
+    clearTimeout(prefetchState.timers.get(card));
+    prefetchState.timers.delete(card);
+}
+
+// Respect data-saver and slow connections
+function prefetchAllowed() {
+    const connection = navigator.connection;
+    if (connection && (connection.saveData || /(^|-)2g$/.test(connection.effectiveType || ''))) {
+        return false;
+    }
+    return prefetchState.bytes < PREFETCH_BUDGET_BYTES;
+}
+
+// Queue a project's detail page; urgent (hover/focus) requests jump the queue
+function prefetchProject(project, urgent) {
+    if (!project || !project.hasDetailPage || project.isCV || !prefetchAllowed()) {
+        return;
+    }
+    
+    const queued = prefetchState.queue.indexOf(project);
+    if (urgent && queued > 0) {
+        prefetchState.queue.splice(queued, 1);
+        prefetchState.queue.unshift(project);
+    } else if (!prefetchState.seen.has(project.slug)) {
+        prefetchState.seen.add(project.slug);
+        if (urgent) {
+            prefetchState.queue.unshift(project);
+        } else {
+            prefetchState.queue.push(project);
+        }
+    }
+    
+    pumpPrefetchQueue();
+}
+
+function pumpPrefetchQueue() {
+    while (prefetchState.active < PREFETCH_CONCURRENCY && prefetchState.queue.length > 0 && prefetchAllowed()) {
+        const project = prefetchState.queue.shift();
+        prefetchState.active++;
+        prefetchProjectPage(project)
+            .catch(() => {})
+            .finally(() => {
+                prefetchState.active--;
+                pumpPrefetchQueue();
+            });
+    }
+}
+
+// Fetch a resource at low priority and count it against the budget
+// Returns null, cancelling the download, once it would go over the budget
+async function prefetchResource(url) {
+    const controller = new AbortController();
+    const response = await fetch(url, { priority: 'low', signal: controller.signal });
+    
+    // Known to be too big: don't start on the body
+    const length = Number(response.headers.get('Content-Length'));
+    if (length > PREFETCH_BUDGET_BYTES - prefetchState.bytes || !response.body) {
+        controller.abort();
+        return null;
+    }
+    
+    // No (or a compressed) length: count the bytes as they arrive
+    const reader = response.body.getReader();
+    const chunks = [];
+    for (;;) {
+        const { done, value } = await reader.read();
+        if (done) {
+            break;
+        }
+        prefetchState.bytes += value.byteLength;
+        if (prefetchState.bytes > PREFETCH_BUDGET_BYTES) {
+            controller.abort();
+            return null;
+        }
+        chunks.push(value);
+    }
+    return { response, body: new Blob(chunks) };
+}
+
+// Fetch the page (sw.js keeps project pages in its pages cache, the HTTP
+// cache has it otherwise), then its first images
+async function prefetchProjectPage(project) {
+    const pageUrl = new URL(`projects/${project.slug}/`, document.baseURI);
+    const result = await prefetchResource(pageUrl);
+    if (!result || !result.response.ok) {
+        return;
+    }
+    
+    const page = new DOMParser().parseFromString(await result.body.text(), 'text/html');
+    const images = [...page.querySelectorAll('.page-body img')]
+        .slice(0, PREFETCH_IMAGES_PER_PAGE)
+        .map(img => new URL(img.getAttribute('src'), pageUrl).href);
+    
+    for (const imageUrl of images) {
+        if (!prefetchAllowed()) {
+            break;
+        }
+        await prefetchResource(imageUrl);
+    }
+}
+
+// Load the search index on first use
+function loadSearchIndex() {
+    if (!searchIndexPromise) {
+        searchIndexPromise = fetch('search-index.json')
+            .then(response => response.json())
+            .then(index => {
+                searchIndex = { ...index, stopwords: new Set(index.stopwords || []) };
+                return searchIndex;
+            })
+            .catch(error => {
+                console.error('Error loading search index:', error);
+                return null;
+            });
+    }
+    return searchIndexPromise;
+}
+
+// Lowercase and strip accents (mirrors tokenize() in _dev/search_index.py)
+function normalizeSearchText(text) {
+    return text.toLowerCase().normalize('NFKD').replace(/\p{M}/gu, '');
+}
+
+// First position in the sorted term list that is >= prefix
+function lowerBound(terms, prefix) {
+    let lo = 0;
+    let hi = terms.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (terms[mid] < prefix) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+    return lo;
+}
+
+// Slugs of projects matching every word of the query (each word as a prefix).
+// Words the index leaves out (stopwords, single characters) are skipped too,
+// the same filter as tokenize() in _dev/search_index.py
+function searchProjects(query) {
+    const words = (normalizeSearchText(query).match(/[\p{L}\p{N}]+/gu) || [])
+        .filter(word => word.length > 1 && !searchIndex.stopwords.has(word));
+    if (words.length === 0) {
+        return null;
+    }
+    
+    let matches = null;
+    for (const word of words) {
+        const docs = new Set();
+        for (let i = lowerBound(searchIndex.terms, word); i < searchIndex.terms.length && searchIndex.terms[i].startsWith(word); i++) {
+            searchIndex.postings[i].forEach(id => docs.add(id));
+        }
+        matches = matches ? new Set([...matches].filter(id => docs.has(id))) : docs;
+        if (matches.size === 0) {
+            break;
+        }
+    }
+    
+    return new Set([...matches].map(id => searchIndex.docs[id]));
+}
+
+// Re-run the current query and redisplay
+async function updateSearch(query) {
+    searchQuery = query.trim();
+    
+    if (searchQuery && !searchIndex) {
+        await loadSearchIndex();
+        // Another keystroke may have arrived while the index was loading
+        if (searchQuery !== query.trim()) {
+            return;
+        }
+    }
+    
+    searchMatches = searchQuery && searchIndex ? searchProjects(searchQuery) : null;
+    currentPage = 1;
+    displayProjects();
+}
+
 // Initialize UI controls
 function initializeUI() {
     const viewButtons = document.querySelectorAll('.view-btn');
     const loadMoreBtn = document.getElementById('load-more-btn');
+    const searchInput = document.getElementById('project-search');
+    
+    // Handle search input (index is fetched on first focus, not on page load)
+    if (searchInput) {
+        searchInput.addEventListener('focus', loadSearchIndex, { once: true });
+        searchInput.addEventListener('input', function() {
+            updateSearch(this.value);
+        });
+    }
     
     // Handle view button clicks
     viewButtons.forEach(button => {
@@ -161,7 +740,8 @@ function initializeUI() {
             
             // Smooth scroll to new content
             setTimeout(() => {
-                const lastVisibleCard = document.querySelectorAll('.project-card')[(currentPage - 1) * PROJECTS_PER_PAGE];
+                const firstNewProject = displayedProjects[(currentPage - 1) * PROJECTS_PER_PAGE];
+                const lastVisibleCard = firstNewProject && gridState.cards.get(firstNewProject.slug);
                 if (lastVisibleCard) {
                     lastVisibleCard.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
                 }
@@ -185,6 +765,17 @@ function initializeUI() {
     
     // Keyboard shortcuts
     document.addEventListener('keydown', function(e) {
+        // Don't steal keys while typing in the search box
+        if (e.target.matches('input, textarea')) {
+            return;
+        }
+        
+        // Press '/' to search
+        if (e.key === '/' && searchInput) {
+            e.preventDefault();
+            searchInput.focus();
+        }
+        
         // Press '1' for Year view
         if (e.key === '1' && !e.metaKey && !e.ctrlKey) {
             const yearBtn = document.querySelector('[data-view="year"]');
@@ -0,0 +1,109 @@
+// Generated by _dev/service_worker.py - do not edit by hand
+const CORE = [["projects-data.json","c3b1f1fb05c9"],["search-index.json","3ca729343cde"],["facet-index.json","91a9451ad437"],["styles.css","01bb6326b588"],["script.js","d4939d372ec5"]];
+const COVERS = [["projects/pulse-canopy-2025/images/cover.jpg","a21d0a66f9c0"],["projects/broken-mirror-poets-2025/images/cover.jpg","4b256c90e12e"],["projects/pulsos-del-agua-2025/images/cover.jpg","324ac46c2cc7"],["projects/dark-ride-2024/images/cover.png","2ec4233bfc5e"],["projects/kristallstimmen-2024/images/cover.png","d4862081f793"],["projects/pulse-voronoi-2024/images/cover.jpg","5169d329c2a8"],["projects/climate-parliament-2024/images/cover.png","e807a496f441"],["projects/pulse-agglomerate-2024/images/cover.png","f1fd294a9dfc"],["projects/transparency-display-2024/images/cover.png","98f0d04dedc4"],["projects/pulse-island-2023/images/cover.jpg","82afdf7d0915"],["projects/translation-lake-2023/images/cover.jpg","617bb38def38"],["projects/voice-basin-2023/images/cover.jpg","2114e80ee8c8"],["projects/collider-2023/images/cover.png","d22984f706ee"],["projects/all-the-waters-2022/images/cover.jpg","9d14fe6fed72"],["projects/embodied-light-beacons-2022/images/cover.jpg","49076ba44772"],["projects/pulse-forest-2022/images/cover.jpg","df4cdde930a0"],["projects/voice-forest-2022/images/cover.jpg","560e9b604a27"],["projects/botella-de-castigos-2022/images/cover.jpg","606c42fb22ea"],["projects/password-breach-2021/images/cover.jpeg","15987113f0d1"],["projects/33-questions-per-minute-online-2021/images/cover.gif","e0553905c25c"],["projects/makeout-online-2021/images/cover.png","f82afdc28e77"],["projects/pulse-topology-2021/images/cover.jpg","8cbc3fe89402"],["projects/field-atmosphonia-2020/images/cover.gif","384f4cb202bc"],["projects/the-crack-in-the-hourglass-2020/images/cover.jpg","56b00aceeb98"],["projects/flag-beacon-2019/images/cover.gif","fc88135f98db"],["projects/voice-bridge-2019/images/cover.jpg","f169cd0ea4c7"],["projects/voice-tank-2019/images/cover.jpg","6566ed124a8e"],["projects/weather-vanes-2019/images/cover.png","5dda33f1a30e"],["projects/remote-pulse-2019/images/cover.png","3a63c2290687"],["projects/border-tuner-2019/images/cover.jpg","cd8275aa6ebc"],["projects/linear-atmosphonia-2019/images/cover.jpg","6287f0284fdb"],["projects/sustained-coincidence-2007-and-2019/images/cover.jpg","569567c7e577"],["projects/sphere-packing-bach-2018/images/cover.jpg","ee502d639295"],["projects/metronomes-2018/images/cover.jpg","4206be6113d7"],["projects/sandbox-2010--2018--2023/images/cover.jpg","67235e6e3bb8"],["projects/voice-theatre-2018/images/cover.jpg","123e2f4890c1"],["projects/pareidolium-2018/images/cover.jpg","0b7f3ccff8e4"],["projects/colorimètre-2017/images/cover.jpg","7ec6c84cac9e"],["projects/saturation-sampler-2017/images/cover.jpg","d5effd996a28"],["projects/recorded-assembly-2017-2019-2023/images/cover.jpg","40a3e039083b"],["projects/wavefunction-2007-and-2017/images/cover.png","77c1356d4203"],["projects/bilateral-time-slice-2016/images/cover.jpg","e160266abce3"],["projects/call-on-water-2016/images/cover.jpg","b66d503d71c6"],["projects/redundant-assembly-2015/images/cover.jpg","f1f7b20fed59"],["projects/zoom-pavilion-2015/images/cover.jpg","3d31c189ed4e"],["projects/level-of-confidence-2015/images/cover.jpg","8c691d7554fe"],["projects/pan-anthem-2014/images/cover.jpg","f95dc6028980"],["projects/nineteen-eighty-four-2014/images/cover.jpg","6ddb43bc4f59"],["projects/coding-for-kids-2014/images/cover.png","5be2d8d0b5f5"],["projects/family-coding-and-electronics-workshop-2014/images/cover.jpg","61e9d387b5c0"],["projects/fiducial-voice-beacons-2014/images/cover.jpg","e3763782f5d0"],["projects/vicious-circular-breathing-2013/images/cover.jpg","e6926513c9b8"],["projects/voice-tunnel-2013/images/cover.jpg","e05d5ddeb2db"],["projects/sphere-packing-2013/images/cover.jpg","b676e9dc9f19"],["projects/first-surface-2012/images/cover.jpg","4e8d69306f67"],["projects/semioptics-for-spinoza-2012/images/cover.jpg","dd43f73c1191"],["projects/source-2012/images/cover.jpg","8dada643bf3b"],["projects/bifurcation-2012/images/cover.jpg","d91572592855"],["projects/voice-array-2011/images/cover.jpg","54efb7bdcba6"],["projects/x-is-not-the-new-y-2011/images/cover.png","cb999d67d8b9"],["projects/bambarajos-2011/images/cover.jpg","11ab05b2fcbb"],["projects/tape-recorders-2011/images/cover.jpg","a141090e260b"],["projects/blätter-2011/images/cover.jpg","8e50289a075e"],["projects/please-empty-your-pockets-2010/images/cover.jpg","3e947eef867a"],["projects/cardinal-directions-2010/images/cover.jpg","f740954c26d8"],["projects/parking-lot-barrier-2010/images/cover.jpg","aa31eb199d3e"],["projects/bta--vcio-2010/images/cover.jpg","a75a089cbbad"],["projects/seismoscopes-2009/images/cover.jpg","106a12be3b27"],["projects/the-company-of-colours-2009/images/cover.jpg","637131b68038"],["projects/less-than-three-el-version-2008/images/cover.jpg","d05b7e16f134"],["projects/pulse-tank-2008/images/cover.jpg","403a349d0d8d"],["projects/espejo-2008/images/cover.jpg","eb80930f14fa"],["projects/reporters-with-borders-2007/images/cover.png","b230a23f0d1b"],["projects/imaa-history-publication-2007/images/cover.jpg","b35492e8db5a"],["projects/tin-drum-2007/images/cover.jpg","c8fd88801850"],["projects/rue-berri-a-travelrama-2007/images/cover.jpg","6acd27aefa1e"],["projects/drumline-2007/images/cover.jpg","b167f223c454"],["projects/stellar-dynamic-2007/images/cover.jpg","fb9b0f93ff6d"],["projects/kerzen-2006/images/cover.jpg","0050bffbfb4b"],["projects/overhead-overheard-2006/images/cover.jpg","a76fcf039a39"],["projects/exercise-machine-2006/images/cover.jpg","fae1e49b4d46"],["projects/equally-distant-from-both-sides-2006/images/cover.jpg","aeede59abe51"],["projects/sight-seeing-2005/images/cover.jpg","5a7b7eb42376"],["projects/ontario-street-a-travelrama-2004/images/cover.jpg","7a91114b5f12"],["projects/feuerland-2004/images/cover.jpg","de49f030a030"],["projects/zerrfalten--desplegamientos-2003/images/cover.jpg","528a5cf23558"],["projects/walk-the-line-2002/images/cover.gif","9c50e2b5d462"],["projects/prager-zoo-zoo-of-prague-2002/images/cover.jpg","fe389ade76af"],["projects/kreislaufen-circle-walking-2002/images/cover.jpg","61b699493130"],["projects/prinzelberg-the-prince-of-berlin-2001/images/cover.jpg","ae21b2e284db"],["projects/trilogy-of-a-couple-2001/images/cover.png","74b785e23463"],["projects/zeitraumlupe-2001/images/cover.jpg","c355bfe8314d"],["projects/grußt-unsre-berge-2000/images/cover.jpg","c09313f36f41"]];
+
+const PRECACHE = 'precache-v1';
+const PAGES = 'pages-v1';
+const MAX_PAGES = 40;
+
+const scope = new URL(self.registration.scope);
+const revisions = new Map([...CORE, ...COVERS].map(([path, rev]) => [new URL(path, scope).href, rev]));
+
+// One cache entry per content hash: unchanged files survive a deploy
+const revisionKey = (url, rev) => `${url}?__rev=${rev}`;
+
+// Project pages, also when fetched by the gallery's prefetch (not a navigation)
+const isProjectPage = url => url.pathname.startsWith(scope.pathname)
+    && /^projects\/[^/]+\/(index\.html)?$/.test(url.pathname.slice(scope.pathname.length));
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(PRECACHE);
+        await Promise.all(CORE.map(async ([path, rev]) => {
+            const url = new URL(path, scope).href;
+            const key = revisionKey(url, rev);
+            if (!(await cache.match(key))) {
+                const response = await fetch(url, { cache: 'no-cache' });
+                if (response.ok) {
+                    await cache.put(key, response);
+                }
+            }
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        // Drop revisions that are no longer in the manifest
+        const cache = await caches.open(PRECACHE);
+        const current = new Set([...revisions].map(([url, rev]) => revisionKey(url, rev)));
+        const keys = await cache.keys();
+        await Promise.all(keys.filter(request => !current.has(request.url)).map(request => cache.delete(request)));
+        // And caches of older workers
+        const names = await caches.keys();
+        await Promise.all(names.filter(name => name !== PRECACHE && name !== PAGES).map(name => caches.delete(name)));
+        await trimPages(await caches.open(PAGES));
+        await self.clients.claim();
+    })());
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') {
+        return;
+    }
+
+    const url = new URL(request.url);
+    url.hash = '';
+    if (url.origin !== scope.origin) {
+        return;
+    }
+
+    const rev = url.search ? undefined : revisions.get(url.href);
+    if (rev) {
+        event.respondWith(cacheFirst(url.href, rev));
+    } else if (request.mode === 'navigate' || request.destination === 'document' || isProjectPage(url)) {
+        event.respondWith(staleWhileRevalidate(event, request));
+    }
+});
+
+async function cacheFirst(url, rev) {
+    const cache = await caches.open(PRECACHE);
+    const key = revisionKey(url, rev);
+    const cached = await cache.match(key);
+    if (cached) {
+        return cached;
+    }
+    // Past the HTTP cache, which may still hold the previous revision
+    const response = await fetch(url, { cache: 'no-cache' });
+    if (response.ok) {
+        await cache.put(key, response.clone());
+    }
+    return response;
+}
+
+async function staleWhileRevalidate(event, request) {
+    const cache = await caches.open(PAGES);
+    const cached = await cache.match(request, { ignoreSearch: true });
+    const network = fetch(request, { cache: 'no-cache' }).then(async response => {
+        if (response.ok) {
+            await cache.put(request, response.clone());
+            await trimPages(cache);
+        }
+        return response;
+    });
+
+    if (cached) {
+        // Refresh in the background; the next visit gets the new page
+        event.waitUntil(network.catch(() => undefined));
+        return cached;
+    }
+    return network;
+}
+
+// Keep the most recently stored pages (keys() lists them oldest first)
+async function trimPages(cache) {
+    const keys = await cache.keys();
+    await Promise.all(keys.slice(0, Math.max(0, keys.length - MAX_PAGES)).map(request => cache.delete(request)));
+}